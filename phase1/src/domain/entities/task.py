@@ -5,7 +5,17 @@ from domain.exceptions import TaskValidationError
 
 
 class Task:
-    """Task entity representing a todo item."""
+    """Task entity representing a todo item.
+
+    Uses __slots__: no per-instance __dict__, so large task lists take
+    less memory. Construct tasks from user input with Task(...), which
+    validates; rebuild stored tasks with Task.from_storage(...), which
+    does not.
+    """
+
+    __slots__ = (
+        "_id", "_title", "_description", "_status", "_created_at"
+    )
 
     def __init__(
         self,
@@ -39,6 +49,38 @@ class Task:
         self._validate_description(description)
         self._description = description
 
+    @classmethod
+    def from_storage(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        created_at: datetime
+    ) -> "Task":
+        """Rebuild a task from values that were validated when stored.
+
+        Skips validation and defaults; every value is taken as given.
+        Only for repository reads, never for user input.
+
+        Args:
+            id: Unique task identifier
+            title: Stored title
+            description: Stored description ("" if none)
+            status: Stored status
+            created_at: Stored creation timestamp
+
+        Returns:
+            Task with the given values
+        """
+        task = object.__new__(cls)
+        task._id = id
+        task._title = title
+        task._description = description
+        task._status = status
+        task._created_at = created_at
+        return task
+
     @property
     def id(self) -> int:
         """Get task ID (immutable)."""
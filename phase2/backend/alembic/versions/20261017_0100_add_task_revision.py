@@ -0,0 +1,39 @@
+"""add_task_revision
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 01:00:00
+
+Adds tasks.revision, a per-row counter incremented in SQL by every
+update. The task list version (ETag, list cache, chat response cache)
+is built from count, max(id) and sum(revision) instead of
+max(updated_at), which depended on each worker's clock. PostgreSQL
+ids come from a sequence and are never reused, so max(id) rises on
+every insert.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Add the revision column.
+
+    Existing rows start at revision 1 (server default).
+    """
+    op.add_column(
+        'tasks',
+        sa.Column('revision', sa.Integer(), nullable=False, server_default='1'),
+    )
+
+
+def downgrade() -> None:
+    """Drop the revision column."""
+    op.drop_column('tasks', 'revision')
@@ -1,4 +1,16 @@
 """Interfaces package."""
+from .task_filter import TaskFilter
+from .task_page import TaskPage
+from .task_row import TaskRow
+from .task_cache import TaskCache
 from .task_repository import TaskRepository
+from .async_task_repository import AsyncTaskRepository
 
-__all__ = ["TaskRepository"]
+__all__ = [
+    "TaskFilter",
+    "TaskPage",
+    "TaskRow",
+    "TaskCache",
+    "TaskRepository",
+    "AsyncTaskRepository",
+]
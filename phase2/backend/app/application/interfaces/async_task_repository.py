@@ -0,0 +1,240 @@
+"""Async task repository interface."""
+from abc import ABC, abstractmethod
+from typing import Optional, List
+from app.domain.entities.task import Task
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import TaskPage
+from app.application.interfaces.task_row import TaskRow
+
+
+class AsyncTaskRepository(ABC):
+    """Abstract base class for task repositories with coroutine methods.
+
+    Mirrors TaskRepository method for method, for use from async
+    endpoints without blocking the event loop.
+    """
+
+    @abstractmethod
+    async def add(self, task: Task) -> Task:
+        """Add a new task.
+
+        Args:
+            task: Task to add
+
+        Returns:
+            Added task
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Get task by ID.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[Task]:
+        """Get all tasks.
+
+        Returns:
+            List of all tasks
+        """
+        pass
+
+    @abstractmethod
+    async def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """Get tasks matching a filter.
+
+        Args:
+            task_filter: Criteria tasks must match
+
+        Returns:
+            List of matching tasks
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get one page of tasks, newest first.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        pass
+
+    async def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get tasks as read-only TaskRows, newest first, for serialization.
+
+        See TaskRepository.get_rows. The default implementation converts
+        the tasks of get_all/get_filtered/get_page.
+
+        Args:
+            limit: Page size (optional; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of TaskRows and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        if limit is None and cursor is None:
+            if task_filter is None:
+                tasks = await self.get_all()
+            else:
+                tasks = await self.get_filtered(task_filter)
+            return TaskPage(tasks=[TaskRow.from_task(task) for task in tasks])
+
+        page = await self.get_page(limit, cursor, task_filter)
+        return TaskPage(
+            tasks=[TaskRow.from_task(task) for task in page.tasks],
+            next_cursor=page.next_cursor,
+        )
+
+    @abstractmethod
+    async def get_list_version(self) -> str:
+        """Get a version tag that changes whenever the task list does.
+
+        Returns:
+            Opaque version string
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, task: Task) -> Task:
+        """Update an existing task.
+
+        Args:
+            task: Task to update
+
+        Returns:
+            Updated task
+        """
+        pass
+
+    @abstractmethod
+    async def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set a task's completion status in one atomic operation.
+
+        Args:
+            task_id: Task identifier
+            completed: New completion status
+
+        Returns:
+            Updated task if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Update the given fields of a task in one atomic operation.
+
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+
+        Returns:
+            Updated task if found, None otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, tasks: List[Task]) -> List[Task]:
+        """Add several tasks in one operation.
+
+        Args:
+            tasks: Tasks to add
+
+        Returns:
+            Added tasks, in input order
+        """
+        pass
+
+    @abstractmethod
+    async def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """Set the completion status of several tasks in one operation.
+
+        Args:
+            task_ids: Task identifiers
+            completed: New completion status
+
+        Returns:
+            Updated tasks (missing IDs are skipped)
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, task_ids: List[int]) -> List[int]:
+        """Delete several tasks in one operation.
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            IDs that were actually deleted
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, task_id: int) -> bool:
+        """Check if task exists.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if exists, False otherwise
+        """
+        pass
+
+    @abstractmethod
+    async def get_next_id(self) -> int:
+        """Get next available ID.
+
+        Returns:
+            Next task ID
+        """
+        pass
@@ -0,0 +1,63 @@
+"""Task list cache interface."""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+from app.domain.entities.task import Task
+
+
+class TaskCache(ABC):
+    """Abstract base class for a per-user task list cache.
+
+    Holds a snapshot of each user's full task list (as returned by
+    TaskRepository.get_all()), optionally labelled with the list version
+    (TaskRepository.get_list_version()) it was loaded under. Tasks
+    returned from the cache may be shared between requests and must be
+    treated as read-only.
+
+    Attributes:
+        blocking: True if operations do network I/O; async callers run
+            them in a worker thread instead of on the event loop
+    """
+
+    blocking: bool = False
+
+    @abstractmethod
+    def get(self, user_id: str, version: Optional[str] = None) -> Optional[List[Task]]:
+        """Get a user's cached task list.
+
+        Args:
+            user_id: User identifier
+            version: Current list version; a snapshot stored under any
+                other version counts as a miss (optional)
+
+        Returns:
+            Cached tasks, or None on a miss
+        """
+        pass
+
+    @abstractmethod
+    def set(self, user_id: str, tasks: List[Task], version: Optional[str] = None) -> None:
+        """Store a user's task list.
+
+        Args:
+            user_id: User identifier
+            tasks: Full task list
+            version: List version read before loading the tasks (optional)
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached task list.
+
+        Args:
+            user_id: User identifier
+        """
+        pass
+
+    def stats(self) -> dict:
+        """Get cache metrics (hits, misses, hit_ratio, size...).
+
+        Returns:
+            dict of metric name to value
+        """
+        return {}
@@ -0,0 +1,32 @@
+"""Task filter criteria."""
+from dataclasses import dataclass
+from typing import Optional
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    """Criteria for narrowing down a task listing.
+
+    Every field defaults to None, meaning "no constraint", so an empty
+    TaskFilter() matches every task.
+
+    Attributes:
+        status: Only include tasks with this status
+    """
+
+    status: Optional[TaskStatus] = None
+
+    def matches(self, task: Task) -> bool:
+        """Check whether a task satisfies every criterion.
+
+        Args:
+            task: Task to check
+
+        Returns:
+            True if the task matches, False otherwise
+        """
+        if self.status is not None and task.status != self.status:
+            return False
+        return True
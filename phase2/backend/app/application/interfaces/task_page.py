@@ -0,0 +1,81 @@
+"""Keyset pagination primitives for task listings."""
+import base64
+import binascii
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+from app.domain.entities.task import Task
+from app.domain.exceptions import InvalidCursorError
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(created_at: datetime, task_id: int) -> str:
+    """Encode a (created_at, id) position as an opaque cursor.
+
+    Args:
+        created_at: Creation timestamp of the last task on a page
+        task_id: ID of the last task on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = f"{created_at.isoformat()}|{task_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor back into a (created_at, id) position.
+
+    Args:
+        cursor: Cursor previously returned by encode_cursor
+
+    Returns:
+        Tuple of (created_at, task_id)
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+        created_at, task_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    """One page of a task listing.
+
+    Attributes:
+        tasks: Tasks on this page, newest first (TaskRows for get_rows)
+        next_cursor: Cursor for the following page, None on the last page
+    """
+
+    tasks: List[Task] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_rows(cls, tasks: List[Task], limit: int) -> "TaskPage":
+        """Build a page from up to limit + 1 ordered tasks.
+
+        Fetching one extra row tells whether another page exists
+        without a separate COUNT query.
+
+        Args:
+            tasks: Tasks ordered by (created_at, id) descending
+            limit: Page size
+
+        Returns:
+            TaskPage holding at most limit tasks
+        """
+        if len(tasks) <= limit:
+            return cls(tasks=list(tasks))
+
+        page = list(tasks[:limit])
+        last = page[-1]
+        return cls(tasks=page, next_cursor=encode_cursor(last.created_at, last.id))
@@ -2,6 +2,9 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from app.domain.entities.task import Task
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import TaskPage, decode_cursor
+from app.application.interfaces.task_row import TaskRow
 
 
 class TaskRepository(ABC):
@@ -40,6 +43,106 @@ class TaskRepository(ABC):
         """
         pass
 
+    def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """Get tasks matching a filter.
+
+        The default implementation filters get_all() in memory.
+        Database-backed repositories should override it so the
+        criteria are applied by the query itself.
+
+        Args:
+            task_filter: Criteria tasks must match
+
+        Returns:
+            List of matching tasks
+        """
+        return [task for task in self.get_all() if task_filter.matches(task)]
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get one page of tasks, newest first.
+
+        Tasks are ordered by (created_at, id) descending and the cursor
+        marks the position of the last task on the previous page.
+        The default implementation pages through get_filtered() in
+        memory; database-backed repositories should override it with
+        a keyset query.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        tasks = self.get_filtered(task_filter or TaskFilter())
+        tasks = sorted(tasks, key=lambda t: (t.created_at, t.id), reverse=True)
+
+        if cursor is not None:
+            position = decode_cursor(cursor)
+            tasks = [t for t in tasks if (t.created_at, t.id) < position]
+
+        return TaskPage.from_rows(tasks[:limit + 1], limit)
+
+    def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get tasks as read-only TaskRows, newest first, for serialization.
+
+        Without limit and cursor every matching task is returned (as
+        get_all/get_filtered would); otherwise one page as get_page
+        would. The default implementation converts those tasks;
+        database-backed repositories should override it with a query
+        selecting only the listed columns.
+
+        Args:
+            limit: Page size (optional; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of TaskRows and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        if limit is None and cursor is None:
+            tasks = self.get_all() if task_filter is None else self.get_filtered(task_filter)
+            return TaskPage(tasks=[TaskRow.from_task(task) for task in tasks])
+
+        page = self.get_page(limit, cursor, task_filter)
+        return TaskPage(
+            tasks=[TaskRow.from_task(task) for task in page.tasks],
+            next_cursor=page.next_cursor,
+        )
+
+    def get_list_version(self) -> str:
+        """Get a version tag for the task list.
+
+        The tag changes whenever any task is added, changed or removed,
+        so callers can detect an unchanged list without loading it.
+        The default implementation derives it from get_all();
+        database-backed repositories should override it with an
+        aggregate query.
+
+        Returns:
+            Opaque version string
+        """
+        tasks = self.get_all()
+        last_updated = max((task.updated_at for task in tasks), default=None)
+        return f"{len(tasks)}:{last_updated.isoformat() if last_updated else ''}"
+
     @abstractmethod
     def update(self, task: Task) -> Task:
         """Update an existing task.
@@ -52,6 +155,63 @@ class TaskRepository(ABC):
         """
         pass
 
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set a task's completion status.
+
+        The default implementation loads the task and saves it back.
+        Database-backed repositories should override it with a single
+        atomic statement.
+
+        Args:
+            task_id: Task identifier
+            completed: New completion status
+
+        Returns:
+            Updated task if found, None otherwise
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            return None
+
+        if completed:
+            task.complete()
+        else:
+            task.uncomplete()
+        return self.update(task)
+
+    def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Update the given fields of a task.
+
+        Fields left as None are not changed. The default implementation
+        loads the task and saves it back; database-backed repositories
+        should override it with a single atomic statement.
+
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+
+        Returns:
+            Updated task if found, None otherwise
+
+        Raises:
+            TaskValidationError: If validation fails
+        """
+        task = self.get_by_id(task_id)
+        if task is None:
+            return None
+
+        if title is not None:
+            task.update_title(title)
+        if description is not None:
+            task.update_description(description)
+        return self.update(task)
+
     @abstractmethod
     def delete(self, task_id: int) -> bool:
         """Delete a task.
@@ -64,6 +224,66 @@ class TaskRepository(ABC):
         """
         pass
 
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Delete a task and return it.
+
+        The default implementation loads the task before deleting it.
+        Database-backed repositories should override it with a single
+        DELETE ... RETURNING.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Deleted task if found, None otherwise
+        """
+        task = self.get_by_id(task_id)
+        if task is None or not self.delete(task_id):
+            return None
+        return task
+
+    def add_many(self, tasks: List[Task]) -> List[Task]:
+        """Add several tasks.
+
+        The default implementation calls add() per task; database-backed
+        repositories should override it with a multi-row insert.
+
+        Args:
+            tasks: Tasks to add
+
+        Returns:
+            Added tasks, in input order
+        """
+        return [self.add(task) for task in tasks]
+
+    def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """Set the completion status of several tasks.
+
+        Args:
+            task_ids: Task identifiers
+            completed: New completion status
+
+        Returns:
+            Updated tasks (missing IDs are skipped)
+        """
+        updated = []
+        for task_id in task_ids:
+            task = self.set_completed(task_id, completed)
+            if task is not None:
+                updated.append(task)
+        return updated
+
+    def delete_many(self, task_ids: List[int]) -> List[int]:
+        """Delete several tasks.
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            IDs that were actually deleted
+        """
+        return [task_id for task_id in task_ids if self.delete(task_id)]
+
     @abstractmethod
     def exists(self, task_id: int) -> bool:
         """Check if task exists.
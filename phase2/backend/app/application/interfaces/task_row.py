@@ -0,0 +1,70 @@
+"""Read-only task rows for listings."""
+from datetime import datetime
+from typing import NamedTuple
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus
+
+
+class TaskRow(NamedTuple):
+    """A task as listed, without a domain entity behind it.
+
+    Rows are read straight from storage for serialization: the values
+    were validated when the task was written, so no entity is built and
+    nothing is validated again. Database-backed repositories may return
+    driver rows with the same fields instead.
+
+    Attributes:
+        id: Task identifier
+        title: Task title
+        description: Task description ("" if none)
+        completed: Completion status
+        created_at: Creation timestamp
+        updated_at: Last modification timestamp
+    """
+
+    id: int
+    title: str
+    description: str
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_task(cls, task: Task) -> "TaskRow":
+        """Build a row from a domain Task.
+
+        Args:
+            task: Domain Task entity
+
+        Returns:
+            TaskRow with the task's values
+        """
+        return cls(
+            task.id,
+            task.title,
+            task.description,
+            task.status.is_completed(),
+            task.created_at,
+            task.updated_at,
+        )
+
+
+def task_from_row(row: TaskRow) -> Task:
+    """Rebuild a domain Task from a listed row, without validation.
+
+    Accepts a TaskRow or any driver row with the same fields.
+
+    Args:
+        row: Row as returned by TaskRepository.get_rows
+
+    Returns:
+        Task with the row's values
+    """
+    return Task.from_storage(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        status=TaskStatus.COMPLETED if row.completed else TaskStatus.PENDING,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
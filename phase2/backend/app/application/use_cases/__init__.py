@@ -1,10 +1,16 @@
 """Use cases package."""
-from .add_task import AddTaskUseCase
-from .list_tasks import ListTasksUseCase
-from .update_task import UpdateTaskUseCase
-from .delete_task import DeleteTaskUseCase
-from .complete_task import CompleteTaskUseCase
-from .uncomplete_task import UncompleteTaskUseCase
+from .add_task import AddTaskUseCase, AsyncAddTaskUseCase
+from .list_tasks import ListTasksUseCase, AsyncListTasksUseCase
+from .update_task import UpdateTaskUseCase, AsyncUpdateTaskUseCase
+from .delete_task import DeleteTaskUseCase, AsyncDeleteTaskUseCase
+from .complete_task import CompleteTaskUseCase, AsyncCompleteTaskUseCase
+from .uncomplete_task import UncompleteTaskUseCase, AsyncUncompleteTaskUseCase
+from .batch_tasks import (
+    BatchOperation,
+    BatchResult,
+    BatchTasksUseCase,
+    AsyncBatchTasksUseCase,
+)
 
 __all__ = [
     "AddTaskUseCase",
@@ -13,4 +19,14 @@ __all__ = [
     "DeleteTaskUseCase",
     "CompleteTaskUseCase",
     "UncompleteTaskUseCase",
+    "AsyncAddTaskUseCase",
+    "AsyncListTasksUseCase",
+    "AsyncUpdateTaskUseCase",
+    "AsyncDeleteTaskUseCase",
+    "AsyncCompleteTaskUseCase",
+    "AsyncUncompleteTaskUseCase",
+    "BatchOperation",
+    "BatchResult",
+    "BatchTasksUseCase",
+    "AsyncBatchTasksUseCase",
 ]
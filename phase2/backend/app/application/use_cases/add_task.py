@@ -1,4 +1,5 @@
 """Add task use case."""
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
 from app.domain.value_objects.task_status import TaskStatus
@@ -36,3 +37,37 @@ class AddTaskUseCase:
             status=TaskStatus.PENDING
         )
         return self.repository.add(task)
+
+
+class AsyncAddTaskUseCase:
+    """Use case for adding a new task through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, title: str, description: str = "") -> Task:
+        """Add a new task.
+
+        Args:
+            title: Task title
+            description: Task description (optional)
+
+        Returns:
+            Created task
+
+        Raises:
+            TaskValidationError: If validation fails
+        """
+        task_id = await self.repository.get_next_id()
+        task = Task(
+            id=task_id,
+            title=title,
+            description=description,
+            status=TaskStatus.PENDING
+        )
+        return await self.repository.add(task)
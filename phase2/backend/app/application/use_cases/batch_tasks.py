@@ -0,0 +1,298 @@
+"""Batch task operations use case."""
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Iterator, List, Optional, Tuple
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
+from app.application.interfaces.task_repository import TaskRepository
+from app.domain.entities.task import Task
+from app.domain.exceptions import TaskValidationError
+from app.domain.value_objects.task_status import TaskStatus
+
+
+OP_CREATE = "create"
+OP_UPDATE = "update"
+OP_COMPLETE = "complete"
+OP_UNCOMPLETE = "uncomplete"
+OP_DELETE = "delete"
+
+ERROR_NOT_FOUND = "not_found"
+ERROR_VALIDATION = "validation"
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """A single operation within a batch.
+
+    Attributes:
+        op: One of create, update, complete, uncomplete, delete
+        task_id: Target task (all operations except create)
+        title: Title (create, optionally update)
+        description: Description (create, optionally update)
+    """
+
+    op: str
+    task_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one batch operation.
+
+    Attributes:
+        op: Operation that was requested
+        task_id: Affected task ID (None for a failed create)
+        task: Resulting task (None for delete and failures)
+        error: ERROR_NOT_FOUND or ERROR_VALIDATION, None on success
+        message: Human-readable error message
+    """
+
+    op: str
+    task_id: Optional[int] = None
+    task: Optional[Task] = None
+    error: Optional[str] = None
+    message: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the operation succeeded."""
+        return self.error is None
+
+
+def _runs(
+    operations: List[BatchOperation],
+) -> Iterator[Tuple[str, List[Tuple[int, BatchOperation]]]]:
+    """Split operations into runs of consecutive operations of one kind.
+
+    Each run is applied with one repository call, and runs are applied
+    in request order, so batching never reorders dependent operations.
+
+    Yields:
+        (op, [(index, operation), ...]) per run
+    """
+    indexed = list(enumerate(operations))
+    for op, run in groupby(indexed, key=lambda item: item[1].op):
+        yield op, list(run)
+
+
+def _not_found(operation: BatchOperation) -> BatchResult:
+    """Result for an operation whose task doesn't exist."""
+    return BatchResult(
+        op=operation.op,
+        task_id=operation.task_id,
+        error=ERROR_NOT_FOUND,
+        message=f"Task with ID {operation.task_id} not found",
+    )
+
+
+def _invalid(operation: BatchOperation, message: str) -> BatchResult:
+    """Result for an operation that failed validation."""
+    return BatchResult(
+        op=operation.op,
+        task_id=operation.task_id,
+        error=ERROR_VALIDATION,
+        message=message,
+    )
+
+
+def _prepare_creates(
+    run: List[Tuple[int, BatchOperation]],
+    results: List[Optional[BatchResult]],
+) -> List[Tuple[int, Task]]:
+    """Build validated tasks for a create run, recording validation failures."""
+    valid = []
+    for index, operation in run:
+        try:
+            task = Task(
+                id=0,
+                title=operation.title or "",
+                description=operation.description or "",
+                status=TaskStatus.PENDING,
+            )
+        except TaskValidationError as e:
+            results[index] = _invalid(operation, str(e))
+            continue
+        valid.append((index, task))
+    return valid
+
+
+def _record_updated(
+    run: List[Tuple[int, BatchOperation]],
+    updated: List[Task],
+    results: List[Optional[BatchResult]],
+) -> None:
+    """Record results of a complete/uncomplete run from the updated tasks."""
+    by_id = {task.id: task for task in updated}
+    for index, operation in run:
+        task = by_id.get(operation.task_id)
+        results[index] = (
+            BatchResult(op=operation.op, task_id=task.id, task=task)
+            if task is not None
+            else _not_found(operation)
+        )
+
+
+def _record_deleted(
+    run: List[Tuple[int, BatchOperation]],
+    deleted_ids: List[int],
+    results: List[Optional[BatchResult]],
+) -> None:
+    """Record results of a delete run; a repeated ID only succeeds once."""
+    remaining = set(deleted_ids)
+    for index, operation in run:
+        if operation.task_id in remaining:
+            remaining.discard(operation.task_id)
+            results[index] = BatchResult(op=operation.op, task_id=operation.task_id)
+        else:
+            results[index] = _not_found(operation)
+
+
+def _unique_ids(run: List[Tuple[int, BatchOperation]]) -> List[int]:
+    """Get the distinct task IDs of a run, in order."""
+    return list(dict.fromkeys(operation.task_id for _, operation in run))
+
+
+class BatchTasksUseCase:
+    """Use case for applying a list of mixed task operations at once.
+
+    Consecutive operations of the same kind are applied with a single
+    repository call (multi-row insert, or update/delete by a set of
+    IDs). Failures are reported per operation and don't stop the batch.
+    Transaction boundaries are left to the caller.
+    """
+
+    def __init__(self, repository: TaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Task repository
+        """
+        self.repository = repository
+
+    def execute(self, operations: List[BatchOperation]) -> List[BatchResult]:
+        """Apply operations in order.
+
+        Args:
+            operations: Operations to apply
+
+        Returns:
+            One result per operation, in input order
+        """
+        results: List[Optional[BatchResult]] = [None] * len(operations)
+
+        for op, run in _runs(operations):
+            if op == OP_CREATE:
+                valid = _prepare_creates(run, results)
+                added = self.repository.add_many([task for _, task in valid])
+                for (index, _), task in zip(valid, added):
+                    results[index] = BatchResult(op=op, task_id=task.id, task=task)
+
+            elif op == OP_UPDATE:
+                for index, operation in run:
+                    results[index] = self._update(operation)
+
+            elif op in (OP_COMPLETE, OP_UNCOMPLETE):
+                updated = self.repository.set_completed_many(
+                    _unique_ids(run), completed=op == OP_COMPLETE
+                )
+                _record_updated(run, updated, results)
+
+            elif op == OP_DELETE:
+                deleted = self.repository.delete_many(_unique_ids(run))
+                _record_deleted(run, deleted, results)
+
+            else:
+                for index, operation in run:
+                    results[index] = _invalid(operation, f"Unknown operation '{op}'")
+
+        return results
+
+    def _update(self, operation: BatchOperation) -> BatchResult:
+        """Apply a single update operation."""
+        try:
+            Task.validate_changes(
+                title=operation.title, description=operation.description
+            )
+        except TaskValidationError as e:
+            return _invalid(operation, str(e))
+
+        task = self.repository.patch(
+            operation.task_id,
+            title=operation.title,
+            description=operation.description,
+        )
+        if task is None:
+            return _not_found(operation)
+        return BatchResult(op=operation.op, task_id=task.id, task=task)
+
+
+class AsyncBatchTasksUseCase:
+    """Use case for applying a list of mixed task operations through an async repository.
+
+    Same semantics as BatchTasksUseCase.
+    """
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, operations: List[BatchOperation]) -> List[BatchResult]:
+        """Apply operations in order.
+
+        Args:
+            operations: Operations to apply
+
+        Returns:
+            One result per operation, in input order
+        """
+        results: List[Optional[BatchResult]] = [None] * len(operations)
+
+        for op, run in _runs(operations):
+            if op == OP_CREATE:
+                valid = _prepare_creates(run, results)
+                added = await self.repository.add_many([task for _, task in valid])
+                for (index, _), task in zip(valid, added):
+                    results[index] = BatchResult(op=op, task_id=task.id, task=task)
+
+            elif op == OP_UPDATE:
+                for index, operation in run:
+                    results[index] = await self._update(operation)
+
+            elif op in (OP_COMPLETE, OP_UNCOMPLETE):
+                updated = await self.repository.set_completed_many(
+                    _unique_ids(run), completed=op == OP_COMPLETE
+                )
+                _record_updated(run, updated, results)
+
+            elif op == OP_DELETE:
+                deleted = await self.repository.delete_many(_unique_ids(run))
+                _record_deleted(run, deleted, results)
+
+            else:
+                for index, operation in run:
+                    results[index] = _invalid(operation, f"Unknown operation '{op}'")
+
+        return results
+
+    async def _update(self, operation: BatchOperation) -> BatchResult:
+        """Apply a single update operation."""
+        try:
+            Task.validate_changes(
+                title=operation.title, description=operation.description
+            )
+        except TaskValidationError as e:
+            return _invalid(operation, str(e))
+
+        task = await self.repository.patch(
+            operation.task_id,
+            title=operation.title,
+            description=operation.description,
+        )
+        if task is None:
+            return _not_found(operation)
+        return BatchResult(op=operation.op, task_id=task.id, task=task)
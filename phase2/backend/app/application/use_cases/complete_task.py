@@ -1,4 +1,5 @@
 """Complete task use case."""
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
 from app.domain.exceptions import TaskNotFoundError
@@ -27,9 +28,38 @@ class CompleteTaskUseCase:
         Raises:
             TaskNotFoundError: If task not found
         """
-        task = self.repository.get_by_id(task_id)
+        task = self.repository.set_completed(task_id, completed=True)
         if task is None:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
-        task.complete()
-        return self.repository.update(task)
+        return task
+
+
+class AsyncCompleteTaskUseCase:
+    """Use case for marking a task as completed through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, task_id: int) -> Task:
+        """Mark a task as completed.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Updated task
+
+        Raises:
+            TaskNotFoundError: If task not found
+        """
+        task = await self.repository.set_completed(task_id, completed=True)
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+
+        return task
@@ -1,5 +1,7 @@
 """Delete task use case."""
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
+from app.domain.entities.task import Task
 from app.domain.exceptions import TaskNotFoundError
 
 
@@ -14,7 +16,37 @@ class DeleteTaskUseCase:
         """
         self.repository = repository
 
-    def execute(self, task_id: int) -> bool:
+    def execute(self, task_id: int) -> Task:
+        """Delete a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            The deleted task
+
+        Raises:
+            TaskNotFoundError: If task not found
+        """
+        task = self.repository.remove(task_id)
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+
+        return task
+
+
+class AsyncDeleteTaskUseCase:
+    """Use case for deleting a task through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, task_id: int) -> bool:
         """Delete a task.
 
         Args:
@@ -26,7 +58,7 @@ class DeleteTaskUseCase:
         Raises:
             TaskNotFoundError: If task not found
         """
-        if not self.repository.exists(task_id):
+        if not await self.repository.delete(task_id):
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
-        return self.repository.delete(task_id)
+        return True
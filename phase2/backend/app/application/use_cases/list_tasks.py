@@ -1,5 +1,12 @@
 """List tasks use case."""
-from typing import List
+from typing import List, Optional
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    TaskPage,
+)
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
 
@@ -15,10 +22,148 @@ class ListTasksUseCase:
         """
         self.repository = repository
 
-    def execute(self) -> List[Task]:
-        """List all tasks.
+    def execute(self, task_filter: Optional[TaskFilter] = None) -> List[Task]:
+        """List tasks, optionally narrowed down by a filter.
+
+        Args:
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            List of matching tasks (all tasks if no filter is given)
+        """
+        if task_filter is None:
+            return self.repository.get_all()
+        return self.repository.get_filtered(task_filter)
+
+    def execute_page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """List one page of tasks, newest first.
+
+        Args:
+            limit: Page size (clamped to 1..MAX_PAGE_SIZE)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        return self.repository.get_page(
+            limit=limit, cursor=cursor, task_filter=task_filter
+        )
+
+    def execute_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """List tasks as read-only TaskRows for serialization.
+
+        Without limit and cursor every matching task is listed, like
+        execute(); otherwise one page, like execute_page().
+
+        Args:
+            limit: Page size (clamped to 1..MAX_PAGE_SIZE; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of TaskRows and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        if limit is not None:
+            limit = max(1, min(limit, MAX_PAGE_SIZE))
+        elif cursor is not None:
+            limit = DEFAULT_PAGE_SIZE
+        return self.repository.get_rows(
+            limit=limit, cursor=cursor, task_filter=task_filter
+        )
+
+
+class AsyncListTasksUseCase:
+    """Use case for listing tasks through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, task_filter: Optional[TaskFilter] = None) -> List[Task]:
+        """List tasks, optionally narrowed down by a filter.
+
+        Args:
+            task_filter: Criteria tasks must match (optional)
 
         Returns:
-            List of all tasks
+            List of matching tasks (all tasks if no filter is given)
+        """
+        if task_filter is None:
+            return await self.repository.get_all()
+        return await self.repository.get_filtered(task_filter)
+
+    async def execute_page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """List one page of tasks, newest first.
+
+        Args:
+            limit: Page size (clamped to 1..MAX_PAGE_SIZE)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        return await self.repository.get_page(
+            limit=limit, cursor=cursor, task_filter=task_filter
+        )
+
+    async def execute_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """List tasks as read-only TaskRows for serialization.
+
+        Without limit and cursor every matching task is listed, like
+        execute(); otherwise one page, like execute_page().
+
+        Args:
+            limit: Page size (clamped to 1..MAX_PAGE_SIZE; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of TaskRows and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
         """
-        return self.repository.get_all()
+        if limit is not None:
+            limit = max(1, min(limit, MAX_PAGE_SIZE))
+        elif cursor is not None:
+            limit = DEFAULT_PAGE_SIZE
+        return await self.repository.get_rows(
+            limit=limit, cursor=cursor, task_filter=task_filter
+        )
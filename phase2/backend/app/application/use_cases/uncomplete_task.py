@@ -1,4 +1,5 @@
 """Uncomplete task use case."""
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
 from app.domain.exceptions import TaskNotFoundError
@@ -27,9 +28,38 @@ class UncompleteTaskUseCase:
         Raises:
             TaskNotFoundError: If task not found
         """
-        task = self.repository.get_by_id(task_id)
+        task = self.repository.set_completed(task_id, completed=False)
         if task is None:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
-        task.uncomplete()
-        return self.repository.update(task)
+        return task
+
+
+class AsyncUncompleteTaskUseCase:
+    """Use case for marking a task as pending through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(self, task_id: int) -> Task:
+        """Mark a task as pending.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Updated task
+
+        Raises:
+            TaskNotFoundError: If task not found
+        """
+        task = await self.repository.set_completed(task_id, completed=False)
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+
+        return task
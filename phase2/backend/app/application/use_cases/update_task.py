@@ -1,5 +1,6 @@
 """Update task use case."""
 from typing import Optional
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
 from app.domain.exceptions import TaskNotFoundError
@@ -36,14 +37,54 @@ class UpdateTaskUseCase:
             TaskNotFoundError: If task not found
             TaskValidationError: If validation fails
         """
-        task = self.repository.get_by_id(task_id)
+        Task.validate_changes(title=title, description=description)
+
+        task = self.repository.patch(
+            task_id, title=title, description=description
+        )
         if task is None:
             raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
-        if title is not None:
-            task.update_title(title)
+        return task
+
+
+class AsyncUpdateTaskUseCase:
+    """Use case for updating a task through an async repository."""
+
+    def __init__(self, repository: AsyncTaskRepository):
+        """Initialize use case.
+
+        Args:
+            repository: Async task repository
+        """
+        self.repository = repository
+
+    async def execute(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> Task:
+        """Update a task.
 
-        if description is not None:
-            task.update_description(description)
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            TaskNotFoundError: If task not found
+            TaskValidationError: If validation fails
+        """
+        Task.validate_changes(title=title, description=description)
+
+        task = await self.repository.patch(
+            task_id, title=title, description=description
+        )
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
 
-        return self.repository.update(task)
+        return task
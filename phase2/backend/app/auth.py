@@ -7,9 +7,17 @@ Security Implementation:
 - Validates token expiration
 - Extracts user_id from 'sub' claim
 - Provides FastAPI dependency for protected routes
+- Caches successful verifications in memory (keyed by token hash,
+  never beyond the token's exp claim)
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -21,6 +29,114 @@ settings = get_settings()
 security = HTTPBearer()
 
 
+class VerifiedTokenCache:
+    """
+    Bounded, TTL-aware cache of verified JWTs.
+
+    Maps SHA-256(token) to the user_id from its 'sub' claim so repeated
+    requests with the same bearer token skip signature verification and
+    payload decoding. Entries expire at the earlier of the token's 'exp'
+    claim and ttl_seconds after caching, so an expired token always
+    falls through to jwt.decode and fails exactly as it would uncached.
+    Only successful verifications are stored.
+
+    Thread-safe: sync dependencies run in Starlette's threadpool.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of tokens kept (LRU eviction, 0 disables)
+            ttl_seconds: Maximum age of an entry
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Hash the token so raw credentials are never held as keys."""
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        """
+        Look up a previously verified token.
+
+        Args:
+            token: Raw bearer token
+
+        Returns:
+            Cached user_id, or None if absent or expired
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                user_id, expires_at = entry
+                if time.time() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return user_id
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, token: str, user_id: str, exp: Optional[float]) -> None:
+        """
+        Store a successfully verified token.
+
+        Args:
+            token: Raw bearer token
+            user_id: Verified 'sub' claim
+            exp: Token's 'exp' claim (epoch seconds), if any
+        """
+        if self.max_size <= 0:
+            return
+
+        expires_at = time.time() + self.ttl_seconds
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (user_id, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache counters.
+
+        Returns:
+            dict with size, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+token_cache = VerifiedTokenCache(
+    max_size=settings.jwt_cache_size,
+    ttl_seconds=settings.jwt_cache_ttl_seconds,
+)
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> str:
@@ -29,6 +145,7 @@ def get_current_user(
 
     This dependency function:
     1. Extracts token from Authorization: Bearer <token> header
+       (returns the cached user_id if this token was verified recently)
     2. Verifies signature using BETTER_AUTH_SECRET
     3. Validates expiration (exp claim)
     4. Decodes payload to get user_id from 'sub' claim
@@ -60,6 +177,11 @@ def get_current_user(
     try:
         token = credentials.credentials
 
+        # Reuse a recent verification of the same token
+        cached_user_id = token_cache.get(token)
+        if cached_user_id is not None:
+            return cached_user_id
+
         # Decode and verify JWT
         payload = jwt.decode(
             token,
@@ -78,8 +200,11 @@ def get_current_user(
                 detail="Invalid token: missing subject"
             )
 
+        user_id = user_id.strip()
+        token_cache.put(token, user_id, payload.get("exp"))
+
         logger.debug(f"Authenticated user: {user_id}")
-        return user_id.strip()
+        return user_id
 
     except jwt.ExpiredSignatureError:
         logger.info("JWT token expired")
@@ -1,16 +1,91 @@
 """
 Database Connection and Session Management
 
-Manages SQLModel engine and database sessions.
+Manages SQLModel engines and database sessions.
 Provides dependency injection for FastAPI endpoints.
+
+Two access paths are available:
+- Sync: `engine` + `get_session` (psycopg2), used by default
+- Async: `get_async_engine()` + `get_async_session` (asyncpg),
+  enabled with ASYNC_DATABASE=true
 """
 
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.config import get_settings
 
 
 settings = get_settings()
 
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool that records how long checkouts wait for a connection.
+
+    Feeds the readiness check: `waiting` is the number of checkouts in
+    progress right now, and recent waits are kept for WAIT_WINDOW_SECONDS
+    so the average falls back to zero once the pool is idle.
+    """
+
+    WAIT_WINDOW_SECONDS = 10.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self._recent_waits: deque = deque(maxlen=1024)  # (finished_at, seconds)
+        self.waiting = 0
+
+    def _do_get(self):
+        started = time.monotonic()
+        with self._wait_lock:
+            self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            finished = time.monotonic()
+            with self._wait_lock:
+                self.waiting -= 1
+                self._recent_waits.append((finished, finished - started))
+
+    def wait_stats(self) -> dict:
+        """
+        Checkout waits over the last WAIT_WINDOW_SECONDS.
+
+        Returns:
+            dict with waiting, recent_checkouts, avg_wait_ms, max_wait_ms
+        """
+        cutoff = time.monotonic() - self.WAIT_WINDOW_SECONDS
+        with self._wait_lock:
+            waits = [seconds for finished, seconds in self._recent_waits if finished >= cutoff]
+            waiting = self.waiting
+        return {
+            "waiting": waiting,
+            "recent_checkouts": len(waits),
+            "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+            "max_wait_ms": round(max(waits) * 1000, 1) if waits else 0.0,
+        }
+
+
+class TimedAsyncQueuePool(TimedQueuePool, AsyncAdaptedQueuePool):
+    """TimedQueuePool for the async engine (asyncio-adapted queue)"""
+
+
+def _pool_options(database_url: str, is_async: bool = False) -> dict:
+    """Timed pool for server databases and SQLite files, not :memory:"""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {"poolclass": TimedAsyncQueuePool if is_async else TimedQueuePool}
+
+
 # Create database engine
 # pool_pre_ping ensures connections are alive before using
 # echo prints SQL statements when debug=True
@@ -18,11 +93,43 @@ engine = create_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,  # Connection pool size
-    max_overflow=10,  # Max overflow connections
+    pool_size=settings.db_pool_size,  # Connection pool size
+    max_overflow=settings.db_max_overflow,  # Max overflow connections
+    **_pool_options(settings.database_url),
 )
 
 
+@lru_cache()
+def get_async_engine() -> AsyncEngine:
+    """
+    Get the async database engine, creating it on first use.
+
+    Created lazily so the async driver (asyncpg/aiosqlite) is only
+    required when the async path is actually used.
+
+    Returns:
+        AsyncEngine: Engine bound to settings.async_database_url
+    """
+    return create_async_engine(
+        settings.async_database_url,
+        echo=settings.debug,
+        pool_pre_ping=True,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        **_pool_options(settings.async_database_url, is_async=True),
+    )
+
+
+@lru_cache()
+def _get_async_session_factory() -> async_sessionmaker:
+    """Get the AsyncSession factory bound to the async engine."""
+    return async_sessionmaker(
+        get_async_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,  # Objects stay readable after commit without a reload
+    )
+
+
 def create_db_and_tables():
     """
     Create all database tables defined in SQLModel.
@@ -61,3 +168,24 @@ def get_session():
             yield session
         finally:
             session.close()
+
+
+async def get_async_session():
+    """
+    Dependency for getting an async database session.
+
+    Async counterpart of get_session for coroutine endpoints.
+    The session is closed (and its connection returned to the
+    pool) after the request completes.
+
+    Yields:
+        AsyncSession: Async database session
+
+    Usage:
+        @app.get("/api/{user_id}/tasks")
+        async def get_tasks(session: AsyncSession = Depends(get_async_session)):
+            result = await session.exec(select(TaskDB))
+            return result.all()
+    """
+    async with _get_async_session_factory()() as session:
+        yield session
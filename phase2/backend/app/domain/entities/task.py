@@ -1,11 +1,22 @@
 """Task entity."""
 from datetime import datetime
+from typing import Optional
 from app.domain.value_objects.task_status import TaskStatus
 from app.domain.exceptions import TaskValidationError
 
 
 class Task:
-    """Task entity representing a todo item."""
+    """Task entity representing a todo item.
+
+    Uses __slots__: no per-instance __dict__, so large task lists take
+    less memory. Construct tasks from user input with Task(...), which
+    validates; rebuild stored tasks with Task.from_storage(...), which
+    does not.
+    """
+
+    __slots__ = (
+        "_id", "_title", "_description", "_status", "_created_at", "_updated_at"
+    )
 
     def __init__(
         self,
@@ -13,7 +24,8 @@ class Task:
         title: str,
         description: str = "",
         status: TaskStatus = TaskStatus.PENDING,
-        created_at: datetime = None
+        created_at: datetime = None,
+        updated_at: datetime = None
     ):
         """Initialize a task.
 
@@ -23,12 +35,14 @@ class Task:
             description: Task description (0-1000 characters)
             status: Task status (default: PENDING)
             created_at: Creation timestamp (default: now)
+            updated_at: Last modification timestamp (default: created_at)
 
         Raises:
             TaskValidationError: If validation fails
         """
         self._id = id
         self._created_at = created_at or datetime.now()
+        self._updated_at = updated_at or self._created_at
         self._status = status
 
         # Validate and set title
@@ -39,6 +53,41 @@ class Task:
         self._validate_description(description)
         self._description = description
 
+    @classmethod
+    def from_storage(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        status: TaskStatus,
+        created_at: datetime,
+        updated_at: datetime
+    ) -> "Task":
+        """Rebuild a task from values that were validated when stored.
+
+        Skips validation and defaults; every value is taken as given.
+        Only for repository reads, never for user input.
+
+        Args:
+            id: Unique task identifier
+            title: Stored title
+            description: Stored description ("" if none)
+            status: Stored status
+            created_at: Stored creation timestamp
+            updated_at: Stored modification timestamp
+
+        Returns:
+            Task with the given values
+        """
+        task = object.__new__(cls)
+        task._id = id
+        task._title = title
+        task._description = description
+        task._status = status
+        task._created_at = created_at
+        task._updated_at = updated_at
+        return task
+
     @property
     def id(self) -> int:
         """Get task ID (immutable)."""
@@ -64,6 +113,11 @@ class Task:
         """Get creation timestamp (immutable)."""
         return self._created_at
 
+    @property
+    def updated_at(self) -> datetime:
+        """Get last modification timestamp (as loaded from storage)."""
+        return self._updated_at
+
     def complete(self) -> None:
         """Mark task as completed."""
         self._status = TaskStatus.COMPLETED
@@ -96,6 +150,29 @@ class Task:
         self._validate_description(description)
         self._description = description
 
+    @classmethod
+    def validate_changes(
+        cls,
+        title: Optional[str] = None,
+        description: Optional[str] = None
+    ) -> None:
+        """Validate new field values without loading a task.
+
+        Applies the same rules as update_title/update_description, for
+        callers that write changes to storage directly.
+
+        Args:
+            title: New title (optional, skipped if None)
+            description: New description (optional, skipped if None)
+
+        Raises:
+            TaskValidationError: If validation fails
+        """
+        if title is not None:
+            cls._validate_title(title)
+        if description is not None:
+            cls._validate_description(description)
+
     @staticmethod
     def _validate_title(title: str) -> None:
         """Validate task title.
@@ -26,6 +26,11 @@ class TaskNotFoundError(ApplicationException):
     pass
 
 
+class InvalidCursorError(ApplicationException):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
 class PresentationException(TodoAppException):
     """Base exception for presentation layer."""
     pass
@@ -0,0 +1,52 @@
+"""
+Infrastructure Caches
+
+Concrete implementations of the TaskCache interface.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from app.application.interfaces.task_cache import TaskCache
+from app.config import get_settings
+from .in_memory_task_cache import InMemoryTaskCache
+from .redis_task_cache import RedisTaskCache
+
+
+@lru_cache()
+def get_task_cache() -> Optional[TaskCache]:
+    """
+    Get the process-wide task list cache selected by TASK_CACHE_BACKEND.
+
+    Returns:
+        TaskCache instance, or None when caching is disabled ("none")
+
+    Raises:
+        ValueError: If the backend name is unknown or REDIS_URL is missing
+    """
+    settings = get_settings()
+    backend = settings.task_cache_backend.lower()
+
+    if backend == "none":
+        return None
+
+    if backend == "memory":
+        return InMemoryTaskCache(
+            max_users=settings.task_cache_max_users,
+            ttl_seconds=settings.task_cache_ttl_seconds,
+        )
+
+    if backend == "redis":
+        if not settings.redis_url:
+            raise ValueError("REDIS_URL is required when TASK_CACHE_BACKEND=redis")
+        import redis  # Optional dependency, only needed for this backend
+
+        return RedisTaskCache(
+            redis.Redis.from_url(settings.redis_url),
+            ttl_seconds=settings.task_cache_ttl_seconds,
+        )
+
+    raise ValueError(f"Unknown TASK_CACHE_BACKEND '{settings.task_cache_backend}'")
+
+
+__all__ = ["InMemoryTaskCache", "RedisTaskCache", "get_task_cache"]
@@ -0,0 +1,121 @@
+"""
+In-Memory Task Cache
+
+Process-local LRU implementation of TaskCache.
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from app.application.interfaces.task_cache import TaskCache
+from app.domain.entities.task import Task
+
+
+def _approx_size(task: Task) -> int:
+    """Estimate the memory held by one cached task, in bytes."""
+    size = sys.getsizeof(task) + sys.getsizeof(task.title)
+    size += sys.getsizeof(task.description) + sys.getsizeof(task.created_at)
+    return size + sys.getsizeof(task.updated_at)  # Task has __slots__, no __dict__
+
+
+class InMemoryTaskCache(TaskCache):
+    """
+    Process-local task list cache.
+
+    Keeps up to max_users snapshots, evicting the least recently used.
+    Each entry also expires after ttl_seconds, which bounds staleness
+    when several worker processes each hold their own copy (writes only
+    invalidate the cache of the process that served them).
+
+    Thread-safe: sync routes run in Starlette's threadpool.
+    """
+
+    def __init__(self, max_users: int = 1024, ttl_seconds: float = 60):
+        """
+        Initialize cache.
+
+        Args:
+            max_users: Maximum number of user snapshots kept
+            ttl_seconds: Maximum age of a snapshot
+        """
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple[float, Optional[str], List[Task], int]]" = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, version: Optional[str] = None) -> Optional[List[Task]]:
+        """Get a user's cached task list (None on a miss or version mismatch)."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                expires_at, cached_version, tasks, _ = entry
+                if time.monotonic() >= expires_at:
+                    self._remove(user_id)
+                elif version is None or version == cached_version:
+                    self._entries.move_to_end(user_id)
+                    self.hits += 1
+                    return list(tasks)
+            self.misses += 1
+            return None
+
+    def set(self, user_id: str, tasks: List[Task], version: Optional[str] = None) -> None:
+        """Store a user's task list, evicting the oldest users if full."""
+        if self.max_users <= 0:
+            return
+
+        size = sum(_approx_size(task) for task in tasks)
+        expires_at = time.monotonic() + self.ttl_seconds
+
+        with self._lock:
+            self._remove(user_id)
+            self._entries[user_id] = (expires_at, version, list(tasks), size)
+            self._bytes += size
+            while len(self._entries) > self.max_users:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached task list."""
+        with self._lock:
+            self._remove(user_id)
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Get cache metrics.
+
+        Returns:
+            dict with backend, users, tasks, approx_bytes, hits, misses
+            and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "users": len(self._entries),
+                "tasks": sum(len(entry[2]) for entry in self._entries.values()),
+                "approx_bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, user_id: str) -> None:
+        """Remove an entry (caller holds the lock)."""
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            self._bytes -= entry[3]
@@ -0,0 +1,119 @@
+"""
+Redis Task Cache
+
+TaskCache implementation backed by a Redis-compatible server, shared by
+all worker processes.
+"""
+
+import json
+import threading
+from datetime import datetime
+from typing import List, Optional
+
+from app.application.interfaces.task_cache import TaskCache
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus
+
+
+def _encode(tasks: List[Task], version: Optional[str]) -> str:
+    """Serialize a task list and its version to JSON."""
+    return json.dumps({"version": version, "tasks": [
+        [
+            task.id,
+            task.title,
+            task.description,
+            task.status.is_completed(),
+            task.created_at.isoformat(),
+            task.updated_at.isoformat(),
+        ]
+        for task in tasks
+    ]})
+
+
+def _decode(tasks: list) -> List[Task]:
+    """Deserialize the tasks of a snapshot (written by _encode, not revalidated)."""
+    return [
+        Task.from_storage(
+            id=task_id,
+            title=title,
+            description=description,
+            status=TaskStatus.COMPLETED if completed else TaskStatus.PENDING,
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+        )
+        for task_id, title, description, completed, created_at, updated_at
+        in tasks
+    ]
+
+
+class RedisTaskCache(TaskCache):
+    """
+    Task list cache stored in Redis.
+
+    Works with any client exposing redis-py's get/set(ex=...)/delete,
+    e.g. redis.Redis.from_url(...). Invalidation is visible to every
+    process sharing the server; ttl_seconds bounds the lifetime of a
+    snapshot.
+
+    Hit/miss counters are per process.
+    """
+
+    blocking = True  # Network round trips
+
+    def __init__(self, client, ttl_seconds: int = 60, key_prefix: str = "tasks:"):
+        """
+        Initialize cache.
+
+        Args:
+            client: Redis-compatible client
+            ttl_seconds: Snapshot expiry
+            key_prefix: Prefix for per-user keys
+        """
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _key(self, user_id: str) -> str:
+        """Get the Redis key for a user's snapshot."""
+        return f"{self.key_prefix}{user_id}"
+
+    def get(self, user_id: str, version: Optional[str] = None) -> Optional[List[Task]]:
+        """Get a user's cached task list (None on a miss or version mismatch)."""
+        data = self.client.get(self._key(user_id))
+        snapshot = json.loads(data) if data is not None else None
+        hit = snapshot is not None and version in (None, snapshot["version"])
+        with self._lock:
+            if not hit:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _decode(snapshot["tasks"])
+
+    def set(self, user_id: str, tasks: List[Task], version: Optional[str] = None) -> None:
+        """Store a user's task list."""
+        self.client.set(
+            self._key(user_id), _encode(tasks, version), ex=self.ttl_seconds
+        )
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop a user's cached task list."""
+        self.client.delete(self._key(user_id))
+
+    def stats(self) -> dict:
+        """
+        Get cache metrics (memory usage lives on the Redis server).
+
+        Returns:
+            dict with backend, hits, misses and hit_ratio
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "redis",
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
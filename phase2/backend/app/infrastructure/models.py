@@ -45,6 +45,9 @@ class TaskDB(SQLModel, table=True):
     """
 
     __tablename__ = "tasks"
+    # IDs are never reused (as with PostgreSQL SERIAL), so max(id) in the
+    # task list version rises on every insert, even after a delete
+    __table_args__ = {"sqlite_autoincrement": True}
 
     # Primary key
     id: Optional[int] = Field(
@@ -88,6 +91,14 @@ class TaskDB(SQLModel, table=True):
         description="Last update timestamp"
     )
 
+    # Incremented in SQL by every update, so the task list version
+    # doesn't depend on worker clocks (see task_queries.version_statement)
+    revision: int = Field(
+        default=1,
+        sa_column_kwargs={"server_default": "1"},
+        description="Row revision, bumped on every update"
+    )
+
     class Config:
         """SQLModel configuration."""
         schema_extra = {
@@ -5,5 +5,12 @@ Concrete implementations of repository interfaces.
 """
 
 from .postgresql_task_repository import PostgreSQLTaskRepository
+from .async_postgresql_task_repository import AsyncPostgreSQLTaskRepository
+from .caching_task_repository import AsyncCachingTaskRepository, CachingTaskRepository
 
-__all__ = ["PostgreSQLTaskRepository"]
+__all__ = [
+    "PostgreSQLTaskRepository",
+    "AsyncPostgreSQLTaskRepository",
+    "CachingTaskRepository",
+    "AsyncCachingTaskRepository",
+]
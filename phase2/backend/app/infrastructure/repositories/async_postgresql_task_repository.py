@@ -0,0 +1,407 @@
+"""
+Async PostgreSQL Task Repository Implementation
+
+Concrete implementation of AsyncTaskRepository using SQLModel's AsyncSession.
+Issues the same user-scoped SQL as PostgreSQLTaskRepository, but awaits
+the database instead of blocking a worker thread.
+"""
+
+from typing import Optional, List
+from datetime import datetime
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import TaskPage
+from app.domain.entities.task import Task
+from app.domain.exceptions import TaskNotFoundError
+from app.infrastructure.models import TaskDB
+from app.infrastructure.repositories.task_queries import (
+    delete_many_statement,
+    delete_returning_statement,
+    filtered_statement,
+    format_version,
+    insert_many_statement,
+    new_task_values,
+    page_statement,
+    rows_statement,
+    set_completed_many_statement,
+    to_domain,
+    update_returning_statement,
+    version_statement,
+)
+
+
+class AsyncPostgreSQLTaskRepository(AsyncTaskRepository):
+    """
+    Async PostgreSQL implementation of AsyncTaskRepository.
+
+    This repository is user-scoped - all queries automatically filter by user_id.
+    Ensures complete data isolation between users.
+
+    Attributes:
+        session: SQLModel async database session
+        user_id: Authenticated user ID (all queries filtered by this)
+    """
+
+    def __init__(self, session: AsyncSession, user_id: str, autocommit: bool = True):
+        """
+        Initialize repository with async database session and user context.
+
+        Args:
+            session: SQLModel async database session
+            user_id: Authenticated user ID (from JWT)
+            autocommit: Commit after every write. Pass False to only flush,
+                leaving the caller to commit several writes as one transaction
+
+        Example:
+            repo = AsyncPostgreSQLTaskRepository(db_session, "user-123")
+            tasks = await repo.get_all()  # Only returns tasks for user-123
+        """
+        self.session = session
+        self.user_id = user_id
+        self.autocommit = autocommit
+
+    async def add(self, task: Task) -> Task:
+        """
+        Add a new task to database.
+
+        Persists it with a single INSERT ... RETURNING (no refresh
+        SELECT afterwards), like the sync repository.
+
+        Args:
+            task: Domain Task entity to add
+
+        Returns:
+            Task: Added task with database-generated ID
+
+        Note:
+            - user_id is automatically set from repository context
+            - ID from task parameter is ignored (database generates new ID)
+        """
+        result = await self.session.execute(
+            insert_many_statement(),
+            [new_task_values(self.user_id, task)],  # user_id set from context
+        )
+        # Map before commit, which expires the returned row
+        added = to_domain(result.scalars().one())
+        await self._commit()
+        return added
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Get task by ID if it belongs to authenticated user.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task if found and belongs to user, None otherwise
+        """
+        db_task = await self._get_db_task(task_id)
+
+        if db_task is None:
+            return None
+
+        return to_domain(db_task)
+
+    async def get_all(self) -> List[Task]:
+        """
+        Get all tasks for authenticated user, newest first.
+
+        Returns:
+            List of Task entities belonging to user (may be empty)
+        """
+        return await self.get_filtered(TaskFilter())
+
+    async def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """
+        Get tasks for authenticated user matching a filter, newest first.
+
+        Args:
+            task_filter: Criteria tasks must match
+
+        Returns:
+            List of matching Task entities (may be empty)
+        """
+        statement = filtered_statement(self.user_id, task_filter).order_by(
+            TaskDB.created_at.desc()  # Newest first
+        )
+        result = await self.session.exec(statement)
+
+        return [to_domain(task) for task in result.all()]
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """
+        Get one page of tasks for authenticated user using keyset pagination.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        statement = page_statement(self.user_id, limit, cursor, task_filter)
+        result = await self.session.exec(statement)
+
+        return TaskPage.from_rows([to_domain(task) for task in result.all()], limit)
+
+    async def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """
+        Get tasks as read-only rows for serialization, newest first.
+
+        Args:
+            limit: Page size (optional; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of rows (see task_queries.rows_statement)
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        statement = rows_statement(self.user_id, limit, cursor, task_filter)
+        result = await self.session.execute(statement)
+        rows = result.all()
+
+        if limit is None and cursor is None:
+            return TaskPage(tasks=rows)
+        return TaskPage.from_rows(rows, limit)
+
+    async def get_list_version(self) -> str:
+        """
+        Get a version tag for the authenticated user's task list.
+
+        Returns:
+            Opaque version string (see task_queries.version_statement)
+        """
+        result = await self.session.exec(version_statement(self.user_id))
+        return format_version(*result.one())
+
+    async def update(self, task: Task) -> Task:
+        """
+        Update existing task if it belongs to authenticated user.
+
+        Args:
+            task: Domain Task entity with updated values
+
+        Returns:
+            Updated Task entity
+
+        Raises:
+            TaskNotFoundError: If task doesn't exist or belongs to another user
+        """
+        db_task = await self._get_db_task(task.id)
+
+        if db_task is None:
+            raise TaskNotFoundError(f"Task {task.id} not found")
+
+        db_task.title = task.title
+        db_task.description = task.description
+        db_task.completed = task.status.is_completed()
+        db_task.updated_at = datetime.utcnow()
+        db_task.revision = TaskDB.revision + 1  # Incremented in SQL
+
+        self.session.add(db_task)
+        await self._commit()
+        await self.session.refresh(db_task)
+
+        return to_domain(db_task)
+
+    async def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """
+        Set completion status in a single UPDATE ... RETURNING round trip.
+
+        Args:
+            task_id: Task identifier
+            completed: New completion status
+
+        Returns:
+            Updated Task, or None if not found or doesn't belong to user
+        """
+        return await self._update_returning(task_id, {"completed": completed})
+
+    async def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """
+        Update the given fields in a single UPDATE ... RETURNING round trip.
+
+        Values must already be validated (see Task.validate_changes).
+
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+
+        Returns:
+            Updated Task, or None if not found or doesn't belong to user
+        """
+        values = {}
+        if title is not None:
+            values["title"] = title
+        if description is not None:
+            values["description"] = description
+
+        return await self._update_returning(task_id, values)
+
+    async def delete(self, task_id: int) -> bool:
+        """
+        Delete task if it belongs to authenticated user.
+
+        Runs a single DELETE ... RETURNING id.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if deleted, False if not found or doesn't belong to user
+        """
+        statement = delete_returning_statement(self.user_id, task_id)
+        result = await self.session.execute(statement)
+        deleted_id = result.scalar_one_or_none()
+        await self._commit()
+        return deleted_id is not None
+
+    async def add_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        Add several tasks with one multi-row INSERT ... RETURNING.
+
+        Args:
+            tasks: Domain Task entities to add (IDs are ignored)
+
+        Returns:
+            Added tasks with database-generated IDs, in input order
+        """
+        if not tasks:
+            return []
+
+        result = await self.session.execute(
+            insert_many_statement(),
+            [new_task_values(self.user_id, task) for task in tasks],
+        )
+        added = [to_domain(db_task) for db_task in result.scalars().all()]
+        await self._commit()
+        return added
+
+    async def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """
+        Set completion status of several tasks with one UPDATE ... RETURNING.
+
+        Args:
+            task_ids: Task identifiers
+            completed: New completion status
+
+        Returns:
+            Updated tasks (IDs that don't exist or belong to another
+            user are absent), in no particular order
+        """
+        if not task_ids:
+            return []
+
+        statement = set_completed_many_statement(self.user_id, task_ids, completed)
+        result = await self.session.execute(statement)
+        updated = [to_domain(db_task) for db_task in result.scalars().all()]
+        await self._commit()
+        return updated
+
+    async def delete_many(self, task_ids: List[int]) -> List[int]:
+        """
+        Delete several tasks with one DELETE ... RETURNING id.
+
+        Args:
+            task_ids: Task identifiers
+
+        Returns:
+            IDs that were actually deleted
+        """
+        if not task_ids:
+            return []
+
+        result = await self.session.execute(delete_many_statement(self.user_id, task_ids))
+        deleted = list(result.scalars().all())
+        await self._commit()
+        return deleted
+
+    async def exists(self, task_id: int) -> bool:
+        """
+        Check if task exists and belongs to authenticated user.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if task exists and belongs to user, False otherwise
+        """
+        return await self._get_db_task(task_id) is not None
+
+    async def get_next_id(self) -> int:
+        """
+        Get next available task ID.
+
+        Returns:
+            Always 0 (database generates IDs automatically)
+        """
+        return 0
+
+    async def _commit(self) -> None:
+        """Commit the write, or only flush it when autocommit is off."""
+        if self.autocommit:
+            await self.session.commit()
+        else:
+            await self.session.flush()
+
+    async def _update_returning(self, task_id: int, values: dict) -> Optional[Task]:
+        """
+        Run an UPDATE ... RETURNING for one task and commit (or flush).
+
+        Args:
+            task_id: Task identifier
+            values: Column values to set
+
+        Returns:
+            Updated Task, or None if no row matched
+        """
+        statement = update_returning_statement(self.user_id, task_id, values)
+        result = await self.session.execute(statement)
+        db_task = result.scalar_one_or_none()
+        task = to_domain(db_task) if db_task is not None else None
+        await self._commit()
+        return task
+
+    async def _get_db_task(self, task_id: int) -> Optional[TaskDB]:
+        """
+        Fetch the TaskDB row for task_id, scoped to the user.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            TaskDB if found and belongs to user, None otherwise
+        """
+        statement = select(TaskDB).where(
+            TaskDB.id == task_id,
+            TaskDB.user_id == self.user_id  # Critical: user_id filter
+        )
+        result = await self.session.exec(statement)
+        return result.first()
@@ -0,0 +1,395 @@
+"""
+Caching Task Repository
+
+Read-through decorators around a TaskRepository / AsyncTaskRepository
+that serve the full task list from a per-user TaskCache and invalidate
+it on every write.
+"""
+
+import asyncio
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import event
+
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
+from app.application.interfaces.task_cache import TaskCache
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import TaskPage
+from app.application.interfaces.task_repository import TaskRepository
+from app.application.interfaces.task_row import TaskRow, task_from_row
+from app.domain.entities.task import Task
+
+
+def _snapshot_page(tasks: List[Task]) -> TaskPage:
+    """The full list from a snapshot, as get_rows returns it."""
+    return TaskPage(tasks=[TaskRow.from_task(task) for task in tasks])
+
+
+class CachingTaskRepository(TaskRepository):
+    """
+    TaskRepository decorator caching each user's task list.
+
+    Only the full, unfiltered list is cached: get_all() and get_rows()
+    without arguments. Filtered and paged reads (get_filtered, get_page,
+    get_rows with arguments) and single-task reads go straight to the
+    wrapped repository, so they keep its SQL filtering and keyset
+    queries. Every write is delegated and then drops the snapshot.
+
+    Snapshots are stored under the list version (get_list_version())
+    and only reused while it is current, so a list read never returns
+    data older than the database, even if another process wrote since
+    the snapshot was taken. The version is read once per repository:
+    a caller that already asked for it (e.g. for an ETag) pays nothing
+    extra, any other read pays one aggregate query instead of loading
+    the list.
+
+    When the wrapped repository doesn't commit its own writes
+    (autocommit=False), the snapshot is dropped again after the session
+    commits or rolls back, so a read between the write and the end of
+    the transaction can't leave uncommitted rows cached.
+
+    Attributes:
+        inner: Wrapped user-scoped repository
+        cache: Task list cache
+        user_id: User the wrapped repository is scoped to
+    """
+
+    def __init__(self, inner: TaskRepository, cache: TaskCache, user_id: str):
+        """
+        Initialize decorator.
+
+        Args:
+            inner: User-scoped repository to wrap
+            cache: Task list cache
+            user_id: User the wrapped repository is scoped to
+
+        Example:
+            repo = CachingTaskRepository(
+                PostgreSQLTaskRepository(session, "user-123"),
+                get_task_cache(),
+                "user-123",
+            )
+        """
+        self.inner = inner
+        self.cache = cache
+        self.user_id = user_id
+        self._invalidate_on_commit = False
+        self._version: Optional[str] = None
+
+    def get_all(self) -> List[Task]:
+        """Get all tasks, from the cache when the snapshot is current."""
+        return self._snapshot()
+
+    def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """Get tasks matching a filter (not cached)."""
+        return self.inner.get_filtered(task_filter)
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get one page of tasks (not cached)."""
+        return self.inner.get_page(limit, cursor, task_filter)
+
+    def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get tasks as rows; the full list from the cache when current."""
+        if limit is not None or cursor is not None or task_filter is not None:
+            return self.inner.get_rows(limit, cursor, task_filter)
+        return _snapshot_page(self._snapshot())
+
+    def _snapshot(self) -> List[Task]:
+        """The user's full list: the current snapshot, else loaded and stored."""
+        if self._version is None:
+            self._version = self.inner.get_list_version()
+        tasks = self.cache.get(self.user_id, self._version)
+        if tasks is None:
+            # Rows are cheaper to load than ORM entities
+            tasks = [task_from_row(row) for row in self.inner.get_rows().tasks]
+            self.cache.set(self.user_id, tasks, self._version)
+        return tasks
+
+    def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Get task by ID (not cached)."""
+        return self.inner.get_by_id(task_id)
+
+    def exists(self, task_id: int) -> bool:
+        """Check if task exists (not cached)."""
+        return self.inner.exists(task_id)
+
+    def get_list_version(self) -> str:
+        """Get the task list version (not cached); snapshots are checked against it."""
+        self._version = self.inner.get_list_version()
+        return self._version
+
+    def get_next_id(self) -> int:
+        """Get next available ID."""
+        return self.inner.get_next_id()
+
+    def add(self, task: Task) -> Task:
+        """Add a task and invalidate the cache."""
+        try:
+            return self.inner.add(task)
+        finally:
+            self._invalidate()
+
+    def update(self, task: Task) -> Task:
+        """Update a task and invalidate the cache."""
+        try:
+            return self.inner.update(task)
+        finally:
+            self._invalidate()
+
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set a task's completion status and invalidate the cache."""
+        try:
+            return self.inner.set_completed(task_id, completed)
+        finally:
+            self._invalidate()
+
+    def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Update the given fields of a task and invalidate the cache."""
+        try:
+            return self.inner.patch(task_id, title=title, description=description)
+        finally:
+            self._invalidate()
+
+    def delete(self, task_id: int) -> bool:
+        """Delete a task and invalidate the cache."""
+        try:
+            return self.inner.delete(task_id)
+        finally:
+            self._invalidate()
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """Delete a task, return it and invalidate the cache."""
+        try:
+            return self.inner.remove(task_id)
+        finally:
+            self._invalidate()
+
+    def add_many(self, tasks: List[Task]) -> List[Task]:
+        """Add several tasks and invalidate the cache."""
+        try:
+            return self.inner.add_many(tasks)
+        finally:
+            self._invalidate()
+
+    def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """Set the completion status of several tasks and invalidate the cache."""
+        try:
+            return self.inner.set_completed_many(task_ids, completed)
+        finally:
+            self._invalidate()
+
+    def delete_many(self, task_ids: List[int]) -> List[int]:
+        """Delete several tasks and invalidate the cache."""
+        try:
+            return self.inner.delete_many(task_ids)
+        finally:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the user's snapshot, and again when a pending write commits or rolls back."""
+        self._version = None
+        self.cache.invalidate(self.user_id)
+
+        session = getattr(self.inner, "session", None)
+        if (
+            session is not None
+            and not getattr(self.inner, "autocommit", True)
+            and not self._invalidate_on_commit
+        ):
+            self._invalidate_on_commit = True
+            for name in ("after_commit", "after_rollback"):
+                event.listen(session, name, self._on_transaction_end, once=True)
+
+    def _on_transaction_end(self, session) -> None:
+        """Drop the snapshot once pending writes are committed or rolled back."""
+        self._invalidate_on_commit = False
+        self.cache.invalidate(self.user_id)
+
+
+class AsyncCachingTaskRepository(AsyncTaskRepository):
+    """
+    AsyncTaskRepository decorator caching each user's task list.
+
+    Same behavior as CachingTaskRepository, on the same cache, so the
+    sync and async paths (REST routes, MCP tools) share snapshots and
+    invalidate each other's. Operations of a blocking cache (Redis) run
+    in a worker thread.
+
+    Attributes:
+        inner: Wrapped user-scoped repository
+        cache: Task list cache
+        user_id: User the wrapped repository is scoped to
+    """
+
+    def __init__(self, inner: AsyncTaskRepository, cache: TaskCache, user_id: str):
+        """
+        Initialize decorator.
+
+        Args:
+            inner: User-scoped repository to wrap
+            cache: Task list cache
+            user_id: User the wrapped repository is scoped to
+        """
+        self.inner = inner
+        self.cache = cache
+        self.user_id = user_id
+        self._invalidate_on_commit = False
+        self._version: Optional[str] = None
+
+    async def get_all(self) -> List[Task]:
+        """Get all tasks, from the cache when the snapshot is current."""
+        return await self._snapshot()
+
+    async def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """Get tasks matching a filter (not cached)."""
+        return await self.inner.get_filtered(task_filter)
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get one page of tasks (not cached)."""
+        return await self.inner.get_page(limit, cursor, task_filter)
+
+    async def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """Get tasks as rows; the full list from the cache when current."""
+        if limit is not None or cursor is not None or task_filter is not None:
+            return await self.inner.get_rows(limit, cursor, task_filter)
+        return _snapshot_page(await self._snapshot())
+
+    async def get_by_id(self, task_id: int) -> Optional[Task]:
+        """Get task by ID (not cached)."""
+        return await self.inner.get_by_id(task_id)
+
+    async def exists(self, task_id: int) -> bool:
+        """Check if task exists (not cached)."""
+        return await self.inner.exists(task_id)
+
+    async def get_list_version(self) -> str:
+        """Get the task list version (not cached); snapshots are checked against it."""
+        self._version = await self.inner.get_list_version()
+        return self._version
+
+    async def get_next_id(self) -> int:
+        """Get next available ID."""
+        return await self.inner.get_next_id()
+
+    async def add(self, task: Task) -> Task:
+        """Add a task and invalidate the cache."""
+        try:
+            return await self.inner.add(task)
+        finally:
+            await self._invalidate()
+
+    async def update(self, task: Task) -> Task:
+        """Update a task and invalidate the cache."""
+        try:
+            return await self.inner.update(task)
+        finally:
+            await self._invalidate()
+
+    async def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """Set a task's completion status and invalidate the cache."""
+        try:
+            return await self.inner.set_completed(task_id, completed)
+        finally:
+            await self._invalidate()
+
+    async def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """Update the given fields of a task and invalidate the cache."""
+        try:
+            return await self.inner.patch(task_id, title=title, description=description)
+        finally:
+            await self._invalidate()
+
+    async def delete(self, task_id: int) -> bool:
+        """Delete a task and invalidate the cache."""
+        try:
+            return await self.inner.delete(task_id)
+        finally:
+            await self._invalidate()
+
+    async def add_many(self, tasks: List[Task]) -> List[Task]:
+        """Add several tasks and invalidate the cache."""
+        try:
+            return await self.inner.add_many(tasks)
+        finally:
+            await self._invalidate()
+
+    async def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """Set the completion status of several tasks and invalidate the cache."""
+        try:
+            return await self.inner.set_completed_many(task_ids, completed)
+        finally:
+            await self._invalidate()
+
+    async def delete_many(self, task_ids: List[int]) -> List[int]:
+        """Delete several tasks and invalidate the cache."""
+        try:
+            return await self.inner.delete_many(task_ids)
+        finally:
+            await self._invalidate()
+
+    async def _snapshot(self) -> List[Task]:
+        """The user's full list: the current snapshot, else loaded and stored."""
+        if self._version is None:
+            self._version = await self.inner.get_list_version()
+        tasks = await self._cache_call(self.cache.get, self.user_id, self._version)
+        if tasks is None:
+            tasks = [task_from_row(row) for row in (await self.inner.get_rows()).tasks]
+            await self._cache_call(self.cache.set, self.user_id, tasks, self._version)
+        return tasks
+
+    async def _cache_call(self, method: Callable[..., Any], *args) -> Any:
+        """Run a cache operation, off the event loop if the cache blocks."""
+        if self.cache.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def _invalidate(self) -> None:
+        """Drop the user's snapshot, and again when a pending write commits or rolls back."""
+        self._version = None
+        await self._cache_call(self.cache.invalidate, self.user_id)
+
+        session = getattr(self.inner, "session", None)
+        if (
+            session is not None
+            and not getattr(self.inner, "autocommit", True)
+            and not self._invalidate_on_commit
+        ):
+            # Session events fire on the AsyncSession's underlying Session
+            self._invalidate_on_commit = True
+            for name in ("after_commit", "after_rollback"):
+                event.listen(session.sync_session, name, self._on_transaction_end, once=True)
+
+    def _on_transaction_end(self, session) -> None:
+        """Drop the snapshot once pending writes are committed or rolled back."""
+        self._invalidate_on_commit = False
+        self.cache.invalidate(self.user_id)
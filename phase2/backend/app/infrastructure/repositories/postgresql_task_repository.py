@@ -9,11 +9,27 @@ from typing import Optional, List
 from datetime import datetime
 from sqlmodel import Session, select
 
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import TaskPage
 from app.application.interfaces.task_repository import TaskRepository
 from app.domain.entities.task import Task
-from app.domain.value_objects.task_status import TaskStatus
 from app.domain.exceptions import TaskNotFoundError
 from app.infrastructure.models import TaskDB
+from app.infrastructure.repositories.task_queries import (
+    delete_many_statement,
+    delete_returning_statement,
+    filtered_statement,
+    format_version,
+    insert_many_statement,
+    new_task_values,
+    page_statement,
+    remove_returning_statement,
+    rows_statement,
+    set_completed_many_statement,
+    to_domain,
+    update_returning_statement,
+    version_statement,
+)
 
 
 class PostgreSQLTaskRepository(TaskRepository):
@@ -28,13 +44,15 @@ class PostgreSQLTaskRepository(TaskRepository):
         user_id: Authenticated user ID (all queries filtered by this)
     """
 
-    def __init__(self, session: Session, user_id: str):
+    def __init__(self, session: Session, user_id: str, autocommit: bool = True):
         """
         Initialize repository with database session and user context.
 
         Args:
             session: SQLModel database session
             user_id: Authenticated user ID (from JWT)
+            autocommit: Commit after every write. Pass False to only flush,
+                leaving the caller to commit several writes as one transaction
 
         Example:
             repo = PostgreSQLTaskRepository(db_session, "user-123")
@@ -42,13 +60,15 @@ class PostgreSQLTaskRepository(TaskRepository):
         """
         self.session = session
         self.user_id = user_id
+        self.autocommit = autocommit
 
     def add(self, task: Task) -> Task:
         """
         Add a new task to database.
 
-        Converts domain Task entity to TaskDB model,
-        automatically sets user_id, and persists to database.
+        Converts domain Task entity to column values, automatically sets
+        user_id, and persists it with a single INSERT ... RETURNING (no
+        refresh SELECT afterwards).
 
         Args:
             task: Domain Task entity to add
@@ -61,23 +81,14 @@ class PostgreSQLTaskRepository(TaskRepository):
             - ID from task parameter is ignored (database generates new ID)
             - created_at and updated_at are set by database
         """
-        # Convert domain entity to database model
-        db_task = TaskDB(
-            user_id=self.user_id,  # Automatically set from context
-            title=task.title,
-            description=task.description,
-            completed=task.status.is_completed(),
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+        result = self.session.execute(
+            insert_many_statement(),
+            [new_task_values(self.user_id, task)],  # user_id set from context
         )
-
-        # Add to session and flush to get ID
-        self.session.add(db_task)
-        self.session.commit()
-        self.session.refresh(db_task)
-
-        # Convert back to domain entity
-        return self._to_domain(db_task)
+        # Map before commit, which expires the returned row
+        added = self._to_domain(result.scalars().one())
+        self._commit()
+        return added
 
     def get_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -130,6 +141,112 @@ class PostgreSQLTaskRepository(TaskRepository):
 
         return [self._to_domain(task) for task in db_tasks]
 
+    def get_filtered(self, task_filter: TaskFilter) -> List[Task]:
+        """
+        Get tasks for authenticated user matching a filter.
+
+        Filter criteria are translated into WHERE clauses so only
+        matching rows leave the database. A status filter is served by
+        the idx_tasks_user_completed (user_id, completed) index.
+
+        Args:
+            task_filter: Criteria tasks must match
+
+        Returns:
+            List of matching Task entities, newest first (may be empty)
+
+        Security:
+            - ALL queries filter by user_id
+        """
+        statement = filtered_statement(self.user_id, task_filter).order_by(
+            TaskDB.created_at.desc()  # Newest first
+        )
+        db_tasks = self.session.exec(statement).all()
+
+        return [self._to_domain(task) for task in db_tasks]
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """
+        Get one page of tasks for authenticated user using keyset pagination.
+
+        Seeks past the cursor position with a row comparison on
+        (created_at, id) instead of OFFSET, so every page costs the same
+        regardless of depth. Ordering follows idx_tasks_user_created,
+        with id as a tie-breaker for equal timestamps.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage with the tasks and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        Security:
+            - ALL queries filter by user_id
+        """
+        statement = page_statement(self.user_id, limit, cursor, task_filter)
+        db_tasks = self.session.exec(statement).all()
+
+        return TaskPage.from_rows([self._to_domain(task) for task in db_tasks], limit)
+
+    def get_rows(
+        self,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        task_filter: Optional[TaskFilter] = None,
+    ) -> TaskPage:
+        """
+        Get tasks as read-only rows for serialization, newest first.
+
+        Selects only the listed columns as Core rows (TaskRow fields),
+        skipping ORM entities and domain validation. Keyset paginated
+        like get_page when limit or cursor is given.
+
+        Args:
+            limit: Page size (optional; None lists everything)
+            cursor: Cursor from the previous page (optional)
+            task_filter: Criteria tasks must match (optional)
+
+        Returns:
+            TaskPage of rows and the cursor for the next page
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+
+        Security:
+            - ALL queries filter by user_id
+        """
+        statement = rows_statement(self.user_id, limit, cursor, task_filter)
+        rows = self.session.execute(statement).all()
+
+        if limit is None and cursor is None:
+            return TaskPage(tasks=rows)
+        return TaskPage.from_rows(rows, limit)
+
+    def get_list_version(self) -> str:
+        """
+        Get a version tag for the authenticated user's task list.
+
+        One aggregate query (count, max(id), sum(revision)); no task
+        rows are loaded.
+
+        Returns:
+            Opaque version string
+
+        Security:
+            - Query filters by user_id
+        """
+        return format_version(*self.session.exec(version_statement(self.user_id)).one())
+
     def update(self, task: Task) -> Task:
         """
         Update existing task if it belongs to authenticated user.
@@ -162,18 +279,69 @@ class PostgreSQLTaskRepository(TaskRepository):
         db_task.description = task.description
         db_task.completed = task.status.is_completed()
         db_task.updated_at = datetime.utcnow()
+        db_task.revision = TaskDB.revision + 1  # Incremented in SQL
 
         # Commit changes
         self.session.add(db_task)
-        self.session.commit()
+        self._commit()
         self.session.refresh(db_task)
 
         return self._to_domain(db_task)
 
+    def set_completed(self, task_id: int, completed: bool) -> Optional[Task]:
+        """
+        Set completion status in a single UPDATE ... RETURNING round trip.
+
+        Args:
+            task_id: Task identifier
+            completed: New completion status
+
+        Returns:
+            Updated Task, or None if not found or doesn't belong to user
+
+        Security:
+            - UPDATE filters by both task_id AND user_id
+        """
+        return self._update_returning(task_id, {"completed": completed})
+
+    def patch(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+    ) -> Optional[Task]:
+        """
+        Update the given fields in a single UPDATE ... RETURNING round trip.
+
+        Values must already be validated (see Task.validate_changes).
+        Fields left as None are not changed.
+
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+
+        Returns:
+            Updated Task, or None if not found or doesn't belong to user
+
+        Security:
+            - UPDATE filters by both task_id AND user_id
+        """
+        values = {}
+        if title is not None:
+            values["title"] = title
+        if description is not None:
+            values["description"] = description
+
+        return self._update_returning(task_id, values)
+
     def delete(self, task_id: int) -> bool:
         """
         Delete task if it belongs to authenticated user.
 
+        Runs a single DELETE ... RETURNING id, so no SELECT is needed
+        to find out whether the task existed.
+
         Args:
             task_id: Task identifier
 
@@ -184,18 +352,92 @@ class PostgreSQLTaskRepository(TaskRepository):
             - Filters by both task_id AND user_id
             - Cannot delete other users' tasks
         """
-        statement = select(TaskDB).where(
-            TaskDB.id == task_id,
-            TaskDB.user_id == self.user_id  # Critical: user_id filter
+        statement = delete_returning_statement(self.user_id, task_id)
+        deleted_id = self.session.execute(statement).scalar_one_or_none()
+        self._commit()
+        return deleted_id is not None
+
+    def remove(self, task_id: int) -> Optional[Task]:
+        """
+        Delete task if it belongs to authenticated user and return it.
+
+        Runs a single DELETE ... RETURNING; the row is mapped to a
+        domain Task before commit expires it.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Deleted Task, or None if not found or doesn't belong to user
+
+        Security:
+            - Filters by both task_id AND user_id
+        """
+        statement = remove_returning_statement(self.user_id, task_id)
+        db_task = self.session.execute(statement).scalar_one_or_none()
+        task = self._to_domain(db_task) if db_task is not None else None
+        self._commit()
+        return task
+
+    def add_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        Add several tasks with one multi-row INSERT ... RETURNING.
+
+        Args:
+            tasks: Domain Task entities to add (IDs are ignored)
+
+        Returns:
+            Added tasks with database-generated IDs, in input order
+        """
+        if not tasks:
+            return []
+
+        result = self.session.execute(
+            insert_many_statement(),
+            [new_task_values(self.user_id, task) for task in tasks],
         )
-        db_task = self.session.exec(statement).first()
+        added = [to_domain(db_task) for db_task in result.scalars().all()]
+        self._commit()
+        return added
 
-        if db_task is None:
-            return False
+    def set_completed_many(self, task_ids: List[int], completed: bool) -> List[Task]:
+        """
+        Set completion status of several tasks with one UPDATE ... RETURNING.
+
+        Args:
+            task_ids: Task identifiers
+            completed: New completion status
+
+        Returns:
+            Updated tasks (IDs that don't exist or belong to another
+            user are absent), in no particular order
+        """
+        if not task_ids:
+            return []
+
+        statement = set_completed_many_statement(self.user_id, task_ids, completed)
+        result = self.session.execute(statement)
+        updated = [to_domain(db_task) for db_task in result.scalars().all()]
+        self._commit()
+        return updated
+
+    def delete_many(self, task_ids: List[int]) -> List[int]:
+        """
+        Delete several tasks with one DELETE ... RETURNING id.
+
+        Args:
+            task_ids: Task identifiers
 
-        self.session.delete(db_task)
-        self.session.commit()
-        return True
+        Returns:
+            IDs that were actually deleted
+        """
+        if not task_ids:
+            return []
+
+        result = self.session.execute(delete_many_statement(self.user_id, task_ids))
+        deleted = list(result.scalars().all())
+        self._commit()
+        return deleted
 
     def exists(self, task_id: int) -> bool:
         """
@@ -232,7 +474,35 @@ class PostgreSQLTaskRepository(TaskRepository):
         # This method exists for interface compatibility but is not used
         return 0
 
-    # Helper methods for domain ↔ database mapping
+    # Helper methods for atomic writes and domain ↔ database mapping
+
+    def _commit(self) -> None:
+        """Commit the write, or only flush it when autocommit is off."""
+        if self.autocommit:
+            self.session.commit()
+        else:
+            self.session.flush()
+
+    def _update_returning(self, task_id: int, values: dict) -> Optional[Task]:
+        """
+        Run an UPDATE ... RETURNING for one task and commit (or flush).
+
+        The returned row is mapped to a domain Task before commit,
+        because commit expires ORM instances and reading them
+        afterwards would cost another SELECT.
+
+        Args:
+            task_id: Task identifier
+            values: Column values to set
+
+        Returns:
+            Updated Task, or None if no row matched
+        """
+        statement = update_returning_statement(self.user_id, task_id, values)
+        db_task = self.session.execute(statement).scalar_one_or_none()
+        task = self._to_domain(db_task) if db_task is not None else None
+        self._commit()
+        return task
 
     def _to_domain(self, db_task: TaskDB) -> Task:
         """
@@ -249,19 +519,7 @@ class PostgreSQLTaskRepository(TaskRepository):
         Returns:
             Domain Task entity
         """
-        status = (
-            TaskStatus.COMPLETED
-            if db_task.completed
-            else TaskStatus.PENDING
-        )
-
-        return Task(
-            id=db_task.id,
-            title=db_task.title,
-            description=db_task.description or "",
-            status=status,
-            created_at=db_task.created_at
-        )
+        return to_domain(db_task)
 
     def _to_db(self, task: Task) -> TaskDB:
         """
@@ -0,0 +1,357 @@
+"""
+Task Query Builders
+
+Statement builders and row mapping shared by the sync and async
+PostgreSQL task repositories, so both paths issue identical SQL.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, tuple_, update
+from sqlmodel import select
+
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import decode_cursor
+from app.domain.entities.task import Task
+from app.domain.value_objects.task_status import TaskStatus
+from app.infrastructure.models import TaskDB
+
+
+def filtered_statement(user_id: str, task_filter: TaskFilter):
+    """
+    Build a user-scoped SELECT with the filter criteria applied.
+
+    A status criterion is served by the idx_tasks_user_completed
+    (user_id, completed) index.
+
+    Args:
+        user_id: Owner whose tasks are selected
+        task_filter: Criteria tasks must match
+
+    Returns:
+        SELECT statement over TaskDB (unordered)
+    """
+    statement = select(TaskDB).where(
+        TaskDB.user_id == user_id  # Critical: user_id filter
+    )
+
+    if task_filter.status is not None:
+        statement = statement.where(
+            TaskDB.completed == task_filter.status.is_completed()
+        )
+
+    return statement
+
+
+def page_statement(
+    user_id: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    task_filter: Optional[TaskFilter] = None,
+):
+    """
+    Build a keyset-paginated SELECT for one page of tasks.
+
+    Seeks past the cursor position with a row comparison on
+    (created_at, id) instead of OFFSET, so every page costs the same
+    regardless of depth. Ordering follows idx_tasks_user_created,
+    with id as a tie-breaker for equal timestamps. Selects one row
+    more than limit so the caller can tell whether another page exists.
+
+    Args:
+        user_id: Owner whose tasks are selected
+        limit: Page size
+        cursor: Cursor from the previous page (optional)
+        task_filter: Criteria tasks must match (optional)
+
+    Returns:
+        Ordered, limited SELECT statement over TaskDB
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    statement = filtered_statement(user_id, task_filter or TaskFilter())
+
+    if cursor is not None:
+        created_at, task_id = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(TaskDB.created_at, TaskDB.id) < tuple_(created_at, task_id)
+        )
+
+    return statement.order_by(
+        TaskDB.created_at.desc(),
+        TaskDB.id.desc(),
+    ).limit(limit + 1)
+
+
+# Columns of a listed task, in TaskRow order (description NULL -> "")
+TASK_ROW_COLUMNS = (
+    TaskDB.id,
+    TaskDB.title,
+    func.coalesce(TaskDB.description, "").label("description"),
+    TaskDB.completed,
+    TaskDB.created_at,
+    TaskDB.updated_at,
+)
+
+
+def rows_statement(
+    user_id: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    task_filter: Optional[TaskFilter] = None,
+):
+    """
+    Build a Core SELECT of TaskRow columns for a listing.
+
+    Same criteria and order as filtered_statement / page_statement, but
+    selects plain columns: rows come back as tuples, with no ORM
+    identity map or entity construction.
+
+    Args:
+        user_id: Owner whose tasks are selected
+        limit: Page size (None selects every matching task)
+        cursor: Cursor from the previous page (optional)
+        task_filter: Criteria tasks must match (optional)
+
+    Returns:
+        SELECT statement returning TaskRow-shaped rows, newest first
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    if limit is None and cursor is None:
+        statement = filtered_statement(user_id, task_filter or TaskFilter()).order_by(
+            TaskDB.created_at.desc(),
+            TaskDB.id.desc(),
+        )
+    else:
+        statement = page_statement(user_id, limit, cursor, task_filter)
+    return statement.with_only_columns(*TASK_ROW_COLUMNS)
+
+
+def version_statement(user_id: str):
+    """
+    Build the aggregate SELECT behind a user's task list version.
+
+    Built only from values the database assigns, never from a worker's
+    clock: every update adds 1 to the row's revision (raising the sum),
+    every insert takes a new, higher id (raising max(id); ids are never
+    reused, see TaskDB) and every delete lowers the count. A delete paired with an insert still
+    raises max(id), so the three together change whenever the user's
+    task list does, whichever worker wrote it.
+
+    Args:
+        user_id: Owner whose tasks are summarized
+
+    Returns:
+        SELECT statement returning (count, max(id), sum(revision))
+    """
+    return select(
+        func.count(TaskDB.id), func.max(TaskDB.id), func.sum(TaskDB.revision)
+    ).where(
+        TaskDB.user_id == user_id  # Critical: user_id filter
+    )
+
+
+def format_version(count: int, last_id: Optional[int], revisions: Optional[int]) -> str:
+    """
+    Format a task list version from its aggregate values.
+
+    Args:
+        count: Number of tasks
+        last_id: Highest task ID (None if there are no tasks)
+        revisions: Sum of the tasks' revisions (None if there are no tasks)
+
+    Returns:
+        Version string
+    """
+    return f"{count}:{last_id or 0}:{revisions or 0}"
+
+
+def update_returning_statement(user_id: str, task_id: int, values: Dict[str, Any]):
+    """
+    Build a single-statement UPDATE ... RETURNING for one task.
+
+    Ownership check, write and read-back happen in one round trip:
+    a task that doesn't exist or belongs to another user matches no
+    row and returns nothing. updated_at and revision are always bumped.
+
+    Args:
+        user_id: Owner of the task
+        task_id: Task identifier
+        values: Column values to set
+
+    Returns:
+        UPDATE statement returning the updated TaskDB row
+    """
+    return (
+        update(TaskDB)
+        .where(
+            TaskDB.id == task_id,
+            TaskDB.user_id == user_id,  # Critical: user_id filter
+        )
+        .values(**values, updated_at=datetime.utcnow(), revision=TaskDB.revision + 1)
+        .returning(TaskDB)
+    )
+
+
+def delete_returning_statement(user_id: str, task_id: int):
+    """
+    Build a single-statement DELETE ... RETURNING id for one task.
+
+    Args:
+        user_id: Owner of the task
+        task_id: Task identifier
+
+    Returns:
+        DELETE statement returning the deleted id (no row if not found)
+    """
+    return (
+        delete(TaskDB)
+        .where(
+            TaskDB.id == task_id,
+            TaskDB.user_id == user_id,  # Critical: user_id filter
+        )
+        .returning(TaskDB.id)
+    )
+
+
+def remove_returning_statement(user_id: str, task_id: int):
+    """
+    Build a single-statement DELETE ... RETURNING for one task's row.
+
+    Like delete_returning_statement, but returns the whole row so the
+    caller can report what was deleted without a SELECT first.
+
+    Args:
+        user_id: Owner of the task
+        task_id: Task identifier
+
+    Returns:
+        DELETE statement returning the deleted TaskDB row (no row if not found)
+    """
+    return (
+        delete(TaskDB)
+        .where(
+            TaskDB.id == task_id,
+            TaskDB.user_id == user_id,  # Critical: user_id filter
+        )
+        .returning(TaskDB)
+    )
+
+
+def insert_many_statement():
+    """
+    Build a multi-row INSERT ... RETURNING for new tasks.
+
+    Execute with a list of parameter dicts (see new_task_values); the
+    rows are sent as one batched INSERT and returned in parameter order.
+
+    Returns:
+        INSERT statement returning the created TaskDB rows
+    """
+    return insert(TaskDB).returning(TaskDB, sort_by_parameter_order=True)
+
+
+def new_task_values(user_id: str, task: Task) -> Dict[str, Any]:
+    """
+    Get INSERT parameters for a new task owned by user_id.
+
+    Args:
+        user_id: Owner of the task
+        task: Domain Task entity (its ID is ignored)
+
+    Returns:
+        Column values for one row of insert_many_statement
+    """
+    now = datetime.utcnow()
+    return {
+        "user_id": user_id,
+        "title": task.title,
+        "description": task.description,
+        "completed": task.status.is_completed(),
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def set_completed_many_statement(user_id: str, task_ids: List[int], completed: bool):
+    """
+    Build one UPDATE ... WHERE id IN (...) RETURNING for several tasks.
+
+    Args:
+        user_id: Owner of the tasks
+        task_ids: Task identifiers
+        completed: New completion status
+
+    Returns:
+        UPDATE statement returning the updated TaskDB rows (owned ones only)
+    """
+    return (
+        update(TaskDB)
+        .where(
+            TaskDB.id.in_(task_ids),
+            TaskDB.user_id == user_id,  # Critical: user_id filter
+        )
+        .values(
+            completed=completed, updated_at=datetime.utcnow(), revision=TaskDB.revision + 1
+        )
+        .returning(TaskDB)
+    )
+
+
+def delete_many_statement(user_id: str, task_ids: List[int]):
+    """
+    Build one DELETE ... WHERE id IN (...) RETURNING id for several tasks.
+
+    Args:
+        user_id: Owner of the tasks
+        task_ids: Task identifiers
+
+    Returns:
+        DELETE statement returning the deleted ids (owned ones only)
+    """
+    return (
+        delete(TaskDB)
+        .where(
+            TaskDB.id.in_(task_ids),
+            TaskDB.user_id == user_id,  # Critical: user_id filter
+        )
+        .returning(TaskDB.id)
+    )
+
+
+def to_domain(db_task: TaskDB) -> Task:
+    """
+    Convert database model to domain entity.
+
+    Maps database representation to domain model:
+    - completed (bool) → status (TaskStatus enum)
+    - Includes created_at/updated_at from database
+    - Excludes user_id (not part of domain model)
+
+    Rows were validated when written, so the task is rebuilt with
+    Task.from_storage (no validation, no defaults).
+
+    Args:
+        db_task: Database TaskDB model
+
+    Returns:
+        Domain Task entity
+    """
+    status = (
+        TaskStatus.COMPLETED
+        if db_task.completed
+        else TaskStatus.PENDING
+    )
+
+    return Task.from_storage(
+        id=db_task.id,
+        title=db_task.title,
+        description=db_task.description or "",
+        status=status,
+        created_at=db_task.created_at,
+        updated_at=db_task.updated_at,
+    )
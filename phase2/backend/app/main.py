@@ -4,10 +4,24 @@ Main application factory and configuration
 """
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from app.auth import token_cache
 from app.config import get_settings
-from app.database import create_db_and_tables
-from app.presentation.routers import user, tasks
+from app.database import create_db_and_tables, engine, get_async_engine
+from app.infrastructure.cache import get_task_cache
+from app.metrics import (
+    MetricsMiddleware,
+    install_runtime_collector,
+    instrument_engine,
+    register_cache,
+    render_metrics,
+)
+from app.query_budget import QueryBudgetMiddleware, watch_engine
+from app.readiness import LoadSheddingMiddleware, ReadinessMonitor
+from app.presentation.routers import user, tasks, tasks_async
+from app.presentation.routers.tasks import NEXT_CURSOR_HEADER
 
 
 settings = get_settings()
@@ -27,6 +41,36 @@ def create_app() -> FastAPI:
         debug=settings.debug,
     )
 
+    # Count each request's SQL statements against its route's budget
+    if settings.query_budget_mode != "off":
+        app.add_middleware(
+            QueryBudgetMiddleware,
+            default_budget=settings.query_budget_default,
+            repeat_threshold=settings.query_repeat_threshold,
+            raise_on_exceed=settings.query_budget_mode == "raise",
+        )
+        watch_engine(engine)
+        if settings.async_database:
+            watch_engine(get_async_engine().sync_engine)
+
+    # Track in-flight work and shed new requests while saturated.
+    # Added before CORS so shed responses still carry CORS headers.
+    readiness = ReadinessMonitor(
+        engine,
+        probe_interval_seconds=settings.ready_db_probe_interval_seconds,
+        max_pool_waiters=settings.ready_max_pool_waiters,
+        max_pool_wait_ms=settings.ready_max_pool_wait_ms,
+        max_inflight_chats=settings.ready_max_inflight_chats,
+        async_engine=get_async_engine().sync_engine if settings.async_database else None,
+    )
+    app.state.readiness = readiness
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        monitor=readiness,
+        enabled=settings.load_shedding,
+        retry_after=settings.shed_retry_after_seconds,
+    )
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -34,11 +78,26 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag"],  # Readable by browser clients
     )
 
+    # Prometheus metrics (outermost, so shed and CORS responses are timed)
+    app.add_middleware(MetricsMiddleware)
+    instrument_engine(engine)
+    if settings.async_database:
+        instrument_engine(get_async_engine().sync_engine)
+    install_runtime_collector(engine)
+    register_cache("task_lists", lambda: get_task_cache() and get_task_cache().stats())
+    register_cache("jwt", token_cache.stats)
+
     # Register routers
     app.include_router(user.router)
-    app.include_router(tasks.router)
+    # Task routes run as coroutines on the async engine when enabled,
+    # otherwise as sync handlers on the threadpool
+    if settings.async_database:
+        app.include_router(tasks_async.router)
+    else:
+        app.include_router(tasks.router)
 
     # Event handlers
     @app.on_event("startup")
@@ -56,6 +115,8 @@ def create_app() -> FastAPI:
             "status": "running",
             "endpoints": {
                 "health": "/health",
+                "ready": "/ready",
+                "metrics": "/metrics",
                 "docs": "/docs",
                 "api": "/api/{user_id}/tasks"
             },
@@ -66,11 +127,35 @@ def create_app() -> FastAPI:
     @app.get("/health")
     async def health_check():
         """API health check endpoint (no authentication required)."""
+        task_cache = get_task_cache()
         return {
             "status": "healthy",
             "version": settings.app_version,
+            "caches": {
+                "task_lists": task_cache.stats() if task_cache else None,
+                "jwt": token_cache.stats(),
+            },
         }
 
+    # Metrics endpoint (public, for the Prometheus scraper)
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """Prometheus metrics in the text exposition format."""
+        body, content_type = render_metrics()
+        return Response(body, media_type=content_type)
+
+    # Readiness check endpoint (public)
+    @app.get("/ready")
+    async def readiness_check():
+        """
+        Readiness for new traffic (no authentication required).
+
+        503 while the database is unreachable, the connection pool is
+        saturated or too many chats are in flight; see app.readiness.
+        """
+        ready, report = await run_in_threadpool(readiness.check)
+        return JSONResponse(report, status_code=200 if ready else 503)
+
     return app
 
 
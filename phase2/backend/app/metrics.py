@@ -0,0 +1,220 @@
+"""
+Prometheus Metrics
+Serves GET /metrics in the Prometheus text format
+
+Hot-path cost is one histogram observation per request and per SQL
+statement. Everything else - pool gauges, cache hit ratios - is read
+from existing counters only when /metrics is scraped.
+
+- MetricsMiddleware: request latency per method, route template and status
+- instrument_engine: per-statement timing through SQLAlchemy engine events
+- register_cache: exposes a cache's stats() (hits/misses) as metrics
+- RuntimeCollector: connection pool gauges and registered cache stats
+
+Under gunicorn, set PROMETHEUS_MULTIPROC_DIR to an empty directory so
+counters and histograms are aggregated across workers; pool and cache
+gauges then describe the worker that served the scrape.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=HTTP_BUCKETS,
+)
+
+STATEMENT_LATENCY = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time by operation",
+    ["operation"],
+    buckets=DB_BUCKETS,
+)
+
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+# Not timed: the scrape itself and probes
+UNTIMED_PATHS = frozenset({"/metrics", "/health", "/ready"})
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing each request until its body is sent.
+
+    The route label is the matched route's template
+    ("/api/{user_id}/tasks"), never the raw path, so label cardinality
+    stays bounded; unmatched requests share the "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNTIMED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            ).observe(time.perf_counter() - started)
+
+
+# The start time lives on the statement's execution context, not the
+# connection: a statement that fails never reaches after_cursor_execute,
+# and its context is discarded with it
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_statement_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_statement_start", None)
+    if started is None:
+        return
+    words = statement.split(None, 1)
+    operation = words[0].upper() if words else ""
+    STATEMENT_LATENCY.labels(operation if operation in _OPERATIONS else "OTHER").observe(
+        time.perf_counter() - started
+    )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """
+    Time every statement run on the engine (idempotent).
+
+    Args:
+        engine: Sync engine (for an AsyncEngine pass .sync_engine)
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+_caches: Dict[str, Callable[[], Optional[dict]]] = {}
+_caches_lock = threading.Lock()
+
+
+def register_cache(name: str, stats: Callable[[], Optional[dict]]) -> None:
+    """
+    Expose a cache's counters as cache_hits_total / cache_misses_total /
+    cache_hit_ratio with label cache=name.
+
+    Args:
+        name: Label value, e.g. "task_lists"
+        stats: Returns a dict with "hits" and "misses" (None to skip)
+    """
+    with _caches_lock:
+        _caches[name] = stats
+
+
+class RuntimeCollector:
+    """Reads pool and cache state at scrape time; costs nothing in between"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def collect(self):
+        pool = self.engine.pool
+        pool_gauges = (
+            ("db_pool_size", "Persistent connections the pool keeps", "size"),
+            ("db_pool_checked_out", "Connections currently in use", "checkedout"),
+            (
+                "db_pool_overflow",
+                "Connections beyond the pool size (negative: unused slots)",
+                "overflow",
+            ),
+        )
+        for name, documentation, attribute in pool_gauges:
+            method = getattr(pool, attribute, None)
+            if method is not None:
+                yield GaugeMetricFamily(name, documentation, value=method())
+
+        if hasattr(pool, "wait_stats"):
+            waits = pool.wait_stats()
+            yield GaugeMetricFamily(
+                "db_pool_waiting", "Checkouts waiting for a connection", value=waits["waiting"]
+            )
+            yield GaugeMetricFamily(
+                "db_pool_wait_seconds_avg",
+                "Average checkout wait over the last 10 seconds",
+                value=waits["avg_wait_ms"] / 1000,
+            )
+
+        hits = CounterMetricFamily("cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache misses", labels=["cache"])
+        ratio = GaugeMetricFamily("cache_hit_ratio", "Cache hits / lookups", labels=["cache"])
+        with _caches_lock:
+            caches = list(_caches.items())
+        for name, stats_fn in caches:
+            stats = stats_fn()
+            if not stats:
+                continue
+            total = stats["hits"] + stats["misses"]
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+            ratio.add_metric([name], stats["hits"] / total if total else 0.0)
+        yield hits
+        yield misses
+        yield ratio
+
+
+_runtime_collector: Optional[RuntimeCollector] = None
+
+
+def install_runtime_collector(engine: Engine) -> None:
+    """Register the RuntimeCollector for `engine` once per process."""
+    global _runtime_collector
+    if _runtime_collector is None:
+        _runtime_collector = RuntimeCollector(engine)
+        REGISTRY.register(_runtime_collector)
+
+
+def render_metrics() -> tuple:
+    """
+    Current metrics in the Prometheus text format.
+
+    Returns:
+        (body bytes, content type)
+    """
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        if _runtime_collector is not None:
+            registry.register(_runtime_collector)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -3,6 +3,6 @@ Presentation Layer - API Routers
 Exports all API routers for registration in main.py
 """
 
-from app.presentation.routers import user, tasks
+from app.presentation.routers import user, tasks, tasks_async
 
-__all__ = ["user", "tasks"]
+__all__ = ["user", "tasks", "tasks_async"]
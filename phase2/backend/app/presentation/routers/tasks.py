@@ -5,15 +5,26 @@ Implements RESTful endpoints for task management.
 All endpoints require JWT authentication and enforce user-scoped access.
 """
 
+import hashlib
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlmodel import Session
 
 from app.auth import get_current_user
 from app.database import get_session
-from app.domain.exceptions import TaskNotFoundError, TaskValidationError
+from app.domain.exceptions import (
+    InvalidCursorError,
+    TaskNotFoundError,
+    TaskValidationError,
+)
 from app.domain.value_objects.task_status import TaskStatus
-from app.infrastructure.models import TaskDB
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import MAX_PAGE_SIZE, TaskPage
+from app.application.interfaces.task_repository import TaskRepository
+from app.infrastructure.cache import get_task_cache
+from app.infrastructure.repositories.caching_task_repository import (
+    CachingTaskRepository,
+)
 from app.infrastructure.repositories.postgresql_task_repository import (
     PostgreSQLTaskRepository,
 )
@@ -23,15 +34,65 @@ from app.application.use_cases.update_task import UpdateTaskUseCase
 from app.application.use_cases.delete_task import DeleteTaskUseCase
 from app.application.use_cases.complete_task import CompleteTaskUseCase
 from app.application.use_cases.uncomplete_task import UncompleteTaskUseCase
+from app.application.use_cases.batch_tasks import (
+    ERROR_NOT_FOUND,
+    OP_CREATE,
+    OP_DELETE,
+    BatchOperation,
+    BatchResult,
+    BatchTasksUseCase,
+)
 from app.presentation.schemas.task import (
+    BatchOperationResult,
+    InvalidBatchOperation,
+    TaskBatchRequest,
+    TaskBatchResponse,
     TaskCreateRequest,
     TaskUpdateRequest,
     TaskResponse,
 )
+from app.presentation.schemas.task_json import JSONBytesResponse, task_rows_json
 
 
 router = APIRouter(prefix="/api", tags=["tasks"])
 
+# Response header carrying the cursor for the next page of a paginated listing
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Task reads may be stored by the client but must be revalidated
+# (If-None-Match) before every reuse
+CACHE_CONTROL = "private, no-cache"
+
+# OpenAPI documentation for conditional GET responses
+ETAG_HEADER_DOC = {
+    "ETag": {
+        "description": "Version tag; send back in If-None-Match to get 304",
+        "schema": {"type": "string"},
+    }
+}
+NOT_MODIFIED_RESPONSE = {304: {"description": "Not Modified (ETag matches If-None-Match)"}}
+
+# OpenAPI documentation for the list endpoint's headers
+LIST_TASKS_RESPONSES = {
+    200: {
+        "headers": {
+            **ETAG_HEADER_DOC,
+            NEXT_CURSOR_HEADER: {
+                "description": "Cursor for the next page (paginated requests only, "
+                "absent on the last page)",
+                "schema": {"type": "string"},
+            },
+        }
+    },
+    **NOT_MODIFIED_RESPONSE,
+}
+
+# OpenAPI documentation for the single-task endpoint's headers
+GET_TASK_RESPONSES = {
+    200: {"headers": ETAG_HEADER_DOC},
+    **NOT_MODIFIED_RESPONSE,
+}
+
 
 def _verify_user_access(url_user_id: str, authenticated_user_id: str) -> None:
     """
@@ -53,6 +114,106 @@ def _verify_user_access(url_user_id: str, authenticated_user_id: str) -> None:
         )
 
 
+def _task_repository(
+    session: Session, user_id: str, autocommit: bool = True
+) -> TaskRepository:
+    """
+    Create a user-scoped task repository.
+
+    Wrapped in CachingTaskRepository when a task list cache is
+    configured (TASK_CACHE_BACKEND), so list reads are served from the
+    cache and writes invalidate it.
+
+    Args:
+        session: Database session
+        user_id: Authenticated user ID (from JWT)
+        autocommit: Commit after every write (see PostgreSQLTaskRepository)
+
+    Returns:
+        TaskRepository scoped to the user
+    """
+    repo = PostgreSQLTaskRepository(session, user_id, autocommit=autocommit)
+    cache = get_task_cache()
+    if cache is None:
+        return repo
+    return CachingTaskRepository(repo, cache, user_id)
+
+
+def _etag(*parts) -> str:
+    """
+    Build a strong ETag from the values a representation depends on.
+
+    Args:
+        *parts: Version and request variant (filters, page position...)
+
+    Returns:
+        Quoted entity tag
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against the current ETag.
+
+    Accepts "*", comma-separated lists and weak (W/) tags, which
+    If-None-Match compares weakly.
+
+    Args:
+        if_none_match: Raw If-None-Match header (may be None)
+        etag: Current ETag
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+
+def _set_etag(response: Response, etag: str) -> None:
+    """Attach ETag and revalidation headers to a 200 response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 Not Modified response."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def _task_list_response(page: TaskPage, etag: str) -> Response:
+    """
+    Build the 200 response of a task listing.
+
+    The rows are serialized straight to JSON bytes (task_rows_json),
+    which FastAPI sends as-is instead of validating them against
+    response_model; the JSON is the same List[TaskResponse] body.
+
+    Args:
+        page: Page of TaskRows (next_cursor set for paginated requests)
+        etag: ETag of the listing
+
+    Returns:
+        JSON response with ETag and, if there is a next page, X-Next-Cursor
+    """
+    response = JSONBytesResponse(task_rows_json(page.tasks))
+    _set_etag(response, etag)
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return response
+
+
 def _task_to_response(task) -> TaskResponse:
     """
     Convert domain Task entity to API TaskResponse.
@@ -69,11 +230,97 @@ def _task_to_response(task) -> TaskResponse:
         description=task.description,
         completed=task.status.is_completed(),
         created_at=task.created_at,
-        updated_at=getattr(task, 'updated_at', task.created_at),
+        updated_at=task.updated_at,
     )
 
 
-@router.get("/{user_id}/tasks", response_model=List[TaskResponse])
+def _to_batch_operations(request: TaskBatchRequest) -> List[BatchOperation]:
+    """
+    Convert the valid batch request items to use case operations.
+
+    Items that failed validation are left out; _batch_results_to_response
+    reports them.
+
+    Args:
+        request: Parsed batch request
+
+    Returns:
+        Operations in request order
+    """
+    return [
+        BatchOperation(
+            op=item.op,
+            task_id=getattr(item, "task_id", None),
+            title=getattr(item, "title", None),
+            description=getattr(item, "description", None),
+        )
+        for item in request.operations
+        if not isinstance(item, InvalidBatchOperation)
+    ]
+
+
+def _batch_results_to_response(
+    request: TaskBatchRequest, results: List[BatchResult]
+) -> TaskBatchResponse:
+    """
+    Convert batch use case results to API TaskBatchResponse.
+
+    Each result carries the status the single-task endpoint would return:
+    201 (create), 204 (delete), 200 (other), 404 (not found), 400
+    (domain validation error) or 422 (malformed item, never run).
+
+    Args:
+        request: Parsed batch request
+        results: Use case results for its valid items, in request order
+
+    Returns:
+        TaskBatchResponse with one result per request item
+    """
+    items = []
+    executed = iter(results)
+    for index, operation in enumerate(request.operations):
+        if isinstance(operation, InvalidBatchOperation):
+            items.append(
+                BatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    task_id=operation.task_id,
+                    error=operation.error,
+                )
+            )
+            continue
+
+        result = next(executed)
+        if result.error == ERROR_NOT_FOUND:
+            item_status = status.HTTP_404_NOT_FOUND
+        elif result.error is not None:
+            item_status = status.HTTP_400_BAD_REQUEST
+        elif result.op == OP_CREATE:
+            item_status = status.HTTP_201_CREATED
+        elif result.op == OP_DELETE:
+            item_status = status.HTTP_204_NO_CONTENT
+        else:
+            item_status = status.HTTP_200_OK
+
+        items.append(
+            BatchOperationResult(
+                index=index,
+                op=result.op,
+                status=item_status,
+                task_id=result.task_id,
+                task=_task_to_response(result.task) if result.task else None,
+                error=result.message,
+            )
+        )
+    return TaskBatchResponse(results=items)
+
+
+@router.get(
+    "/{user_id}/tasks",
+    response_model=List[TaskResponse],
+    responses=LIST_TASKS_RESPONSES,
+)
 def list_tasks(
     user_id: str,
     authenticated_user_id: str = Depends(get_current_user),
@@ -82,7 +329,18 @@ def list_tasks(
         default=None,
         description="Filter by completion status (true=completed, false=pending, null=all)",
     ),
-) -> List[TaskResponse]:
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size; enables cursor pagination (omit for the full list)",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
     """
     List all tasks for authenticated user.
 
@@ -91,6 +349,20 @@ def list_tasks(
       - true: Only completed tasks
       - false: Only pending tasks
       - omit: All tasks
+    - limit (optional): Return at most this many tasks per page
+    - cursor (optional): Continue after the page that returned this cursor
+
+    Pagination:
+    - Keyset pagination on (created_at, id), stable under concurrent inserts
+    - When limit or cursor is given, the X-Next-Cursor response header
+      holds the cursor for the next page (absent on the last page)
+    - Without limit and cursor the full list is returned, as before
+
+    Conditional requests:
+    - The ETag is derived from the task count, highest ID and row revisions
+      (one aggregate query) plus the query parameters
+    - If-None-Match with the current ETag returns 304 without loading
+      or serializing any task
 
     Security:
     - Requires valid JWT token
@@ -98,9 +370,11 @@ def list_tasks(
     - Only returns tasks belonging to authenticated user
 
     Returns:
-        List of tasks sorted by creation date (newest first)
+        List of tasks sorted by creation date (newest first),
+        or 304 Not Modified
 
     Raises:
+        HTTPException 400: Malformed pagination cursor
         HTTPException 401: Invalid or missing JWT token
         HTTPException 403: URL user_id doesn't match token user_id
     """
@@ -108,18 +382,34 @@ def list_tasks(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
-    # Execute use case
-    use_case = ListTasksUseCase(repo)
-    tasks = use_case.execute()
+    # Answer conditional requests from the list version alone. The version
+    # is read before the tasks, so a concurrent write can only make the
+    # ETag older than the body (forcing a refetch), never newer.
+    etag = _etag(repo.get_list_version(), completed, limit, cursor)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
 
-    # Filter by completion status if specified
+    # Filter by completion status if specified (applied in SQL)
+    task_filter = None
     if completed is not None:
-        tasks = [task for task in tasks if task.status.is_completed() == completed]
+        task_filter = TaskFilter(
+            status=TaskStatus.COMPLETED if completed else TaskStatus.PENDING
+        )
 
-    # Convert to response schema
-    return [_task_to_response(task) for task in tasks]
+    # Execute use case (full list, or one page when limit/cursor is given);
+    # the rows are serialized without TaskResponse models, see _task_list_response
+    use_case = ListTasksUseCase(repo)
+    try:
+        page = use_case.execute_rows(limit=limit, cursor=cursor, task_filter=task_filter)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return _task_list_response(page, etag)
 
 
 @router.post(
@@ -157,7 +447,7 @@ def create_task(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Execute use case
     use_case = AddTaskUseCase(repo)
@@ -177,12 +467,71 @@ def create_task(
     return _task_to_response(task)
 
 
-@router.get("/{user_id}/tasks/{task_id}", response_model=TaskResponse)
+@router.post("/{user_id}/tasks:batch", response_model=TaskBatchResponse)
+def batch_tasks(
+    user_id: str,
+    request: TaskBatchRequest,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> TaskBatchResponse:
+    """
+    Apply several task operations in one request and one transaction.
+
+    Request Body:
+    - operations (required): 1-100 items, applied in order, each one of
+      - {"op": "create", "title": ..., "description": ...}
+      - {"op": "update", "task_id": ..., "title": ..., "description": ...}
+      - {"op": "complete", "task_id": ...}
+      - {"op": "uncomplete", "task_id": ...}
+      - {"op": "delete", "task_id": ...}
+
+    Consecutive operations of the same kind run as a single statement
+    (multi-row INSERT ... RETURNING, UPDATE/DELETE ... WHERE id IN (...)).
+    A missing task does not abort the batch; it is reported as 404 in
+    that item's result. Neither does a malformed item: it is skipped
+    and reported as 422 in its result. Everything is committed once at
+    the end.
+
+    Security:
+    - Requires valid JWT token
+    - URL user_id must match token user_id
+    - Every operation is scoped to the authenticated user's tasks
+
+    Returns:
+        One result per operation, in request order
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 422: Malformed request body (not a list of 1-100 items)
+    """
+    # Verify user authorization
+    _verify_user_access(user_id, authenticated_user_id)
+
+    # Create user-scoped repository sharing one transaction
+    repo = _task_repository(session, authenticated_user_id, autocommit=False)
+
+    # Execute use case, then commit all operations together
+    use_case = BatchTasksUseCase(repo)
+    results = use_case.execute(_to_batch_operations(request))
+    session.commit()
+
+    # Convert to response schema
+    return _batch_results_to_response(request, results)
+
+
+@router.get(
+    "/{user_id}/tasks/{task_id}",
+    response_model=TaskResponse,
+    responses=GET_TASK_RESPONSES,
+)
 def get_task(
     user_id: str,
     task_id: int,
+    response: Response,
     authenticated_user_id: str = Depends(get_current_user),
     session: Session = Depends(get_session),
+    if_none_match: Optional[str] = Header(default=None),
 ) -> TaskResponse:
     """
     Get single task by ID.
@@ -193,12 +542,16 @@ def get_task(
     - Returns 404 if task doesn't exist OR belongs to another user
       (prevents information leakage about other users' task IDs)
 
+    Conditional requests:
+    - The ETag is derived from the task's id and updated_at
+    - If-None-Match with the current ETag returns 304 without a body
+
     Args:
         user_id: User identifier from URL
         task_id: Task identifier from URL
 
     Returns:
-        Task details
+        Task details, or 304 Not Modified
 
     Raises:
         HTTPException 401: Invalid or missing JWT token
@@ -209,7 +562,7 @@ def get_task(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Get task (repository automatically filters by user_id)
     task = repo.get_by_id(task_id)
@@ -220,6 +573,11 @@ def get_task(
             detail="Task not found",
         )
 
+    etag = _etag(task.id, task.updated_at)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    _set_etag(response, etag)
+
     # Convert to response schema
     return _task_to_response(task)
 
@@ -264,7 +622,7 @@ def update_task(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Execute use case
     use_case = UpdateTaskUseCase(repo)
@@ -324,7 +682,7 @@ def delete_task(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Execute use case
     use_case = DeleteTaskUseCase(repo)
@@ -372,7 +730,7 @@ def mark_task_complete(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Execute use case
     use_case = CompleteTaskUseCase(repo)
@@ -420,7 +778,7 @@ def mark_task_incomplete(
     _verify_user_access(user_id, authenticated_user_id)
 
     # Create user-scoped repository
-    repo = PostgreSQLTaskRepository(session, authenticated_user_id)
+    repo = _task_repository(session, authenticated_user_id)
 
     # Execute use case
     use_case = UncompleteTaskUseCase(repo)
@@ -0,0 +1,391 @@
+"""
+Async Task CRUD API Router
+
+Coroutine counterpart of the tasks router, served from the async
+engine (asyncpg) instead of Starlette's threadpool. Registered in
+place of the sync router when ASYNC_DATABASE=true.
+
+Routes, request/response contracts and security checks are identical
+to app.presentation.routers.tasks.
+"""
+
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.auth import get_current_user
+from app.database import get_async_session
+from app.application.interfaces.async_task_repository import AsyncTaskRepository
+from app.domain.exceptions import (
+    InvalidCursorError,
+    TaskNotFoundError,
+    TaskValidationError,
+)
+from app.domain.value_objects.task_status import TaskStatus
+from app.application.interfaces.task_filter import TaskFilter
+from app.application.interfaces.task_page import MAX_PAGE_SIZE
+from app.infrastructure.cache import get_task_cache
+from app.infrastructure.repositories.async_postgresql_task_repository import (
+    AsyncPostgreSQLTaskRepository,
+)
+from app.infrastructure.repositories.caching_task_repository import (
+    AsyncCachingTaskRepository,
+)
+from app.application.use_cases.add_task import AsyncAddTaskUseCase
+from app.application.use_cases.list_tasks import AsyncListTasksUseCase
+from app.application.use_cases.update_task import AsyncUpdateTaskUseCase
+from app.application.use_cases.delete_task import AsyncDeleteTaskUseCase
+from app.application.use_cases.complete_task import AsyncCompleteTaskUseCase
+from app.application.use_cases.uncomplete_task import AsyncUncompleteTaskUseCase
+from app.application.use_cases.batch_tasks import AsyncBatchTasksUseCase
+from app.presentation.routers.tasks import (
+    GET_TASK_RESPONSES,
+    LIST_TASKS_RESPONSES,
+    NEXT_CURSOR_HEADER,
+    _batch_results_to_response,
+    _etag,
+    _etag_matches,
+    _not_modified,
+    _set_etag,
+    _task_list_response,
+    _task_to_response,
+    _to_batch_operations,
+    _verify_user_access,
+)
+from app.presentation.schemas.task import (
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskCreateRequest,
+    TaskUpdateRequest,
+    TaskResponse,
+)
+
+
+router = APIRouter(prefix="/api", tags=["tasks"])
+
+
+def _task_repository(
+    session: AsyncSession, user_id: str, autocommit: bool = True
+) -> AsyncTaskRepository:
+    """
+    Create a user-scoped async task repository.
+
+    Wrapped in AsyncCachingTaskRepository when a task list cache is
+    configured, sharing it with the sync routes and MCP tools.
+
+    Args:
+        session: Async database session
+        user_id: Authenticated user ID (from JWT)
+        autocommit: Commit after every write
+
+    Returns:
+        AsyncTaskRepository scoped to the user
+    """
+    repo = AsyncPostgreSQLTaskRepository(session, user_id, autocommit=autocommit)
+    cache = get_task_cache()
+    if cache is None:
+        return repo
+    return AsyncCachingTaskRepository(repo, cache, user_id)
+
+
+@router.get(
+    "/{user_id}/tasks",
+    response_model=List[TaskResponse],
+    responses=LIST_TASKS_RESPONSES,
+)
+async def list_tasks(
+    user_id: str,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+    completed: Optional[bool] = Query(
+        default=None,
+        description="Filter by completion status (true=completed, false=pending, null=all)",
+    ),
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size; enables cursor pagination (omit for the full list)",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page",
+    ),
+    if_none_match: Optional[str] = Header(default=None),
+) -> Response:
+    """
+    List all tasks for authenticated user.
+
+    See app.presentation.routers.tasks.list_tasks for query parameters,
+    pagination and conditional request behaviour.
+
+    Raises:
+        HTTPException 400: Malformed pagination cursor
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+
+    etag = _etag(await repo.get_list_version(), completed, limit, cursor)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    task_filter = None
+    if completed is not None:
+        task_filter = TaskFilter(
+            status=TaskStatus.COMPLETED if completed else TaskStatus.PENDING
+        )
+
+    use_case = AsyncListTasksUseCase(repo)
+    try:
+        page = await use_case.execute_rows(limit=limit, cursor=cursor, task_filter=task_filter)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return _task_list_response(page, etag)
+
+
+@router.post(
+    "/{user_id}/tasks",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_task(
+    user_id: str,
+    request: TaskCreateRequest,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TaskResponse:
+    """
+    Create a new task for authenticated user.
+
+    Raises:
+        HTTPException 400: Validation error (invalid title/description)
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    use_case = AsyncAddTaskUseCase(repo)
+
+    try:
+        task = await use_case.execute(
+            title=request.title,
+            description=request.description or "",
+        )
+    except TaskValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return _task_to_response(task)
+
+
+@router.post("/{user_id}/tasks:batch", response_model=TaskBatchResponse)
+async def batch_tasks(
+    user_id: str,
+    request: TaskBatchRequest,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TaskBatchResponse:
+    """
+    Apply several task operations in one request and one transaction.
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 422: Malformed request body (not a list of 1-100 items)
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id, autocommit=False)
+    use_case = AsyncBatchTasksUseCase(repo)
+    results = await use_case.execute(_to_batch_operations(request))
+    await session.commit()
+
+    return _batch_results_to_response(request, results)
+
+
+@router.get(
+    "/{user_id}/tasks/{task_id}",
+    response_model=TaskResponse,
+    responses=GET_TASK_RESPONSES,
+)
+async def get_task(
+    user_id: str,
+    task_id: int,
+    response: Response,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+    if_none_match: Optional[str] = Header(default=None),
+) -> TaskResponse:
+    """
+    Get single task by ID.
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 404: Task not found or belongs to another user
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    task = await repo.get_by_id(task_id)
+
+    if task is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+
+    etag = _etag(task.id, task.updated_at)
+    if _etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+    _set_etag(response, etag)
+
+    return _task_to_response(task)
+
+
+@router.put("/{user_id}/tasks/{task_id}", response_model=TaskResponse)
+async def update_task(
+    user_id: str,
+    task_id: int,
+    request: TaskUpdateRequest,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TaskResponse:
+    """
+    Update task title and/or description (partial update).
+
+    Raises:
+        HTTPException 400: Validation error (invalid title/description)
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 404: Task not found or belongs to another user
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    use_case = AsyncUpdateTaskUseCase(repo)
+
+    try:
+        task = await use_case.execute(
+            task_id=task_id,
+            title=request.title,
+            description=request.description,
+        )
+    except TaskNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    except TaskValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    return _task_to_response(task)
+
+
+@router.delete(
+    "/{user_id}/tasks/{task_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_task(
+    user_id: str,
+    task_id: int,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> None:
+    """
+    Permanently delete task.
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 404: Task not found or belongs to another user
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    use_case = AsyncDeleteTaskUseCase(repo)
+
+    try:
+        await use_case.execute(task_id=task_id)
+    except TaskNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+
+    return None
+
+
+@router.patch("/{user_id}/tasks/{task_id}/complete", response_model=TaskResponse)
+async def mark_task_complete(
+    user_id: str,
+    task_id: int,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TaskResponse:
+    """
+    Mark task as completed.
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 404: Task not found or belongs to another user
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    use_case = AsyncCompleteTaskUseCase(repo)
+
+    try:
+        task = await use_case.execute(task_id=task_id)
+    except TaskNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+
+    return _task_to_response(task)
+
+
+@router.patch("/{user_id}/tasks/{task_id}/uncomplete", response_model=TaskResponse)
+async def mark_task_incomplete(
+    user_id: str,
+    task_id: int,
+    authenticated_user_id: str = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+) -> TaskResponse:
+    """
+    Mark task as pending (uncomplete).
+
+    Raises:
+        HTTPException 401: Invalid or missing JWT token
+        HTTPException 403: URL user_id doesn't match token user_id
+        HTTPException 404: Task not found or belongs to another user
+    """
+    _verify_user_access(user_id, authenticated_user_id)
+
+    repo = _task_repository(session, authenticated_user_id)
+    use_case = AsyncUncompleteTaskUseCase(repo)
+
+    try:
+        task = await use_case.execute(task_id=task_id)
+    except TaskNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+
+    return _task_to_response(task)
@@ -7,10 +7,16 @@ from app.presentation.schemas.task import (
     TaskCreateRequest,
     TaskUpdateRequest,
     TaskResponse,
+    TaskBatchRequest,
+    TaskBatchResponse,
+    BatchOperationResult,
 )
 
 __all__ = [
     "TaskCreateRequest",
     "TaskUpdateRequest",
     "TaskResponse",
+    "TaskBatchRequest",
+    "TaskBatchResponse",
+    "BatchOperationResult",
 ]
@@ -6,8 +6,18 @@ Maps between API JSON and domain entities.
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, List, Literal, Optional, Union
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+    field_validator,
+)
+
+# Maximum number of operations accepted in one batch request
+MAX_BATCH_OPERATIONS = 100
 
 
 class TaskCreateRequest(BaseModel):
@@ -142,3 +152,163 @@ class TaskResponse(BaseModel):
                 "updated_at": "2026-01-03T11:15:00Z",
             }
         }
+
+
+class BatchCreateOperation(TaskCreateRequest):
+    """Batch operation creating a task (same validation as TaskCreateRequest)."""
+
+    op: Literal["create"]
+
+
+class BatchUpdateOperation(TaskUpdateRequest):
+    """Batch operation updating a task (same validation as TaskUpdateRequest)."""
+
+    op: Literal["update"]
+    task_id: int = Field(..., description="Task to update", examples=[42])
+
+
+class BatchCompleteOperation(BaseModel):
+    """Batch operation marking a task as completed."""
+
+    op: Literal["complete"]
+    task_id: int = Field(..., description="Task to complete", examples=[42])
+
+
+class BatchUncompleteOperation(BaseModel):
+    """Batch operation marking a task as pending."""
+
+    op: Literal["uncomplete"]
+    task_id: int = Field(..., description="Task to uncomplete", examples=[42])
+
+
+class BatchDeleteOperation(BaseModel):
+    """Batch operation deleting a task."""
+
+    op: Literal["delete"]
+    task_id: int = Field(..., description="Task to delete", examples=[42])
+
+
+class InvalidBatchOperation(BaseModel):
+    """
+    A batch item that failed validation.
+
+    Stands in for the item so the rest of the batch still runs; the
+    item's result reports the error with status 422.
+    """
+
+    op: str
+    task_id: Optional[int] = None
+    error: str
+
+    @classmethod
+    def from_error(cls, value: Any, error: ValidationError) -> "InvalidBatchOperation":
+        """
+        Describe an item rejected by validation.
+
+        Args:
+            value: Raw item from the request body
+            error: Why it was rejected
+
+        Returns:
+            InvalidBatchOperation with the item's op, task_id (if usable)
+            and the validation messages
+        """
+        item = value if isinstance(value, dict) else {}
+        op = item.get("op")
+        task_id = item.get("task_id")
+        messages = []
+        for detail in error.errors():
+            # Drop the discriminator tag pydantic puts first in loc
+            loc = [str(part) for part in detail["loc"] if part != op]
+            messages.append(f"{'.'.join(loc)}: {detail['msg']}" if loc else detail["msg"])
+        return cls(
+            op=op if isinstance(op, str) else "",
+            task_id=task_id if isinstance(task_id, int) and not isinstance(task_id, bool) else None,
+            error="; ".join(messages),
+        )
+
+
+def _keep_invalid_operation(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Validate one batch item, turning a failure into InvalidBatchOperation."""
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return InvalidBatchOperation.from_error(value, e)
+
+
+BatchOperationRequest = Annotated[
+    Union[
+        BatchCreateOperation,
+        BatchUpdateOperation,
+        BatchCompleteOperation,
+        BatchUncompleteOperation,
+        BatchDeleteOperation,
+    ],
+    Field(discriminator="op"),
+]
+
+# Request item: an operation, or InvalidBatchOperation if it failed
+# validation (the OpenAPI schema is the operation's)
+BatchItem = Annotated[BatchOperationRequest, WrapValidator(_keep_invalid_operation)]
+
+
+class TaskBatchRequest(BaseModel):
+    """
+    Request schema for applying several task operations at once.
+
+    Validation Rules:
+    - operations: 1-100 items, each discriminated by "op"
+      (create, update, complete, uncomplete, delete)
+    - Each item is validated like the equivalent single-task request.
+      An invalid item does not reject the batch; its result reports
+      the error with status 422.
+    """
+
+    operations: List[BatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_OPERATIONS,
+        description=f"Operations to apply in order (1-{MAX_BATCH_OPERATIONS})",
+    )
+
+    class Config:
+        """Pydantic model configuration."""
+
+        json_schema_extra = {
+            "example": {
+                "operations": [
+                    {"op": "create", "title": "Buy groceries"},
+                    {"op": "complete", "task_id": 42},
+                    {"op": "delete", "task_id": 7},
+                ]
+            }
+        }
+
+
+class BatchOperationResult(BaseModel):
+    """
+    Result of a single batch operation.
+
+    status mirrors the HTTP status the equivalent single-task request
+    would have returned (201, 200, 204, 400, 404, or 422 for a malformed
+    item).
+    """
+
+    index: int = Field(..., description="Position of the operation in the request", examples=[0])
+    op: str = Field(..., description="Requested operation", examples=["create"])
+    status: int = Field(..., description="Per-operation HTTP status", examples=[201])
+    task_id: Optional[int] = Field(
+        default=None, description="Affected task identifier", examples=[42]
+    )
+    task: Optional[TaskResponse] = Field(
+        default=None, description="Resulting task (create, update, complete, uncomplete)"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Error message if the operation failed"
+    )
+
+
+class TaskBatchResponse(BaseModel):
+    """Response schema for a batch request: one result per operation, in order."""
+
+    results: List[BatchOperationResult]
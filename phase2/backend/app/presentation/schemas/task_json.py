@@ -0,0 +1,43 @@
+"""
+Task List JSON Serialization
+
+Fast path for list responses: task rows go straight to JSON bytes with
+orjson, skipping one TaskResponse model per task and FastAPI's
+re-validation of the list against response_model.
+
+The output is the JSON TaskResponse would produce - same keys, and
+datetimes in ISO 8601 (naive as-is, UTC with a "Z") - so routes keep
+response_model=List[TaskResponse] for their OpenAPI contract and only
+bypass it at runtime by returning a JSONBytesResponse.
+"""
+
+from typing import Iterable, Sequence
+
+import orjson
+from fastapi import Response
+
+# TaskResponse fields, in TaskRow column order
+TASK_FIELDS = ("id", "title", "description", "completed", "created_at", "updated_at")
+
+
+class JSONBytesResponse(Response):
+    """Response for a body that is already serialized JSON"""
+
+    media_type = "application/json"
+
+
+def task_rows_json(rows: Iterable[Sequence]) -> bytes:
+    """
+    Serialize task rows as a JSON array of TaskResponse objects.
+
+    Args:
+        rows: TaskRows (or driver rows with the same columns)
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    fields = TASK_FIELDS
+    return orjson.dumps(
+        [dict(zip(fields, row)) for row in rows],
+        option=orjson.OPT_UTC_Z,
+    )
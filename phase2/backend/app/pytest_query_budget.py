@@ -0,0 +1,70 @@
+"""
+Pytest Plugin: SQL Query Budgets
+Asserts how many statements a route or MCP tool runs in a test
+
+Enable it from a conftest.py:
+    pytest_plugins = ["app.pytest_query_budget"]
+
+The query_budget fixture returns a context manager factory. Give it a
+budget name ("GET /api/{user_id}/tasks", "mcp:add_task") to use the
+budget registered in app/query_budget.py, or a number. The block fails
+when it runs more statements than that, or repeats one statement
+repeat_threshold times:
+
+    def test_list_tasks(client, query_budget):
+        with query_budget("GET /api/{user_id}/tasks"):
+            client.get("/api/user-1/tasks", headers=auth)
+
+    def test_delete_tool(query_budget):
+        with query_budget("mcp:delete_task") as log:
+            asyncio.run(delete_task(user_id="user-1", task_id=1))
+        assert log.count == 1
+
+Budgets for the chat routes and MCP tools are registered when the
+Phase III router and tools are imported.
+"""
+
+from contextlib import contextmanager
+from typing import Callable, ContextManager, Iterator, Optional, Union
+
+import pytest
+
+from app.database import engine
+from app.query_budget import QueryLog, count_queries, get_budget, watch_engine
+
+
+@contextmanager
+def _assert_budget(budget: Union[str, int], repeat_threshold: Optional[int]) -> Iterator[QueryLog]:
+    if isinstance(budget, str):
+        limit = get_budget(budget)
+        assert limit is not None, f"No query budget registered for {budget!r}"
+    else:
+        limit = budget
+
+    with count_queries() as log:
+        yield log
+
+    details = "\n".join(f"  {statement}" for statement in log.statements)
+    assert log.count <= limit, (
+        f"{budget}: {log.count} SQL statements, budget {limit}:\n{details}"
+    )
+    if repeat_threshold:
+        repeated = log.repeated(repeat_threshold)
+        assert not repeated, f"{budget}: repeated statements (possible N+1): {repeated}"
+
+
+@pytest.fixture
+def query_budget() -> Callable[..., ContextManager[QueryLog]]:
+    """
+    Factory for blocks that must stay within a query budget.
+
+    Returns:
+        query_budget(budget, repeat_threshold=3) -> context manager
+        yielding the block's QueryLog
+    """
+    watch_engine(engine)
+
+    def factory(budget: Union[str, int], repeat_threshold: Optional[int] = 3):
+        return _assert_budget(budget, repeat_threshold)
+
+    return factory
@@ -0,0 +1,278 @@
+"""
+SQL Query Budget
+Counts the statements each request runs and flags N+1 patterns
+
+Every statement sent to the database is recorded in the QueryLog of the
+request (or count_queries block) it runs in; statements outside one are
+not looked at. A QueryLog is carried in a context variable, so it
+follows the request into threadpool handlers, dependencies and the
+agent's tool threads.
+
+- watch_engine: records statements through SQLAlchemy engine events
+- count_queries: collects the statements run inside a block
+- QueryBudgetMiddleware: per-request log, checked against the route's
+  budget when the request ends
+- set_budget: statement budget of one route or MCP tool
+- report: logs a QueryLog that is over budget or repeats statements
+
+A request over budget is logged, or in "raise" mode fails with
+QueryBudgetExceeded at the first statement past the budget (for
+development and CI, never production). Identical statements run
+repeat_threshold or more times in one request - the shape of an N+1
+loop - are logged in both modes.
+"""
+
+import contextvars
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Not counted: probes and the metrics scrape
+UNCOUNTED_PATHS = frozenset({"/metrics", "/health", "/ready"})
+
+# Statements per request, keyed "METHOD /route/template" or "mcp:<tool>".
+# A change that makes a path issue more statements must raise its
+# budget here, which makes the extra round trips visible in review.
+_budgets: Dict[str, int] = {
+    "GET /api/{user_id}/me": 0,
+    "GET /api/health/protected": 0,
+    "GET /api/{user_id}/tasks": 2,  # List version, then rows on a cache miss
+    "POST /api/{user_id}/tasks": 1,  # INSERT ... RETURNING
+    "POST /api/{user_id}/tasks:batch": 10,  # One per run of same-kind operations
+    "GET /api/{user_id}/tasks/{task_id}": 1,
+    "PUT /api/{user_id}/tasks/{task_id}": 1,  # UPDATE ... RETURNING
+    "DELETE /api/{user_id}/tasks/{task_id}": 1,  # DELETE ... RETURNING
+    "PATCH /api/{user_id}/tasks/{task_id}/complete": 1,
+    "PATCH /api/{user_id}/tasks/{task_id}/uncomplete": 1,
+}
+_budgets_lock = threading.Lock()
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """A request ran more statements than its budget allows ("raise" mode)"""
+
+
+class QueryLog:
+    """
+    Statements run inside one request or count_queries block.
+
+    Attributes:
+        statements: SQL text of each statement, in order
+        limit: Raise QueryBudgetExceeded past this many statements
+            (None: only record). A callable is resolved at the first
+            statement, when the request's route is known.
+        parent: Enclosing log, which sees every statement as well
+    """
+
+    def __init__(
+        self,
+        limit: Union[int, Callable[[], int], None] = None,
+        parent: Optional["QueryLog"] = None,
+    ):
+        self.statements: List[str] = []
+        self.limit = limit
+        self.parent = parent
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def record(self, statement: str) -> None:
+        if self.parent is not None:
+            self.parent.record(statement)
+        self.statements.append(statement)
+        if callable(self.limit):
+            self.limit = self.limit()
+        if self.limit is not None and len(self.statements) > self.limit:
+            raise QueryBudgetExceeded(
+                f"{len(self.statements)} statements, budget is {self.limit}: {statement[:200]}"
+            )
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """
+        Statements run at least `threshold` times.
+
+        Args:
+            threshold: Minimum number of runs
+
+        Returns:
+            dict of SQL text -> runs
+        """
+        return {
+            statement: runs
+            for statement, runs in Counter(self.statements).items()
+            if runs >= threshold
+        }
+
+
+_current_log: contextvars.ContextVar[Optional[QueryLog]] = contextvars.ContextVar(
+    "query_log", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    log = _current_log.get()
+    if log is not None:
+        log.record(statement)
+
+
+def watch_engine(engine: Engine) -> None:
+    """
+    Record the engine's statements in the current QueryLog (idempotent).
+
+    An executemany counts once: it is one round trip.
+
+    Args:
+        engine: Sync engine (for an AsyncEngine pass .sync_engine)
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@contextmanager
+def count_queries(limit: Union[int, Callable[[], int], None] = None) -> Iterator[QueryLog]:
+    """
+    Collect the statements run inside the block.
+
+    Blocks nest: statements count toward every enclosing block too, so
+    timing one tool call does not hide it from the request's log.
+
+    Args:
+        limit: Raise QueryBudgetExceeded past this many statements
+            (or a callable returning it)
+
+    Yields:
+        QueryLog being filled
+
+    Example:
+        with count_queries() as log:
+            repo.get_all()
+        assert log.count == 1
+    """
+    log = QueryLog(limit, parent=_current_log.get())
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+
+
+def set_budget(name: str, max_statements: int) -> None:
+    """
+    Set the statement budget of a route or MCP tool.
+
+    Args:
+        name: "METHOD /route/template" or "mcp:<tool>"
+        max_statements: Statements allowed per request or call
+    """
+    with _budgets_lock:
+        _budgets[name] = max_statements
+
+
+def get_budget(name: str) -> Optional[int]:
+    """Budget set for `name`, or None if it has none"""
+    with _budgets_lock:
+        return _budgets.get(name)
+
+
+def budgets() -> Dict[str, int]:
+    """Copy of every budget set so far"""
+    with _budgets_lock:
+        return dict(_budgets)
+
+
+class QueryBudgetMiddleware:
+    """
+    Pure ASGI middleware checking each request's statements.
+
+    The budget is the matched route's (see set_budget), else
+    default_budget. The log spans the whole response, streamed bodies
+    included. Cost per statement: one context variable read and a list
+    append.
+    """
+
+    def __init__(
+        self,
+        app,
+        default_budget: int,
+        repeat_threshold: int,
+        raise_on_exceed: bool = False,
+    ):
+        """
+        Initialize middleware.
+
+        Args:
+            app: ASGI app to wrap
+            default_budget: Statements allowed for routes without a budget
+            repeat_threshold: Runs of one statement that are reported
+            raise_on_exceed: Fail the request at the first statement
+                past the budget instead of logging afterwards
+        """
+        self.app = app
+        self.default_budget = default_budget
+        self.repeat_threshold = repeat_threshold
+        self.raise_on_exceed = raise_on_exceed
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in UNCOUNTED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        # Routing happens before any dependency runs, so the route is
+        # known by the first statement
+        limit = (lambda: self._budget(scope)) if self.raise_on_exceed else None
+        with count_queries(limit) as log:
+            await self.app(scope, receive, send)
+
+        self._report(scope, log)
+
+    def _route_name(self, scope) -> str:
+        route = scope.get("route")
+        return f"{scope['method']} {getattr(route, 'path', scope['path'])}"
+
+    def _budget(self, scope) -> int:
+        budget = get_budget(self._route_name(scope))
+        return self.default_budget if budget is None else budget
+
+    def _report(self, scope, log: QueryLog) -> None:
+        report(self._route_name(scope), log, self._budget(scope), self.repeat_threshold)
+
+
+def report(
+    name: str,
+    log: QueryLog,
+    budget: Optional[int],
+    repeat_threshold: Optional[int] = None,
+) -> bool:
+    """
+    Log a warning if the statements in `log` break the budget.
+
+    Args:
+        name: Route or tool the log belongs to
+        log: Statements it ran
+        budget: Statements allowed (None: no limit)
+        repeat_threshold: Also report statements run this often (None: don't)
+
+    Returns:
+        True if anything was reported
+    """
+    reported = False
+    if budget is not None and log.count > budget:
+        logger.warning(f"{name} ran {log.count} SQL statements (budget {budget})")
+        reported = True
+
+    if repeat_threshold:
+        for statement, runs in log.repeated(repeat_threshold).items():
+            logger.warning(
+                f"{name} ran the same statement {runs} times (possible N+1): "
+                f"{' '.join(statement.split())[:200]}"
+            )
+            reported = True
+    return reported
@@ -0,0 +1,311 @@
+"""
+Readiness and Load Shedding
+Tells the load balancer when this process should stop getting traffic
+
+- DatabaseProbe: cached, rate-limited SELECT 1 (at most one per interval
+  no matter how often /ready is polled)
+- ReadinessMonitor: combines the probe, connection pool saturation
+  (TimedQueuePool) and in-flight request counts into a ready / not
+  ready verdict with reasons
+- LoadSheddingMiddleware: counts in-flight requests and rejects new work
+  with 503 + Retry-After while the process is saturated, instead of
+  letting requests queue for a connection until they time out
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+logger = logging.getLogger(__name__)
+
+# Never shed or count these: probes, docs and the API index
+EXEMPT_PATHS = frozenset({"/", "/health", "/ready", "/metrics", "/docs", "/redoc", "/openapi.json"})
+
+# Phase III chat endpoints: long-running, tracked and capped separately
+CHAT_PATH = re.compile(r"^/api/[^/]+/chat(?:/stream)?$")
+
+
+class DatabaseProbe:
+    """
+    Rate-limited database reachability check.
+
+    Runs SELECT 1 at most once per interval_seconds; callers in between
+    get the cached result. Blocking - call from a worker thread.
+
+    Probes on a fresh, unpooled connection: a saturated pool is reported
+    separately and must not make the database look unreachable (or make
+    the probe wait for the pool timeout).
+    """
+
+    CONNECT_TIMEOUT_SECONDS = 3
+
+    def __init__(self, engine: Engine, interval_seconds: float):
+        """
+        Initialize probe.
+
+        Args:
+            engine: Engine whose database is checked (URL only)
+            interval_seconds: Minimum time between two real probes
+        """
+        connect_args = {}
+        if engine.dialect.name == "postgresql":
+            connect_args["connect_timeout"] = self.CONNECT_TIMEOUT_SECONDS
+        self.engine = create_engine(engine.url, poolclass=NullPool, connect_args=connect_args)
+        self.interval_seconds = interval_seconds
+        self._lock = threading.Lock()
+        self._checked_at: Optional[float] = None
+        self._ok = False
+        self._error: Optional[str] = None
+        self._latency_ms = 0.0
+
+    def check(self) -> dict:
+        """
+        Probe the database unless a recent result is cached.
+
+        Returns:
+            dict with reachable, error, latency_ms and age_seconds
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._checked_at is None or now - self._checked_at >= self.interval_seconds:
+                started = time.perf_counter()
+                try:
+                    with self.engine.connect() as connection:
+                        connection.execute(text("SELECT 1"))
+                    self._ok, self._error = True, None
+                except Exception as e:
+                    logger.warning(f"Readiness database probe failed: {e}")
+                    self._ok, self._error = False, type(e).__name__
+                self._latency_ms = round((time.perf_counter() - started) * 1000, 1)
+                self._checked_at = time.monotonic()
+            return self._result()
+
+    def last_result(self) -> Optional[dict]:
+        """Cached result without probing, or None if there is no fresh one."""
+        with self._lock:
+            if self._checked_at is None:
+                return None
+            if time.monotonic() - self._checked_at > 2 * self.interval_seconds:
+                return None  # Too old to act on
+            return self._result()
+
+    def _result(self) -> dict:
+        return {
+            "reachable": self._ok,
+            "error": self._error,
+            "latency_ms": self._latency_ms,
+            "age_seconds": round(time.monotonic() - self._checked_at, 1),
+        }
+
+
+class ReadinessMonitor:
+    """
+    Decides whether this process can take more work.
+
+    Not ready when any of these holds:
+    - the database probe failed
+    - more than max_pool_waiters requests wait for a pooled connection
+      (in the sync pool or, when the async path is enabled, the async one)
+    - the average checkout wait over the last 10s exceeds max_pool_wait_ms
+    - max_inflight_chats chat requests are in progress (0 = no limit)
+
+    In-flight counters are updated by LoadSheddingMiddleware on the event
+    loop thread.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        probe_interval_seconds: float,
+        max_pool_waiters: int,
+        max_pool_wait_ms: float,
+        max_inflight_chats: int,
+        async_engine: Optional[Engine] = None,
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            engine: Sync engine whose pool is watched
+            probe_interval_seconds: Database probe rate limit
+            max_pool_waiters: Connection waiters tolerated
+            max_pool_wait_ms: Average checkout wait tolerated
+            max_inflight_chats: Concurrent chat requests tolerated (0 = unlimited)
+            async_engine: AsyncEngine.sync_engine of the async path, if
+                enabled; its pool is watched too
+        """
+        self.engine = engine
+        self.async_engine = async_engine
+        self.probe = DatabaseProbe(engine, probe_interval_seconds)
+        self.max_pool_waiters = max_pool_waiters
+        self.max_pool_wait_ms = max_pool_wait_ms
+        self.max_inflight_chats = max_inflight_chats
+        self.inflight = 0
+        self.inflight_chats = 0
+        self.shed = 0
+
+    def _pools(self) -> dict:
+        """Watched pools by report section: pool and, if enabled, async_pool"""
+        pools = {"pool": self.engine.pool}
+        if self.async_engine is not None:
+            pools["async_pool"] = self.async_engine.pool
+        return pools
+
+    def pool_stats(self) -> dict:
+        """
+        Connection pool usage of every watched engine.
+
+        Returns:
+            dict of report section -> dict with size, checked_out,
+            overflow, checked_in and, for a TimedQueuePool, waiting /
+            avg_wait_ms / max_wait_ms
+        """
+        return {name: self._single_pool_stats(pool) for name, pool in self._pools().items()}
+
+    @staticmethod
+    def _single_pool_stats(pool) -> dict:
+        stats = {}
+        for name, attribute in (
+            ("size", "size"),
+            ("checked_out", "checkedout"),
+            ("overflow", "overflow"),
+            ("checked_in", "checkedin"),
+        ):
+            method = getattr(pool, attribute, None)
+            if method is not None:
+                stats[name] = method()
+        if hasattr(pool, "wait_stats"):
+            stats.update(pool.wait_stats())
+        return stats
+
+    def _saturation_reasons(self, pool: dict) -> List[str]:
+        reasons = []
+        if pool.get("waiting", 0) > self.max_pool_waiters:
+            reasons.append("db_pool_waiters")
+        if pool.get("avg_wait_ms", 0.0) > self.max_pool_wait_ms:
+            reasons.append("db_pool_wait_time")
+        return reasons
+
+    def _chats_full(self) -> bool:
+        return 0 < self.max_inflight_chats <= self.inflight_chats
+
+    def check(self) -> Tuple[bool, dict]:
+        """
+        Full readiness report; probes the database if due (blocking).
+
+        Returns:
+            (ready, report) - report has status, reasons, database,
+            pool and inflight sections
+        """
+        database = self.probe.check()
+        pools = self.pool_stats()
+
+        reasons = [] if database["reachable"] else ["db_unreachable"]
+        for pool in pools.values():
+            reasons += [r for r in self._saturation_reasons(pool) if r not in reasons]
+        if self._chats_full():
+            reasons.append("inflight_chats")
+
+        ready = not reasons
+        return ready, {
+            "status": "ready" if ready else "not_ready",
+            "reasons": reasons,
+            "database": database,
+            **pools,
+            "inflight": {
+                "requests": self.inflight,
+                "chats": self.inflight_chats,
+                "max_chats": self.max_inflight_chats,
+                "shed": self.shed,
+            },
+        }
+
+    def shed_reason(self, is_chat: bool) -> Optional[str]:
+        """
+        Why a new request should be rejected right now, if at all.
+
+        Cheap enough for every request: in-memory counters and the last
+        cached probe only, never a database round trip. Only live
+        signals count (not the 10s average wait), so admission resumes
+        as soon as the pool drains.
+
+        Args:
+            is_chat: Whether the request is a chat request
+
+        Returns:
+            Reason string, or None to admit the request
+        """
+        database = self.probe.last_result()
+        if database is not None and not database["reachable"]:
+            return "db_unreachable"
+
+        waiting = max(getattr(pool, "waiting", 0) for pool in self._pools().values())
+        if waiting > self.max_pool_waiters:
+            return "db_pool_waiters"
+
+        if is_chat and self._chats_full():
+            return "inflight_chats"
+        return None
+
+
+class LoadSheddingMiddleware:
+    """
+    Pure ASGI middleware: counts in-flight requests and sheds new ones.
+
+    Counting spans the whole response, streamed bodies included, which
+    is why this is not a BaseHTTPMiddleware. With shedding disabled the
+    middleware still counts, so /ready can report in-flight chats.
+    """
+
+    def __init__(self, app, monitor: ReadinessMonitor, enabled: bool = True, retry_after: int = 5):
+        self.app = app
+        self.monitor = monitor
+        self.enabled = enabled
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        is_chat = scope["method"] == "POST" and bool(CHAT_PATH.match(scope["path"]))
+        monitor = self.monitor
+
+        if self.enabled:
+            reason = monitor.shed_reason(is_chat)
+            if reason is not None:
+                monitor.shed += 1
+                await self._reject(send, reason)
+                return
+
+        monitor.inflight += 1
+        if is_chat:
+            monitor.inflight_chats += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            monitor.inflight -= 1
+            if is_chat:
+                monitor.inflight_chats -= 1
+
+    async def _reject(self, send, reason: str) -> None:
+        body = json.dumps(
+            {"detail": "Server is busy, please retry shortly", "reason": reason}
+        ).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(self.retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,118 @@
+"""
+Gunicorn Production Server Configuration
+
+Runs the ASGI app under gunicorn with uvicorn workers (uvloop event
+loop, httptools parser), one worker per CPU the container may use.
+
+Used by the Procfile and the backend container image:
+    gunicorn app.main:app -c gunicorn.conf.py                 # Phase II
+    gunicorn phase3.backend.api.main:app -c gunicorn.conf.py  # Phase II + III
+
+Environment overrides:
+    PORT                  Listen port (default 8000)
+    WEB_CONCURRENCY       Worker count (default: from the CPU limit)
+    WORKERS_PER_CORE      Workers per CPU when sizing automatically (default 1)
+    GRACEFUL_TIMEOUT      Seconds in-flight requests get on shutdown (default 90)
+    KEEPALIVE             HTTP keep-alive seconds (default 5)
+    LOG_LEVEL             Gunicorn/uvicorn log level (default warning)
+    ACCESS_LOG            "true" to log every request (default off)
+    PROMETHEUS_MULTIPROC_DIR  Empty directory for per-worker metric files;
+                          GET /metrics then aggregates all workers
+
+Every worker has its own database pool (DB_POOL_SIZE + DB_MAX_OVERFLOW
+connections) and its own in-memory caches and Gemini rate limiter, so
+size the pool for workers x replicas and use the Redis backends
+(TASK_CACHE_BACKEND, GEMINI_RATE_LIMIT_BACKEND) when running several.
+"""
+
+import math
+import os
+from pathlib import Path
+
+from uvicorn_worker import UvicornWorker
+
+
+def cpu_limit() -> float:
+    """
+    CPUs this process may use: the cgroup CPU quota if one is set
+    (container limits), otherwise the CPUs it is scheduled on.
+    """
+    try:  # cgroup v2: "<quota> <period>" or "max <period>"
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota != "max":
+            return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+
+    try:  # cgroup v1: quota is -1 when unlimited
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+
+    if hasattr(os, "sched_getaffinity"):
+        return float(len(os.sched_getaffinity(0)))
+    return float(os.cpu_count() or 1)
+
+
+def default_workers() -> int:
+    """One async worker per (rounded up) CPU, scaled by WORKERS_PER_CORE"""
+    per_core = float(os.environ.get("WORKERS_PER_CORE", "1"))
+    return max(1, math.ceil(cpu_limit() * per_core))
+
+
+class ProductionWorker(UvicornWorker):
+    """Uvicorn worker pinned to uvloop and httptools (uvicorn[standard])"""
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
+
+
+# Server socket
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+
+# Workers
+worker_class = ProductionWorker
+workers = int(os.environ.get("WEB_CONCURRENCY") or default_workers())
+
+# Import the app once in the master and fork it: faster worker (re)starts
+# and shared memory pages. Connections made before the fork must not be
+# reused by the children - see post_fork.
+preload_app = True
+
+# Timeouts. A chat turn may wait on several model calls (and the rate
+# limiter queue), so shutdown gives in-flight requests time to finish.
+# Async workers heartbeat from the event loop, so `timeout` only fires
+# for a worker whose loop is stuck.
+timeout = 120
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "90"))
+keepalive = int(os.environ.get("KEEPALIVE", "5"))
+
+# Logging: warnings and errors only unless asked otherwise
+loglevel = os.environ.get("LOG_LEVEL", "warning")
+accesslog = "-" if os.environ.get("ACCESS_LOG", "").lower() == "true" else None
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    """
+    Give each worker fresh database pools.
+
+    Pooled connections inherited from the master share sockets with
+    it; dispose(close=False) drops them from the child's pool without
+    closing the parent's copies.
+    """
+    from app.database import engine, get_async_engine
+
+    engine.dispose(close=False)
+    if get_async_engine.cache_info().currsize:
+        get_async_engine().sync_engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges from the shared metric files."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,176 @@
+"""
+Benchmark: Task entity memory and hydration time at 100k tasks
+
+Compares the Task entity as it was (attributes in a per-instance
+__dict__, every construction validated) with the current one
+(__slots__, and Task.from_storage for repository reads), over the same
+N loaded rows:
+
+- dict + validate (before): the old layout, built by Task.__init__
+- slots + validate: Task(...), as for user input
+- slots + from_storage (now): Task.from_storage(...), as to_domain does
+
+Reports the memory the N entities hold (tracemalloc; the title,
+description and timestamp objects are shared by all three and not
+counted) and the time to build them, plus to_domain over N in-memory
+TaskDB rows. No database is needed.
+
+Usage:
+    python scripts/benchmark_task_entity.py --tasks 100000 --repeat 5
+"""
+
+import argparse
+import gc
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{Path(tempfile.gettempdir()) / 'benchmark_task_entity.db'}"
+)
+
+from app.domain.entities.task import Task  # noqa: E402
+from app.domain.value_objects.task_status import TaskStatus  # noqa: E402
+from app.infrastructure.models import TaskDB  # noqa: E402
+from app.infrastructure.repositories.task_queries import to_domain  # noqa: E402
+
+
+class DictTask:
+    """Task's layout before __slots__: same constructor, __dict__ storage"""
+
+    __init__ = Task.__init__
+    _validate_title = staticmethod(Task._validate_title)
+    _validate_description = staticmethod(Task._validate_description)
+
+
+def _rows(count: int) -> List[tuple]:
+    """(id, title, description, status, created_at, updated_at) per task"""
+    now = datetime(2026, 1, 1)
+    return [
+        (
+            i,
+            f"Benchmark task {i}",
+            "Seeded by benchmark_task_entity.py" if i % 2 else "",
+            TaskStatus.COMPLETED if i % 3 == 0 else TaskStatus.PENDING,
+            now - timedelta(seconds=i),
+            now - timedelta(seconds=i) + timedelta(minutes=5),
+        )
+        for i in range(count)
+    ]
+
+
+def dict_validated(rows):
+    return [
+        DictTask(id=i, title=t, description=d, status=s, created_at=c, updated_at=u)
+        for i, t, d, s, c, u in rows
+    ]
+
+
+def slots_validated(rows):
+    return [
+        Task(id=i, title=t, description=d, status=s, created_at=c, updated_at=u)
+        for i, t, d, s, c, u in rows
+    ]
+
+
+def slots_from_storage(rows):
+    return [
+        Task.from_storage(id=i, title=t, description=d, status=s, created_at=c, updated_at=u)
+        for i, t, d, s, c, u in rows
+    ]
+
+
+def dict_to_domain(db_tasks):
+    """to_domain as it was: validating constructor, dict-backed entity"""
+    return [
+        DictTask(
+            id=db_task.id,
+            title=db_task.title,
+            description=db_task.description or "",
+            status=TaskStatus.COMPLETED if db_task.completed else TaskStatus.PENDING,
+            created_at=db_task.created_at,
+            updated_at=db_task.updated_at,
+        )
+        for db_task in db_tasks
+    ]
+
+
+def current_to_domain(db_tasks):
+    return [to_domain(db_task) for db_task in db_tasks]
+
+
+def retained_bytes(build: Callable, source) -> int:
+    """Bytes still allocated while the built list is alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        built = build(source)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del built
+    return retained
+
+
+def build_seconds(build: Callable, source, repeat: int) -> float:
+    """Median seconds to build the list, with the cyclic GC paused."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            build(source)
+            times.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _rows(args.tasks)
+    db_tasks = [
+        TaskDB(id=i, user_id="bench-user", title=t, description=d,
+               completed=s.is_completed(), created_at=c, updated_at=u)
+        for i, t, d, s, c, u in rows
+    ]
+
+    entities = {
+        "dict + validate (before)": dict_validated,
+        "slots + validate": slots_validated,
+        "slots + from_storage (now)": slots_from_storage,
+    }
+    print(f"\n{args.tasks} tasks, median of {args.repeat} runs")
+    print(f"{'entity':<28} {'memory MB':>10} {'B/task':>7} {'build ms':>9}")
+    baseline = None
+    for name, build in entities.items():
+        retained = retained_bytes(build, rows)
+        seconds = build_seconds(build, rows, args.repeat)
+        baseline = baseline or (retained, seconds)
+        print(f"{name:<28} {retained / 1e6:>10.1f} {retained / args.tasks:>7.0f} "
+              f"{seconds * 1000:>9.1f}  (memory {baseline[0] / retained:.2f}x, "
+              f"time {baseline[1] / seconds:.2f}x)")
+
+    print(f"\n{'to_domain over TaskDB rows':<28} {'build ms':>9}")
+    before = build_seconds(dict_to_domain, db_tasks, args.repeat)
+    now = build_seconds(current_to_domain, db_tasks, args.repeat)
+    print(f"{'before':<28} {before * 1000:>9.1f}")
+    print(f"{'now':<28} {now * 1000:>9.1f}  ({before / now:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
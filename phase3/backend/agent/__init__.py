@@ -6,12 +6,25 @@
 
 from .config import AGENT_CONFIG, SYSTEM_PROMPT
 from .executor import AgentExecutor
-from .result import AgentResult, ToolCallRecord
+from .fast_path import IntentMatch, IntentRouter, IntentRule, intent_router
+from .rate_limiter import RateLimitExceeded, RateLimiter, rate_limiter
+from .response_cache import ResponseCache, response_cache
+from .result import AgentEvent, AgentResult, ToolCallRecord
 
 __all__ = [
     "AGENT_CONFIG",
     "SYSTEM_PROMPT",
     "AgentExecutor",
+    "AgentEvent",
+    "IntentMatch",
+    "IntentRouter",
+    "IntentRule",
+    "intent_router",
+    "RateLimitExceeded",
+    "RateLimiter",
+    "rate_limiter",
+    "ResponseCache",
+    "response_cache",
     "AgentResult",
     "ToolCallRecord",
 ]
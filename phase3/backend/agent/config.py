@@ -4,6 +4,8 @@
 # Agent identity, model settings, and system prompt.
 # Updated for Google Gemini API
 
+import os
+
 # =========================
 # Agent Configuration
 # =========================
@@ -33,6 +35,52 @@ SYSTEM_PROMPT = """You are TodoAssistant, an AI that manages a to-do list using
 
 MAX_HISTORY_MESSAGES = 20
 
+# Estimated tokens (summary + recent messages) sent as history.
+# Past this budget, older messages are folded into the stored
+# conversation summary and only the most recent ones stay verbatim.
+HISTORY_TOKEN_BUDGET = 2000
+SUMMARY_KEEP_RECENT_MESSAGES = 6
+SUMMARY_MAX_TOKENS = 256
+
+# =========================
+# Tool Execution
+# =========================
+
+# Read-only tool calls from one model response that run at the same
+# time, each on its own pooled connection. Writes always run one
+# after another on the turn's session.
+MAX_PARALLEL_TOOL_CALLS = 4
+
+# =========================
+# Gemini Rate Limits
+# =========================
+
+# Quota shared by every chat in the process (or, with the redis
+# backend, by every worker). Calls beyond it wait in a fair per-user
+# queue; when the queue is full or the wait exceeds the deadline the
+# request is shed with 503. Defaults match the free tier.
+GEMINI_RATE_LIMIT = {
+    "rpm": int(os.environ.get("GEMINI_RPM", "15")),
+    "tpm": int(os.environ.get("GEMINI_TPM", "250000")),
+    "max_queue": int(os.environ.get("GEMINI_QUEUE_SIZE", "64")),
+    "max_wait_seconds": float(os.environ.get("GEMINI_QUEUE_TIMEOUT", "10")),
+    "backend": os.environ.get("GEMINI_RATE_LIMIT_BACKEND", "memory"),  # or "redis"
+}
+
+# Retries of a call rejected with 429; they do not use up tool rounds
+MAX_RATE_LIMIT_RETRIES = 3
+
+# =========================
+# Response Cache
+# =========================
+
+# Replies to read-only questions ("what's pending?"), reused while the
+# user's task list is unchanged. max_users=0 disables the cache.
+RESPONSE_CACHE = {
+    "max_users": int(os.environ.get("CHAT_RESPONSE_CACHE_USERS", "1024")),
+    "ttl_seconds": 600,
+}
+
 # =========================
 # Gemini Tool Definitions
 # (FLAT STRUCTURE — REQUIRED)
@@ -69,6 +117,17 @@ TOOL_DEFINITIONS = [
                     "default": "all",
                     "description": "Filter by task status",
                 },
+                "limit": {
+                    "type": "integer",
+                    "description": "Optional page size for large task lists",
+                },
+                "cursor": {
+                    "type": "string",
+                    "description": (
+                        "next_cursor from a previous list_tasks call, "
+                        "to fetch the next page"
+                    ),
+                },
             },
         },
     },
@@ -5,7 +5,7 @@
 import logging
 import os
 import asyncio
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, AsyncIterator
 
 from google import genai
 from google.genai import types
@@ -17,10 +17,39 @@ from .config import (
     SYSTEM_PROMPT,
     TOOL_DEFINITIONS,
     MAX_HISTORY_MESSAGES,
+    MAX_PARALLEL_TOOL_CALLS,
+    HISTORY_TOKEN_BUDGET,
+    SUMMARY_KEEP_RECENT_MESSAGES,
+    MAX_RATE_LIMIT_RETRIES,
+)
+from .fast_path import IntentRouter, intent_router
+from .metrics import (
+    LLM_CALLS,
+    RATE_LIMIT_BACKOFFS,
+    TOOL_CALLS,
+    TURN_ROUNDS,
+    TURNS,
+)
+from .rate_limiter import RateLimitExceeded, rate_limiter
+from .response_cache import (
+    READ_ONLY_TOOLS,
+    WRITE_TOOLS,
+    CacheKey,
+    classify_read_query,
+    is_cacheable,
+    response_cache,
+)
+from .result import AgentEvent, AgentResult, ToolCallRecord
+from .summarizer import (
+    SUMMARY_HEADER,
+    HistoryRow,
+    estimate_tokens,
+    split_for_summary,
+    summarize,
 )
-from .result import AgentResult, ToolCallRecord
 from ..repositories.conversation_repository import ConversationRepository
 from ..repositories.message_repository import MessageRepository
+from ..repositories.unit_of_work import UnitOfWork
 
 # MCP tools
 from ..mcp_tools.tools import (
@@ -29,6 +58,7 @@ from ..mcp_tools.tools import (
     complete_task,
     delete_task,
     update_task,
+    task_list_version,
 )
 
 logger = logging.getLogger(__name__)
@@ -66,30 +96,127 @@ def _convert_to_gemini_tools() -> List[FunctionDeclaration]:
 GEMINI_TOOLS = _convert_to_gemini_tools()
 
 
+def _to_contents(messages: List[Dict[str, Any]]) -> List[types.Content]:
+    """Convert chat messages into Gemini contents"""
+    contents: List[types.Content] = []
+
+    for msg in messages:
+        role = "user" if msg["role"] != "assistant" else "model"
+        contents.append(
+            types.Content(
+                role=role,
+                parts=[types.Part(text=msg["content"])],
+            )
+        )
+
+    return contents
+
+
+def _estimate_request_tokens(
+    contents: List[types.Content], config: types.GenerateContentConfig
+) -> int:
+    """Tokens a call will count against TPM: prompt estimate + output cap"""
+    text = str(config.system_instruction or "")
+    for content in contents:
+        for part in content.parts or []:
+            if part.text:
+                text += part.text
+            elif part.function_call or part.function_response:
+                text += str(part.function_call or part.function_response)
+
+    return estimate_tokens(text) + (config.max_output_tokens or 0)
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether the provider rejected a call for exceeding its quota"""
+    return "429" in str(error)
+
+
+def _build_generation_config(tool_calling_mode: str) -> types.GenerateContentConfig:
+    """Build the request config for one function calling mode"""
+    return types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT,
+        temperature=AGENT_CONFIG.get("temperature", 0.5),
+        max_output_tokens=AGENT_CONFIG.get("max_tokens", 512),
+        tools=[GEMINI_TOOL],
+        tool_config=types.ToolConfig(
+            function_calling_config=types.FunctionCallingConfig(
+                mode=tool_calling_mode
+            )
+        )
+    )
+
+
+# Static per process: built once, shared read-only by every request.
+# Identical system instruction + tools on every call also keep the
+# prompt prefix stable for Gemini's implicit context caching.
+GEMINI_TOOL = types.Tool(function_declarations=GEMINI_TOOLS)
+_GENERATION_CONFIGS = {
+    mode: _build_generation_config(mode) for mode in ("any", "auto")
+}
+
+
+def _generation_config(round_index: int) -> types.GenerateContentConfig:
+    """Request config for one tool-calling round (shared, do not mutate)"""
+    # On the first turn, force the model to call a function.
+    # On subsequent turns, allow it to generate a text response.
+    return _GENERATION_CONFIGS["any" if round_index == 0 else "auto"]
+
+
 class AgentExecutor:
-    def __init__(self, session: Session, user_id: str):
+    def __init__(
+        self,
+        session: Session,
+        user_id: str,
+        router: Optional[IntentRouter] = None,
+    ):
         self._session = session
         self._user_id = user_id
+        # Fast path for simple commands; IntentRouter(rules=[]) disables it
+        self._intent_router = router or intent_router
         self._conversation_repo = ConversationRepository(session, user_id)
         self._message_repo = MessageRepository(session, user_id)
+        # Tools run on this session too; the caller commits the turn once
+        self._unit_of_work = UnitOfWork(session)
+        # Set once a task write is pending in the unit of work; reads
+        # must then see it, so they join the unit of work too
+        self._tasks_written = False
+
+        # Model rounds of the current turn, for metrics
+        self._rounds = 0
 
         # ✅ USE FLASH-LITE FOR CHATBOTS
         self._model_name = AGENT_CONFIG.get(
             "model", "gemini-2.5-flash-lite"
         )
 
+    @property
+    def unit_of_work(self) -> UnitOfWork:
+        """The turn's unit of work; its owner commits or rolls it back"""
+        return self._unit_of_work
+
     async def execute(
         self,
         message: str,
         conversation_id: Optional[int] = None,
     ) -> AgentResult:
+        # A failed turn is rolled back, so a conversation it created is gone
+        requested_id = conversation_id
         try:
             conversation_id, messages = await self._hydrate(conversation_id)
             messages = await self._append_user_message(
                 conversation_id, message, messages
             )
 
-            response_text, tool_records = await self._invoke(messages)
+            fast = await self._fast_path(message)
+            cache_key, cached = (None, None) if fast else await self._cached_reply(message)
+            if fast or cached:
+                response_text, tool_records = fast or cached
+                TURNS.labels("fast_path" if fast else "response_cache").inc()
+            else:
+                response_text, tool_records = await self._invoke(messages)
+                self._cache_reply(cache_key, response_text, tool_records)
+                self._record_model_turn()
 
             await self._persist_assistant_message(
                 conversation_id, response_text, tool_records
@@ -101,36 +228,160 @@ class AgentExecutor:
                 tool_calls=tool_records,
             )
 
+        except RateLimitExceeded:
+            raise  # Shed: the router answers 503 and nothing is committed
         except Exception:
             logger.exception("Agent execution failed")
             return AgentResult.error(
-                conversation_id=conversation_id or 0,
+                conversation_id=requested_id or 0,
+                message="Something went wrong. Please try again.",
+            )
+
+    async def stream(
+        self,
+        message: str,
+        conversation_id: Optional[int] = None,
+    ) -> AsyncIterator[AgentEvent]:
+        """
+        Same as execute(), but yields events as they happen:
+        conversation (first), then token / tool_call events in order,
+        then done (with the full result) or error.
+
+        The assistant message is persisted before done is yielded.
+        After an error event the caller rolls the turn back.
+        """
+        requested_id = conversation_id
+        try:
+            conversation_id, messages = await self._hydrate(conversation_id)
+            yield AgentEvent.conversation(conversation_id)
+
+            messages = await self._append_user_message(
+                conversation_id, message, messages
+            )
+
+            text_parts: List[str] = []
+            tool_records: List[ToolCallRecord] = []
+
+            fast = await self._fast_path(message)
+            cache_key, cached = (None, None) if fast else await self._cached_reply(message)
+            if fast or cached:
+                response_text, tool_records = fast or cached
+                TURNS.labels("fast_path" if fast else "response_cache").inc()
+                for record in tool_records:
+                    yield AgentEvent.tool_call(record)
+                yield AgentEvent.token(response_text)
+            else:
+                async for event in self._invoke_stream(messages, tool_records):
+                    if event.type == AgentEvent.TOKEN:
+                        text_parts.append(event.data["text"])
+                    yield event
+
+                response_text = "".join(text_parts).strip()
+                self._cache_reply(cache_key, response_text, tool_records)
+                self._record_model_turn()
+            await self._persist_assistant_message(
+                conversation_id, response_text, tool_records
+            )
+
+            yield AgentEvent.done(
+                AgentResult(
+                    conversation_id=conversation_id,
+                    response=response_text,
+                    tool_calls=tool_records,
+                )
+            )
+
+        except RateLimitExceeded as e:
+            logger.warning(f"Agent streaming shed: {e.reason}")
+            yield AgentEvent.error(
+                conversation_id=requested_id or 0,
+                message="The assistant is busy right now. Please try again shortly.",
+            )
+        except Exception:
+            logger.exception("Agent streaming failed")
+            yield AgentEvent.error(
+                conversation_id=requested_id or 0,
                 message="Something went wrong. Please try again.",
             )
 
     async def _hydrate(
         self, conversation_id: Optional[int]
     ) -> Tuple[int, List[Dict[str, Any]]]:
+        # Sync session: run queries in a worker thread, not on the event loop
+        conversation_id, summary, window = await self._unit_of_work.run(
+            self._load_conversation, conversation_id
+        )
 
-        if conversation_id is None:
-            conversation = self._conversation_repo.create()
-            conversation_id = conversation.id
-            history = []
-        else:
-            conversation = self._conversation_repo.get_by_id(conversation_id)
-            history = (
-                self._message_repo.get_history(conversation_id)
-                if conversation
-                else []
+        to_fold, window = split_for_summary(
+            summary,
+            window,
+            HISTORY_TOKEN_BUDGET,
+            SUMMARY_KEEP_RECENT_MESSAGES,
+            MAX_HISTORY_MESSAGES,
+        )
+        if to_fold:
+            await rate_limiter.acquire(
+                self._user_id,
+                estimate_tokens(summary or "")
+                + sum(estimate_tokens(content) for _, _, content in to_fold),
             )
+            try:
+                summary = await summarize(
+                    _client, self._model_name, summary, to_fold
+                )
+            except Exception:
+                # Over budget this turn beats losing context
+                LLM_CALLS.labels("summary", "error").inc()
+                logger.warning("Summarization failed", exc_info=True)
+                window = (to_fold + window)[-MAX_HISTORY_MESSAGES:]
+            else:
+                LLM_CALLS.labels("summary", "ok").inc()
+                await self._unit_of_work.run(
+                    self._conversation_repo.save_summary,
+                    conversation_id,
+                    summary,
+                    to_fold[-1][0],
+                )
 
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+        # The system prompt is not a message: it is sent once per call as
+        # the config's system_instruction (see _generation_config)
+        messages: List[Dict[str, Any]] = []
+
+        if summary:
+            messages.append(
+                {"role": "user", "content": f"{SUMMARY_HEADER}\n{summary}"}
+            )
 
-        for msg in history[-MAX_HISTORY_MESSAGES:]:
-            messages.append({"role": msg.role, "content": msg.content})
+        for _, role, content in window:
+            messages.append({"role": role, "content": content})
 
         return conversation_id, messages
 
+    def _load_conversation(
+        self, conversation_id: Optional[int]
+    ) -> Tuple[int, Optional[str], List[HistoryRow]]:
+        """Resolve the conversation; return its summary and unsummarized messages"""
+
+        if conversation_id is None:
+            conversation = self._conversation_repo.create()
+            return conversation.id, None, []
+
+        conversation = self._conversation_repo.get_by_id(conversation_id)
+        if not conversation:
+            return conversation_id, None, []
+
+        after_id = conversation.summary_message_id
+        # One row past the window tells whether any unsummarized message
+        # has fallen out of it; if so, load them all so they get folded
+        window = self._message_repo.get_recent(
+            conversation_id, MAX_HISTORY_MESSAGES + 1, after_id=after_id
+        )
+        if len(window) > MAX_HISTORY_MESSAGES:
+            window = self._message_repo.get_recent(
+                conversation_id, None, after_id=after_id
+            )
+        return conversation_id, conversation.summary, window
+
     async def _append_user_message(
         self,
         conversation_id: int,
@@ -138,69 +389,131 @@ class AgentExecutor:
         messages: List[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
 
-        self._message_repo.add(
-            conversation_id=conversation_id,
-            role="user",
-            content=message,
-            tool_calls=None,
+        await self._unit_of_work.run(
+            self._add_message, conversation_id, "user", message, None
         )
 
-        self._conversation_repo.update_timestamp(conversation_id)
         messages.append({"role": "user", "content": message})
         return messages
 
-    async def _invoke(
-        self, messages: List[Dict[str, Any]]
-    ) -> Tuple[str, List[ToolCallRecord]]:
-
-        tool_records: List[ToolCallRecord] = []
-        contents: List[types.Content] = []
+    async def _fast_path(
+        self, message: str
+    ) -> Optional[Tuple[str, List[ToolCallRecord]]]:
+        """
+        Handle a simple command without the model.
+
+        Returns:
+            (templated reply, [tool record]) if the message matched a
+            fast-path rule, None to fall through to the LLM
+        """
+        match = self._intent_router.match(message)
+        if match is None:
+            return None
+
+        result, record = await self._execute_tool(match.tool, match.arguments)
+        return self._intent_router.render(match, result), [record]
+
+    async def _cached_reply(
+        self, message: str
+    ) -> Tuple[Optional[CacheKey], Optional[Tuple[str, List[ToolCallRecord]]]]:
+        """
+        Look up a cached reply to a read-only question.
+
+        Returns:
+            (cache key, hit) - key is None if the message is not
+            cacheable, hit is (reply, tool records) or None
+        """
+        if not response_cache.enabled:
+            return None, None
+
+        intent = classify_read_query(message)
+        if intent is None:
+            return None, None
+
+        version = await task_list_version(
+            self._user_id, unit_of_work=self._unit_of_work
+        )
+        key = (intent, version)
+        return key, response_cache.get(self._user_id, key)
 
-        for msg in messages:
-            role = "user" if msg["role"] != "assistant" else "model"
-            contents.append(
-                types.Content(
-                    role=role,
-                    parts=[types.Part(text=msg["content"])],
-                )
+    def _cache_reply(
+        self,
+        cache_key: Optional[CacheKey],
+        response_text: str,
+        tool_records: List[ToolCallRecord],
+    ) -> None:
+        """Store a model reply if it answered a cacheable question from reads only"""
+        if cache_key and response_text and is_cacheable(tool_records):
+            response_cache.put(
+                self._user_id, cache_key, response_text, tool_records
             )
 
-        backoff = 1.0
+    def _record_model_turn(self) -> None:
+        """Count a model-answered turn and how many rounds it took"""
+        TURNS.labels("model").inc()
+        TURN_ROUNDS.observe(self._rounds)
 
-        # ✅ LIMIT TOOL CHAINS (prevents RPM burn)
-        for i in range(5):
-            # --- DYNAMIC TOOL CONFIG ---
-            # On the first turn, force the model to call a function.
-            # On subsequent turns, allow it to generate a text response.
-            tool_calling_mode = "any" if i == 0 else "auto"
-            
-            config = types.GenerateContentConfig(
-                system_instruction=SYSTEM_PROMPT,
-                temperature=AGENT_CONFIG.get("temperature", 0.5),
-                max_output_tokens=AGENT_CONFIG.get("max_tokens", 512),
-                tools=[types.Tool(function_declarations=GEMINI_TOOLS)],
-                tool_config=types.ToolConfig(
-                    function_calling_config=types.FunctionCallingConfig(
-                        mode=tool_calling_mode
-                    )
-                )
-            )
-            # --- END DYNAMIC TOOL CONFIG ---
-            
+    async def _acquire_model_slot(
+        self,
+        contents: List[types.Content],
+        config: types.GenerateContentConfig,
+    ) -> None:
+        """Wait for the process-wide rate limiter to allow one model call"""
+        await rate_limiter.acquire(
+            self._user_id, _estimate_request_tokens(contents, config)
+        )
+
+    async def _back_off(self, attempt: int) -> None:
+        """After a 429, hold every caller's grants, not just this one's"""
+        seconds = min(2 ** attempt, 20)
+        RATE_LIMIT_BACKOFFS.inc()
+        logger.warning(f"Rate limited by provider. Pausing model calls for {seconds}s")
+        await rate_limiter.pause(seconds)
+
+    async def _generate(
+        self,
+        contents: List[types.Content],
+        config: types.GenerateContentConfig,
+    ) -> Any:
+        """
+        One model call within the rate limit.
+
+        A 429 pauses the limiter and retries (up to
+        MAX_RATE_LIMIT_RETRIES) without using up a tool round.
+
+        Raises:
+            RateLimitExceeded: If the call is shed while queued
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self._acquire_model_slot(contents, config)
             try:
-                response = _client.models.generate_content(
+                response = await _client.aio.models.generate_content(
                     model=self._model_name,
                     contents=contents,
                     config=config,
                 )
             except Exception as e:
-                # ✅ RATE LIMIT BACKOFF
-                if "429" in str(e):
-                    logger.warning("Rate limited. Backing off...")
-                    await asyncio.sleep(backoff)
-                    backoff = min(backoff * 2, 20)
-                    continue
-                raise
+                rate_limited = _is_rate_limited(e)
+                LLM_CALLS.labels("generate", "rate_limited" if rate_limited else "error").inc()
+                if not rate_limited or attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                await self._back_off(attempt)
+            else:
+                LLM_CALLS.labels("generate", "ok").inc()
+                return response
+
+    async def _invoke(
+        self, messages: List[Dict[str, Any]]
+    ) -> Tuple[str, List[ToolCallRecord]]:
+
+        tool_records: List[ToolCallRecord] = []
+        contents = _to_contents(messages)
+
+        # ✅ LIMIT TOOL CHAINS (prevents RPM burn)
+        for i in range(5):
+            self._rounds = i + 1
+            config = _generation_config(i)
+            response = await self._generate(contents, config)
 
             if not response.candidates:
                 return "No response received.", tool_records
@@ -225,15 +538,12 @@ class AgentExecutor:
 
             response_parts: List[types.Part] = []
 
-            for call in function_calls:
-                result, record = await self._execute_tool(
-                    call.name, dict(call.args or {})
-                )
+            for result, record in await self._execute_tools(function_calls):
                 tool_records.append(record)
 
                 response_parts.append(
                     types.Part.from_function_response(
-                        name=call.name,
+                        name=record.tool,
                         response=result,
                     )
                 )
@@ -244,22 +554,182 @@ class AgentExecutor:
 
         return "I completed your request.", tool_records
 
+    async def _invoke_stream(
+        self,
+        messages: List[Dict[str, Any]],
+        tool_records: List[ToolCallRecord],
+    ) -> AsyncIterator[AgentEvent]:
+        """
+        Streaming counterpart of _invoke: yields text as token events as
+        it arrives and a tool_call event after each tool runs. Executed
+        tool calls are also appended to tool_records.
+        """
+        contents = _to_contents(messages)
+
+        # ✅ LIMIT TOOL CHAINS (prevents RPM burn)
+        for i in range(5):
+            self._rounds = i + 1
+            config = _generation_config(i)
+
+            for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+                parts: List[types.Part] = []
+                function_calls = []
+                got_candidate = False
+                emitted_text = False
+
+                await self._acquire_model_slot(contents, config)
+                try:
+                    stream = await _client.aio.models.generate_content_stream(
+                        model=self._model_name,
+                        contents=contents,
+                        config=config,
+                    )
+                    async for chunk in stream:
+                        if not chunk.candidates:
+                            continue
+                        got_candidate = True
+
+                        content = chunk.candidates[0].content
+                        if not content or not content.parts:
+                            continue
+
+                        for part in content.parts:
+                            parts.append(part)
+                            if part.function_call:
+                                function_calls.append(part.function_call)
+                            elif part.text:
+                                emitted_text = True
+                                yield AgentEvent.token(part.text)
+                    LLM_CALLS.labels("stream", "ok").inc()
+                    break
+                except Exception as e:
+                    rate_limited = _is_rate_limited(e)
+                    LLM_CALLS.labels("stream", "rate_limited" if rate_limited else "error").inc()
+                    # ✅ RATE LIMIT BACKOFF (only if nothing was sent yet)
+                    if (
+                        not rate_limited
+                        or emitted_text
+                        or attempt == MAX_RATE_LIMIT_RETRIES
+                    ):
+                        raise
+                    await self._back_off(attempt)
+
+            if not got_candidate:
+                yield AgentEvent.token("No response received.")
+                return
+
+            if not parts:
+                yield AgentEvent.token("I didn’t understand that. Please try again.")
+                return
+
+            if not function_calls:
+                return
+
+            contents.append(types.Content(role="model", parts=parts))
+
+            response_parts: List[types.Part] = []
+
+            for result, record in await self._execute_tools(function_calls):
+                tool_records.append(record)
+                yield AgentEvent.tool_call(record)
+
+                response_parts.append(
+                    types.Part.from_function_response(
+                        name=record.tool,
+                        response=result,
+                    )
+                )
+
+            contents.append(
+                types.Content(role="user", parts=response_parts)
+            )
+
+        yield AgentEvent.token("I completed your request.")
+
+    async def _execute_tools(
+        self, function_calls: List[Any]
+    ) -> List[Tuple[Any, ToolCallRecord]]:
+        """
+        Run the function calls of one model response.
+
+        Consecutive read-only calls run concurrently (at most
+        MAX_PARALLEL_TOOL_CALLS at a time), each on a session of its
+        own, as long as the turn has no task write pending. Every other
+        call runs alone, in the order the model issued it, on the turn's
+        unit of work, whose session serializes database access anyway.
+        Results come back in call order, so tool records and function
+        responses stay deterministic.
+        """
+        results: List[Any] = [None] * len(function_calls)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+        reads: List[int] = []
+
+        async def run_read(index: int) -> None:
+            call = function_calls[index]
+            async with semaphore:
+                results[index] = await self._execute_tool(
+                    call.name, dict(call.args or {}), own_session=True
+                )
+
+        async def flush_reads() -> None:
+            await asyncio.gather(*(run_read(index) for index in reads))
+            reads.clear()
+
+        for index, call in enumerate(function_calls):
+            if call.name in READ_ONLY_TOOLS and not self._tasks_written:
+                reads.append(index)
+                continue
+            # Reads the model issued before this call see the tasks as
+            # they were before it
+            await flush_reads()
+            results[index] = await self._execute_tool(
+                call.name, dict(call.args or {})
+            )
+        await flush_reads()
+        return results
+
     async def _execute_tool(
-        self, tool_name: str, arguments: Dict[str, Any]
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        own_session: bool = False,
     ) -> Tuple[Any, ToolCallRecord]:
+        """
+        Run one tool call for the user.
+
+        On the turn's unit of work by default; own_session=True (read-only
+        tools with no task write pending) lets the tool open its own.
+        """
 
-        arguments = {**arguments, "user_id": self._user_id}
+        arguments = {
+            k: v for k, v in arguments.items() if k != "unit_of_work"
+        }
+        arguments["user_id"] = self._user_id
         tool = _TOOL_FUNCTIONS.get(tool_name)
 
+        if tool_name in WRITE_TOOLS:
+            self._tasks_written = True
+
         if not tool:
             result = {"error": "unknown_tool"}
         else:
             try:
-                result = await tool(**arguments)
+                result = await tool(
+                    **arguments,
+                    unit_of_work=None if own_session else self._unit_of_work,
+                )
             except Exception:
                 logger.exception("Tool execution failed")
                 result = {"error": "tool_execution_failed"}
 
+        failed = isinstance(result, dict) and "error" in result
+        # Unknown names come from the model: one label, not one per name
+        TOOL_CALLS.labels(
+            tool_name if tool else "unknown", "error" if failed else "ok"
+        ).inc()
+        if tool_name in WRITE_TOOLS and not failed:
+            response_cache.invalidate(self._user_id)
+
         record = ToolCallRecord(
             tool=tool_name,
             arguments={k: v for k, v in arguments.items() if k != "user_id"},
@@ -288,10 +758,26 @@ class AgentExecutor:
             else None
         )
 
+        await self._unit_of_work.run(
+            self._add_message,
+            conversation_id,
+            "assistant",
+            response_text,
+            tool_calls,
+        )
+
+    def _add_message(
+        self,
+        conversation_id: int,
+        role: str,
+        content: str,
+        tool_calls: Optional[List[Dict[str, Any]]],
+    ) -> None:
+        """Store a message and bump the conversation (blocking, run in a thread)"""
         self._message_repo.add(
             conversation_id=conversation_id,
-            role="assistant",
-            content=response_text,
+            role=role,
+            content=content,
             tool_calls=tool_calls,
         )
 
@@ -0,0 +1,156 @@
+# Fake Gemini client for load and concurrency checks
+# Spec: agent.spec.md
+#
+# Drop-in stand-in for genai.Client with a configurable latency and
+# scripted function calls, so the agent can be exercised without
+# network access or API quota.
+# Install with: executor._client = FakeGenaiClient(...)
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+from google.genai import types
+
+# (tool_name, arguments) of one function call
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+def _response(parts: List[types.Part]) -> Any:
+    """Wrap parts in the candidates[0].content shape the executor reads"""
+    return SimpleNamespace(
+        candidates=[
+            SimpleNamespace(content=types.Content(role="model", parts=parts))
+        ]
+    )
+
+
+class _FakeModels:
+    """Shared reply logic for the sync and async model facades"""
+
+    def __init__(self, owner: "FakeGenaiClient") -> None:
+        self._owner = owner
+
+    def _chunks(
+        self, contents: Any, config: Optional[types.GenerateContentConfig]
+    ) -> List[List[types.Part]]:
+        owner = self._owner
+        owner.calls += 1
+
+        calls = owner.scripted_calls(contents)
+        if calls:
+            return [[
+                types.Part(function_call=types.FunctionCall(name=name, args=args))
+                for name, args in calls
+            ]]
+
+        if owner.tool_call is not None and _tool_mode(config) == "ANY":
+            name, args = owner.tool_call
+            return [[types.Part(function_call=types.FunctionCall(name=name, args=args))]]
+
+        words = owner.reply.split(" ")
+        return [
+            [types.Part(text=word if i == len(words) - 1 else word + " ")]
+            for i, word in enumerate(words)
+        ]
+
+
+class _SyncModels(_FakeModels):
+    """client.models - blocks the calling thread for `latency` seconds"""
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> Any:
+        time.sleep(self._owner.latency)
+        return _response([p for chunk in self._chunks(contents, config) for p in chunk])
+
+
+class _AsyncModels(_FakeModels):
+    """client.aio.models - awaits `latency` seconds without blocking the loop"""
+
+    async def generate_content(self, model: str, contents: Any, config: Any = None) -> Any:
+        await asyncio.sleep(self._owner.latency)
+        return _response([p for chunk in self._chunks(contents, config) for p in chunk])
+
+    async def generate_content_stream(
+        self, model: str, contents: Any, config: Any = None
+    ) -> AsyncIterator[Any]:
+        chunks = self._chunks(contents, config)
+        delay = self._owner.latency / max(len(chunks), 1)
+
+        async def stream() -> AsyncIterator[Any]:
+            for chunk in chunks:
+                await asyncio.sleep(delay)
+                yield _response(chunk)
+
+        return stream()
+
+
+def _turn_position(contents: Any) -> Tuple[str, int]:
+    """
+    Latest user message text and the current round within its turn.
+
+    The round is the number of model contents after that message, i.e.
+    how many tool rounds the executor has already completed.
+    """
+    contents = list(contents or [])
+    for index in range(len(contents) - 1, -1, -1):
+        content = contents[index]
+        texts = [part.text for part in content.parts or [] if part.text]
+        if content.role == "user" and texts:
+            rounds = sum(1 for later in contents[index + 1:] if later.role == "model")
+            return "".join(texts), rounds
+    return "", 0
+
+
+def _tool_mode(config: Optional[types.GenerateContentConfig]) -> Optional[str]:
+    """Function calling mode of a request config ("ANY", "AUTO", ...)"""
+    try:
+        mode = config.tool_config.function_calling_config.mode
+    except AttributeError:
+        return None
+    return str(getattr(mode, "value", mode)).upper()
+
+
+class FakeGenaiClient:
+    """
+    Minimal genai.Client replacement.
+
+    When the latest user message contains a key of `scripts`, round i
+    of that turn answers with the function calls scripts[key][i]. Else,
+    when tool_call is set, requests made in forced function-calling
+    mode ("any", the first round) answer with that call. Every other
+    request answers with `reply`, streamed one word per chunk.
+
+    Args:
+        latency: Seconds each generate_content call takes
+        reply: Text returned once no tool call is due
+        tool_call: Optional (tool_name, arguments) for the first round
+        scripts: Optional {message substring: [round calls, ...]}; the
+            first matching key wins
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.5,
+        reply: str = "Done.",
+        tool_call: Optional[ToolCall] = None,
+        scripts: Optional[Dict[str, Sequence[Sequence[ToolCall]]]] = None,
+    ) -> None:
+        self.latency = latency
+        self.reply = reply
+        self.tool_call = tool_call
+        self.scripts = scripts or {}
+        self.calls = 0
+        self.models = _SyncModels(self)
+        self.aio = SimpleNamespace(models=_AsyncModels(self))
+
+    def scripted_calls(self, contents: Any) -> List[ToolCall]:
+        """Function calls scripted for this request, empty if none are due"""
+        if not self.scripts:
+            return []
+
+        message, round_index = _turn_position(contents)
+        for key, rounds in self.scripts.items():
+            if key in message:
+                return list(rounds[round_index]) if round_index < len(rounds) else []
+        return []
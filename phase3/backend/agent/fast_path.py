@@ -0,0 +1,230 @@
+# Fast-Path Intent Router
+# Spec: agent.spec.md Section 4.6
+#
+# Answers trivially parseable commands ("add buy milk", "complete 12",
+# "delete task 4", "show pending") by calling the MCP tool directly and
+# rendering a templated reply - no model round trips. Anything that
+# does not fully match a rule falls through to the LLM.
+
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Pattern
+
+# Messages that look like these are left to the model even if a rule
+# would match: questions, lists of several items, and long inputs.
+_AMBIGUOUS = re.compile(r"[?,;\n]|\b(?:and|then|also)\b", re.IGNORECASE)
+MAX_FAST_PATH_LENGTH = 120
+
+
+@dataclass(frozen=True)
+class IntentMatch:
+    """A recognized command: the tool to call and its arguments"""
+
+    intent: str
+    tool: str
+    arguments: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class IntentRule:
+    """
+    One fast-path command.
+
+    Attributes:
+        intent: Metric label ("add", "complete", ...)
+        tool: MCP tool name to call
+        pattern: Regex that must match the whole (stripped) message
+        arguments: Builds tool arguments from the match's named groups
+        render: Builds the reply from the tool arguments and result
+    """
+
+    intent: str
+    tool: str
+    pattern: Pattern[str]
+    arguments: Callable[[Dict[str, str]], Dict[str, Any]]
+    render: Callable[[Dict[str, Any], Dict[str, Any]], str]
+
+
+def _rule(intent, tool, pattern, arguments, render) -> IntentRule:
+    return IntentRule(intent, tool, re.compile(pattern, re.IGNORECASE), arguments, render)
+
+
+# =========================
+# Reply templates
+# =========================
+
+_FAILED = "Sorry, I couldn't do that right now. Please try again."
+
+
+def _render_add(args: Dict[str, Any], result: Dict[str, Any]) -> str:
+    if result.get("error") == "validation":
+        return f"I couldn't add that task: {result.get('message')}"
+    if "error" in result:
+        return _FAILED
+    return f"Okay, I've added '{result['title']}' as task #{result['task_id']}."
+
+
+def _render_task_change(template: str) -> Callable[[Dict[str, Any], Dict[str, Any]], str]:
+    """Renderer for single-task tools; template gets the result's title and task_id"""
+
+    def render(args: Dict[str, Any], result: Dict[str, Any]) -> str:
+        if result.get("error") == "not_found":
+            return (
+                f"I couldn't find task #{args['task_id']}. "
+                "Say \"show my tasks\" to see your list."
+            )
+        if "error" in result:
+            return _FAILED
+        return template.format(title=result["title"], task_id=result["task_id"])
+
+    return render
+
+
+def _render_list(args: Dict[str, Any], result: Dict[str, Any]) -> str:
+    if "error" in result:
+        return _FAILED
+
+    label = "" if args["status"] == "all" else f"{args['status']} "
+    tasks = result.get("tasks", [])
+    if not tasks:
+        return f"You have no {label}tasks."
+
+    lines = [f"Here are your {label}tasks:"]
+    for task in tasks:
+        mark = "x" if task["completed"] else " "
+        lines.append(f"- [{mark}] #{task['id']} {task['title']}")
+    return "\n".join(lines)
+
+
+_NOT_A_TITLE = (
+    r"(?!(?:#?\d+|it|this|that|them|these|those|one|something|everything)[.!]?$)"
+    r"(?!(?:(?:my|your|our|the|all|these|those|some)\s+)?(?:tasks|todos)\b)"
+)
+
+_STATUS_WORDS = {
+    "pending": "pending",
+    "open": "pending",
+    "completed": "completed",
+    "done": "completed",
+}
+
+DEFAULT_RULES: List[IntentRule] = [
+    _rule(
+        "add",
+        "add_task",
+        r"(?:please\s+)?(?:add|create)\s+"
+        r"(?!(?:a\s+)?(?:new\s+)?(?:tasks?|todos?)[.!]?$)"
+        r"(?:a\s+)?(?:new\s+)?"
+        # "task"/"todo" only as a whole word: "add taskforce meeting" keeps it
+        r"(?:(?:task|todo)\b(?:\s*:\s*|\s+(?:to\s+)?)|:\s*|to\s+)?"
+        # Not a title: a bare number or pronoun, or a phrase about the
+        # list itself ("add tasks for tomorrow", "add my tasks to calendar")
+        + _NOT_A_TITLE
+        + r"(?P<title>\S.{0,199}?)[.!]?",
+        lambda g: {"title": g["title"].strip("'\"")},
+        _render_add,
+    ),
+    _rule(
+        "complete",
+        "complete_task",
+        r"(?:please\s+)?(?:complete|finish|mark|check\s+off)\s+"
+        r"(?:task\s+)?#?(?P<task_id>\d+)"
+        r"(?:\s+(?:as\s+)?(?:done|complete|completed))?[.!]?",
+        lambda g: {"task_id": int(g["task_id"])},
+        _render_task_change("Done! I've marked '{title}' (task #{task_id}) as completed."),
+    ),
+    _rule(
+        "delete",
+        "delete_task",
+        r"(?:please\s+)?(?:delete|remove)\s+(?:task\s+)?#?(?P<task_id>\d+)[.!]?",
+        lambda g: {"task_id": int(g["task_id"])},
+        _render_task_change("I've deleted '{title}' (task #{task_id})."),
+    ),
+    _rule(
+        "list",
+        "list_tasks",
+        r"(?:show|list|view)(?:\s+me)?(?:\s+(?:my|all))?"
+        r"(?:\s+(?P<status>pending|open|completed|done))?"
+        r"(?:\s+(?:tasks|todos|task\s+list|list))?[.!]?",
+        lambda g: {"status": _STATUS_WORDS.get((g["status"] or "").lower(), "all")},
+        _render_list,
+    ),
+]
+
+
+class FastPathStats:
+    """Hit/miss counters for the fast path (process-wide, thread-safe)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._misses = 0
+        self._hits: Dict[str, int] = {}
+
+    def record_hit(self, intent: str) -> None:
+        with self._lock:
+            self._hits[intent] = self._hits.get(intent, 0) + 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring: hits, misses, hit_ratio, hits_by_intent"""
+        with self._lock:
+            hits = sum(self._hits.values())
+            total = hits + self._misses
+            return {
+                "hits": hits,
+                "misses": self._misses,
+                "hit_ratio": round(hits / total, 4) if total else 0.0,
+                "hits_by_intent": dict(self._hits),
+            }
+
+
+class IntentRouter:
+    """
+    Matches a chat message against fast-path rules.
+
+    Rules are tried in order; the first whose pattern matches the whole
+    message wins. Pass a custom rule list to extend or replace the
+    defaults, or rules=[] to disable the fast path.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[List[IntentRule]] = None,
+        stats: Optional[FastPathStats] = None,
+    ):
+        self._rules = {rule.intent: rule for rule in (DEFAULT_RULES if rules is None else rules)}
+        self.stats = stats or FastPathStats()
+
+    def match(self, message: str) -> Optional[IntentMatch]:
+        """
+        Recognize a message, counting the hit or miss.
+
+        Args:
+            message: Raw user message
+
+        Returns:
+            IntentMatch, or None to fall through to the LLM
+        """
+        text = " ".join(message.split())
+
+        if len(text) <= MAX_FAST_PATH_LENGTH and not _AMBIGUOUS.search(text):
+            for rule in self._rules.values():
+                m = rule.pattern.fullmatch(text)
+                if m:
+                    self.stats.record_hit(rule.intent)
+                    return IntentMatch(rule.intent, rule.tool, rule.arguments(m.groupdict()))
+
+        self.stats.record_miss()
+        return None
+
+    def render(self, match: IntentMatch, result: Dict[str, Any]) -> str:
+        """Reply text for a matched command given its tool result"""
+        return self._rules[match.intent].render(match.arguments, result)
+
+
+# Shared by every AgentExecutor so stats cover the whole process
+intent_router = IntentRouter()
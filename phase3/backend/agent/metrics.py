@@ -0,0 +1,40 @@
+# Agent Metrics
+# Spec: agent.spec.md Section 4.9
+#
+# Prometheus counters for the executor's hot paths, registered in the
+# default registry so they appear on the app's GET /metrics. Each
+# update is a single in-memory increment.
+
+from prometheus_client import Counter, Histogram
+
+# kind: generate | stream | summary; outcome: ok | error | rate_limited
+LLM_CALLS = Counter(
+    "agent_llm_calls",
+    "Gemini calls made by the agent",
+    ["kind", "outcome"],
+)
+
+# outcome: ok | error (the tool returned or raised an error)
+TOOL_CALLS = Counter(
+    "agent_tool_calls",
+    "MCP tool calls made by the agent",
+    ["tool", "outcome"],
+)
+
+RATE_LIMIT_BACKOFFS = Counter(
+    "agent_rate_limit_backoffs",
+    "429 responses from Gemini that paused model calls",
+)
+
+# path: fast_path | response_cache | model
+TURNS = Counter(
+    "agent_turns",
+    "Chat turns by how they were answered",
+    ["path"],
+)
+
+TURN_ROUNDS = Histogram(
+    "agent_turn_model_rounds",
+    "Model rounds (tool-calling iterations) per model-answered turn",
+    buckets=(1, 2, 3, 4, 5),
+)
@@ -0,0 +1,308 @@
+# Gemini Rate Limiter
+# Spec: agent.spec.md Section 4.7
+#
+# Process-wide token buckets for the model's RPM/TPM quota, with a
+# fair per-user wait queue. Requests that cannot be served in time are
+# shed with RateLimitExceeded (HTTP 503) instead of piling up as
+# sleeping coroutines. Optionally shares the quota across workers via
+# Redis (GEMINI_RATE_LIMIT_BACKEND=redis).
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+
+from .config import GEMINI_RATE_LIMIT
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """
+    A model call was shed by the rate limiter.
+
+    Attributes:
+        reason: "queue_full" or "deadline"
+        retry_after: Suggested client back-off in seconds
+    """
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"Model rate limit: {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class LocalQuota:
+    """Token buckets for one process: requests/min and tokens/min"""
+
+    def __init__(self, rpm: int, tpm: int):
+        self._rpm = rpm
+        self._tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60)
+        self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60)
+
+    async def try_take(self, tokens: int) -> float:
+        """
+        Take one request and `tokens` tokens if available.
+
+        Returns:
+            0.0 if taken, otherwise seconds until it may succeed
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+
+        self._refill(now)
+        tokens = min(tokens, self._tpm)  # An oversized request waits for a full bucket
+
+        if self._requests >= 1 and self._tokens >= tokens:
+            self._requests -= 1
+            self._tokens -= tokens
+            return 0.0
+
+        wait_requests = (1 - self._requests) * 60 / self._rpm
+        wait_tokens = (tokens - self._tokens) * 60 / self._tpm
+        return max(wait_requests, wait_tokens, 0.01)
+
+    async def pause(self, seconds: float) -> None:
+        """Stop granting for `seconds` (after the provider returned 429)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RedisQuota:
+    """
+    Per-minute request/token counters in Redis, shared by all workers.
+
+    Fixed windows rather than buckets: two INCRBYs per grant, no Lua.
+    """
+
+    def __init__(self, client: Any, rpm: int, tpm: int, key_prefix: str = "gemini:quota"):
+        self._client = client
+        self._rpm = rpm
+        self._tpm = tpm
+        self._prefix = key_prefix
+
+    async def try_take(self, tokens: int) -> float:
+        now = time.time()
+        paused_until = await self._client.get(f"{self._prefix}:paused")
+        if paused_until and float(paused_until) > now:
+            return float(paused_until) - now
+
+        window = int(now // 60)
+        requests_key = f"{self._prefix}:{window}:requests"
+        tokens_key = f"{self._prefix}:{window}:tokens"
+        tokens = min(tokens, self._tpm)
+
+        pipe = self._client.pipeline()
+        pipe.incrby(requests_key, 1)
+        pipe.incrby(tokens_key, tokens)
+        pipe.expire(requests_key, 120)
+        pipe.expire(tokens_key, 120)
+        used_requests, used_tokens, _, _ = await pipe.execute()
+
+        if used_requests <= self._rpm and used_tokens <= self._tpm:
+            return 0.0
+
+        # Over quota: give the reservation back and wait for the next window
+        pipe = self._client.pipeline()
+        pipe.decrby(requests_key, 1)
+        pipe.decrby(tokens_key, tokens)
+        await pipe.execute()
+        return max(60 - now % 60, 0.01)
+
+    async def pause(self, seconds: float) -> None:
+        await self._client.set(f"{self._prefix}:paused", time.time() + seconds, ex=int(seconds) + 1)
+
+
+@dataclass
+class _Waiter:
+    user_id: str
+    tokens: int
+    future: asyncio.Future
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+class RateLimiter:
+    """
+    Grants model calls within quota, serving waiting users round-robin.
+
+    A call that can be granted immediately (nobody queued, quota left)
+    never touches the queue. Otherwise it waits in its user's queue; a
+    single dispatcher grants waiters in turn, one user at a time, so a
+    user firing many requests cannot starve the others.
+
+    Args:
+        quota: LocalQuota or RedisQuota
+        max_queue: Waiting calls beyond which new ones are shed at once
+        max_wait_seconds: Deadline for a queued call before it is shed
+    """
+
+    def __init__(self, quota: Any, max_queue: int = 64, max_wait_seconds: float = 10.0):
+        self._quota = quota
+        self._max_queue = max_queue
+        self._max_wait = max_wait_seconds
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._depth = 0
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self._stats_lock = threading.Lock()
+        self._granted = 0
+        self._queued = 0
+        self._shed: Dict[str, int] = {"queue_full": 0, "deadline": 0}
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def ensure_capacity(self) -> None:
+        """
+        Shed early, before any work is done for the request.
+
+        Raises:
+            RateLimitExceeded: If the wait queue is full
+        """
+        if self._depth >= self._max_queue:
+            self._record_shed("queue_full")
+            raise RateLimitExceeded("queue_full", retry_after=self._max_wait)
+
+    async def acquire(self, user_id: str, tokens: int) -> None:
+        """
+        Wait until a model call for `tokens` estimated tokens may be made.
+
+        Args:
+            user_id: Caller, for fair queueing
+            tokens: Estimated prompt + output tokens
+
+        Raises:
+            RateLimitExceeded: Queue full, or not granted within the deadline
+        """
+        self._bind_loop()
+
+        if self._depth == 0 and await self._quota.try_take(tokens) == 0.0:
+            self._record_grant(0.0)
+            return
+
+        self.ensure_capacity()
+
+        waiter = _Waiter(user_id, tokens, asyncio.get_running_loop().create_future())
+        self._queues.setdefault(user_id, deque()).append(waiter)
+        self._depth += 1
+        with self._stats_lock:
+            self._queued += 1
+
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), self._max_wait)
+        except asyncio.TimeoutError:
+            if waiter.future.done():  # Granted at the last moment
+                return
+            waiter.future.cancel()
+            self._record_shed("deadline")
+            raise RateLimitExceeded("deadline", retry_after=self._max_wait)
+        finally:
+            if not waiter.future.done():
+                waiter.future.cancel()  # Caller went away; dispatcher skips it
+
+    async def pause(self, seconds: float) -> None:
+        """Hold all grants for `seconds`, e.g. after a 429 from the provider"""
+        await self._quota.pause(seconds)
+
+    async def _dispatch(self) -> None:
+        """Grant queued waiters round-robin across users until none are left"""
+        while self._queues:
+            user_id, queue = next(iter(self._queues.items()))
+            waiter = queue[0]
+
+            if not waiter.future.cancelled():
+                wait = await self._quota.try_take(waiter.tokens)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                    continue
+                waiter.future.set_result(None)
+                self._record_grant(time.monotonic() - waiter.enqueued)
+
+            queue.popleft()
+            self._depth -= 1
+            self._queues.pop(user_id)
+            if queue:
+                self._queues[user_id] = queue  # Back of the line
+
+    def _bind_loop(self) -> None:
+        """Queued futures belong to one event loop; start fresh on a new one"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queues.clear()
+            self._depth = 0
+            self._dispatcher = None
+
+    def _record_grant(self, waited: float) -> None:
+        with self._stats_lock:
+            self._granted += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+
+    def _record_shed(self, reason: str) -> None:
+        with self._stats_lock:
+            self._shed[reason] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring: queue depth, grants, waits and sheds"""
+        with self._stats_lock:
+            return {
+                "queue_depth": self._depth,
+                "queued_users": len(self._queues),
+                "granted": self._granted,
+                "queued": self._queued,
+                "shed": dict(self._shed),
+                "avg_wait_ms": (
+                    round(self._wait_total / self._granted * 1000, 1) if self._granted else 0.0
+                ),
+                "max_wait_ms": round(self._wait_max * 1000, 1),
+            }
+
+
+def create_rate_limiter(config: Dict[str, Any]) -> RateLimiter:
+    """
+    Build the limiter described by GEMINI_RATE_LIMIT.
+
+    Raises:
+        ValueError: If the backend is unknown or REDIS_URL is missing
+    """
+    backend = config["backend"].lower()
+
+    if backend == "memory":
+        quota: Any = LocalQuota(config["rpm"], config["tpm"])
+    elif backend == "redis":
+        from app.config import get_settings
+
+        redis_url = get_settings().redis_url
+        if not redis_url:
+            raise ValueError("REDIS_URL is required when GEMINI_RATE_LIMIT_BACKEND=redis")
+        import redis.asyncio  # Optional dependency, only needed for this backend
+
+        quota = RedisQuota(redis.asyncio.Redis.from_url(redis_url), config["rpm"], config["tpm"])
+    else:
+        raise ValueError(f"Unknown GEMINI_RATE_LIMIT_BACKEND '{config['backend']}'")
+
+    return RateLimiter(
+        quota,
+        max_queue=config["max_queue"],
+        max_wait_seconds=config["max_wait_seconds"],
+    )
+
+
+# Shared by every AgentExecutor in the process
+rate_limiter = create_rate_limiter(GEMINI_RATE_LIMIT)
@@ -0,0 +1,192 @@
+# Response Cache for Read-Only Chat Queries
+# Spec: agent.spec.md Section 4.8
+#
+# "What are my tasks?" and "what's pending?" always end in a list_tasks
+# call and a rephrasing of its result. Replies to such questions are
+# cached per (user, normalized intent, task list version) and reused
+# while the user's tasks are unchanged.
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import RESPONSE_CACHE
+from .result import ToolCallRecord
+
+# Tools whose results may back a cached reply / whose success invalidates it.
+# The executor also runs read-only calls concurrently (agent.spec.md 4.4).
+READ_ONLY_TOOLS = frozenset({"list_tasks"})
+WRITE_TOOLS = frozenset({"add_task", "update_task", "complete_task", "delete_task"})
+
+# (intent, task list version)
+CacheKey = Tuple[str, str]
+
+# (expires_at, task list version, reply, tool records) per intent
+_Entry = Tuple[float, str, str, Tuple[ToolCallRecord, ...]]
+
+_READ_OPENER = re.compile(
+    r"^(?:what|which|show|list|tell|give|display|view|see|do i have|are there|any|how many)\b"
+)
+# Every word of a cacheable question must come from this vocabulary, so
+# "what should I do first from my list?" is not mistaken for "what's on
+# my list?". Verbs that change tasks are deliberately absent.
+_VOCABULARY = frozenset(
+    """
+    what which show list tell give display view see do does i have are is
+    there any how many me my all the a of on in to for still currently
+    right now please can could you everything items things tasks task
+    todos todo dos left pending remaining unfinished incomplete
+    outstanding open not done completed finished
+    """.split()
+)
+_TASK_NOUN = re.compile(
+    r"\b(?:tasks?|todos?|to dos?|list|left|pending|remaining|done|completed|finished)\b"
+)
+_PENDING = re.compile(
+    r"\b(?:pending|left|remaining|unfinished|incomplete|outstanding|open|not done)\b"
+)
+_COMPLETED = re.compile(r"\b(?:completed|finished|done)\b")
+MAX_QUERY_LENGTH = 80
+
+
+def normalize_query(message: str) -> str:
+    """Lowercase, expand "what's", drop punctuation and extra whitespace"""
+    text = message.lower().replace("what's", "what is").replace("whats", "what is")
+    text = re.sub(r"[^a-z0-9\s]", " ", text)
+    return " ".join(text.split())
+
+
+def classify_read_query(message: str) -> Optional[str]:
+    """
+    Map a read-only question about the task list to an intent key.
+
+    Only unambiguous questions qualify: they open like a question or
+    a show/list request, mention the task list, and use no word outside
+    a small vocabulary (so no task IDs, no verbs that change tasks and
+    no extra request such as "first" or "and add ...").
+
+    Args:
+        message: Raw user message
+
+    Returns:
+        "<list|count>:<all|pending|completed>", or None if not cacheable
+    """
+    text = normalize_query(message)
+
+    if (
+        len(text) > MAX_QUERY_LENGTH
+        or not _READ_OPENER.search(text)
+        or not _TASK_NOUN.search(text)
+        or not _VOCABULARY.issuperset(text.split())
+    ):
+        return None
+
+    kind = "count" if text.startswith("how many") else "list"
+    if _PENDING.search(text):
+        status = "pending"
+    elif _COMPLETED.search(text):
+        status = "completed"
+    else:
+        status = "all"
+    return f"{kind}:{status}"
+
+
+def is_cacheable(tool_records: List[ToolCallRecord]) -> bool:
+    """A reply may be cached if it is grounded on read-only tool results only"""
+    return bool(tool_records) and all(
+        record.tool in READ_ONLY_TOOLS
+        and not (isinstance(record.result, dict) and "error" in record.result)
+        for record in tool_records
+    )
+
+
+class ResponseCache:
+    """
+    Per-user LRU of assistant replies, keyed by intent and list version.
+
+    An entry only answers for the exact task list version it was
+    produced from, so task changes made anywhere (chat or REST, any
+    process) make it unreachable. Successful write tools also drop the
+    user's entries right away to free memory.
+
+    Args:
+        max_users: Users kept (least recently used evicted); 0 disables
+        ttl_seconds: Upper bound on an entry's age
+    """
+
+    def __init__(self, max_users: int = 1024, ttl_seconds: float = 600.0):
+        self._max_users = max_users
+        self._ttl = ttl_seconds
+        self._users: "OrderedDict[str, Dict[str, _Entry]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_users > 0
+
+    def get(self, user_id: str, key: CacheKey) -> Optional[Tuple[str, List[ToolCallRecord]]]:
+        """
+        Look up a reply.
+
+        Returns:
+            (response text, tool records) on a hit, None otherwise
+        """
+        intent, version = key
+        with self._lock:
+            entry = self._users.get(user_id, {}).get(intent)
+            if entry is None or entry[1] != version or entry[0] < time.monotonic():
+                self._misses += 1
+                return None
+
+            self._users.move_to_end(user_id)
+            self._hits += 1
+            return entry[2], list(entry[3])
+
+    def put(
+        self,
+        user_id: str,
+        key: CacheKey,
+        response: str,
+        tool_records: List[ToolCallRecord],
+    ) -> None:
+        """Store a reply produced from task list version key[1]"""
+        if not self.enabled:
+            return
+
+        intent, version = key
+        with self._lock:
+            entries = self._users.setdefault(user_id, {})
+            entries[intent] = (time.monotonic() + self._ttl, version, response, tuple(tool_records))
+            self._users.move_to_end(user_id)
+            while len(self._users) > self._max_users:
+                self._users.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop every cached reply of the user"""
+        with self._lock:
+            if self._users.pop(user_id, None) is not None:
+                self._invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring: hits, misses, hit_ratio, users, invalidations"""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / total, 4) if total else 0.0,
+                "users": len(self._users),
+                "invalidations": self._invalidations,
+            }
+
+
+# Shared by every AgentExecutor in the process
+response_cache = ResponseCache(
+    max_users=RESPONSE_CACHE["max_users"],
+    ttl_seconds=RESPONSE_CACHE["ttl_seconds"],
+)
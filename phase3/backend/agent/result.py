@@ -4,7 +4,7 @@
 # Immutable result objects for agent execution.
 
 from dataclasses import dataclass, field
-from typing import List, Any, Optional
+from typing import List, Any, Optional, Dict
 
 
 @dataclass(frozen=True)
@@ -46,6 +46,9 @@ class AgentResult:
     tool_calls: List[ToolCallRecord] = field(default_factory=list)
     """List of tools invoked during this request."""
 
+    failed: bool = False
+    """True if the turn failed: nothing from it may be committed."""
+
     @classmethod
     def error(cls, conversation_id: int, message: str) -> "AgentResult":
         """
@@ -56,10 +59,86 @@ class AgentResult:
             message: Error message to show user
 
         Returns:
-            AgentResult with error message as response
+            AgentResult with error message as response, marked failed
         """
         return cls(
             conversation_id=conversation_id,
             response=message,
             tool_calls=[],
+            failed=True,
+        )
+
+
+@dataclass(frozen=True)
+class AgentEvent:
+    """
+    Progress event emitted while the agent streams a response.
+
+    Event types, in the order they occur:
+    - conversation: {"conversation_id"} (always first)
+    - token: {"text"} fragment of the assistant's reply
+    - tool_call: {"tool", "arguments", "result"} after a tool has run
+    - done: same shape as ChatResponse (final, after persistence)
+    - error: {"conversation_id", "message"} (final)
+    """
+
+    CONVERSATION = "conversation"
+    TOKEN = "token"
+    TOOL_CALL = "tool_call"
+    DONE = "done"
+    ERROR = "error"
+
+    type: str
+    """Event type (one of the constants above)."""
+
+    data: Dict[str, Any]
+    """JSON-serializable event payload."""
+
+    @property
+    def is_final(self) -> bool:
+        """Whether this is the last event of the stream."""
+        return self.type in (self.DONE, self.ERROR)
+
+    @classmethod
+    def conversation(cls, conversation_id: int) -> "AgentEvent":
+        """Create the event announcing the conversation ID."""
+        return cls(cls.CONVERSATION, {"conversation_id": conversation_id})
+
+    @classmethod
+    def token(cls, text: str) -> "AgentEvent":
+        """Create a text fragment event."""
+        return cls(cls.TOKEN, {"text": text})
+
+    @classmethod
+    def tool_call(cls, record: ToolCallRecord) -> "AgentEvent":
+        """Create an event for a completed tool call."""
+        return cls(cls.TOOL_CALL, _tool_call_dict(record))
+
+    @classmethod
+    def done(cls, result: AgentResult) -> "AgentEvent":
+        """Create the final event carrying the complete result."""
+        return cls(
+            cls.DONE,
+            {
+                "conversation_id": result.conversation_id,
+                "response": result.response,
+                "tool_calls": [_tool_call_dict(r) for r in result.tool_calls],
+            },
         )
+
+    @classmethod
+    def error(cls, conversation_id: int, message: str) -> "AgentEvent":
+        """Create the final event for a failed execution."""
+        return cls(
+            cls.ERROR,
+            {"conversation_id": conversation_id, "message": message},
+        )
+
+
+def _tool_call_dict(record: ToolCallRecord) -> Dict[str, Any]:
+    """Convert a tool call record to its JSON shape."""
+    return {
+        "tool": record.tool,
+        "arguments": record.arguments,
+        "result": record.result,
+    }
@@ -0,0 +1,120 @@
+# Rolling Conversation Summary
+# Spec: agent.spec.md Section 8.2
+#
+# Keeps prompt history within HISTORY_TOKEN_BUDGET: once exceeded, older
+# messages are folded into a per-conversation summary. Each fold sends
+# only the previous summary and the newly folded messages to the model.
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+from google.genai import types
+
+from .config import SUMMARY_MAX_TOKENS
+
+# (message_id, role, content) as returned by MessageRepository.get_recent
+HistoryRow = Tuple[int, str, str]
+
+SUMMARY_HEADER = "Summary of the earlier conversation:"
+
+SUMMARY_INSTRUCTION = (
+    "You maintain a running summary of a conversation between a user and "
+    "TodoAssistant, a to-do list assistant.\n"
+    "Merge the new messages into the current summary. Keep task titles, task IDs, "
+    "decisions and open questions; drop greetings and filler.\n"
+    "Reply with the updated summary only, in plain prose, at most a short paragraph."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about 4 characters per token), no tokenizer needed"""
+    return len(text) // 4 + 1
+
+
+def split_for_summary(
+    summary: Optional[str],
+    window: Sequence[HistoryRow],
+    budget: int,
+    keep_recent: int,
+    max_messages: int,
+) -> Tuple[List[HistoryRow], List[HistoryRow]]:
+    """
+    Decide which messages to fold into the summary.
+
+    Messages are folded once the history is over the token budget, or
+    once there are more than max_messages unsummarized: those would
+    otherwise drop out of the prompt window without ever being folded.
+
+    Args:
+        summary: Current stored summary, if any
+        window: All unsummarized messages, oldest first
+        budget: Estimated token budget for summary + window
+        keep_recent: Messages always kept verbatim
+        max_messages: Unsummarized messages the prompt window holds
+
+    Returns:
+        (to_fold, keep) - to_fold is empty while within both limits
+    """
+    used = estimate_tokens(summary) if summary else 0
+    used += sum(estimate_tokens(content) for _, _, content in window)
+
+    within_limits = used <= budget and len(window) <= max_messages
+    if within_limits or len(window) <= keep_recent:
+        return [], list(window)
+
+    split = len(window) - keep_recent
+    return list(window[:split]), list(window[split:])
+
+
+def _summary_request(
+    summary: Optional[str], messages: Sequence[HistoryRow]
+) -> List[types.Content]:
+    """Build the single-turn request asking the model to extend the summary"""
+    transcript = "\n".join(f"{role}: {content}" for _, role, content in messages)
+    text = (
+        f"Current summary:\n{summary or '(none)'}\n\n"
+        f"New messages:\n{transcript}"
+    )
+    return [types.Content(role="user", parts=[types.Part(text=text)])]
+
+
+async def summarize(
+    client: Any,
+    model: str,
+    summary: Optional[str],
+    messages: Sequence[HistoryRow],
+) -> str:
+    """
+    Fold messages into the summary with one model call.
+
+    Args:
+        client: genai.Client (or a stand-in with the same aio interface)
+        model: Model name
+        summary: Current summary, if any
+        messages: Messages to fold, oldest first
+
+    Returns:
+        Updated summary text
+
+    Raises:
+        ValueError: If the model returns no text
+    """
+    response = await client.aio.models.generate_content(
+        model=model,
+        contents=_summary_request(summary, messages),
+        config=types.GenerateContentConfig(
+            system_instruction=SUMMARY_INSTRUCTION,
+            temperature=0.2,
+            max_output_tokens=SUMMARY_MAX_TOKENS,
+        ),
+    )
+
+    text = ""
+    if response.candidates and response.candidates[0].content:
+        text = "".join(
+            part.text or "" for part in response.candidates[0].content.parts or []
+        )
+
+    text = text.strip()
+    if not text:
+        raise ValueError("Empty summary from model")
+    return text
@@ -6,10 +6,15 @@
 # Invokes Phase III agent for AI responses.
 
 import sys
+import json
+import asyncio
 import logging
 from pathlib import Path
+from typing import AsyncIterator
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
 
 # Add phase2 to path for imports
@@ -19,20 +24,174 @@ if str(_phase2_path) not in sys.path:
 
 # Phase II imports (READ-ONLY usage)
 from app.auth import get_current_user
-from app.database import get_session
+from app.database import engine, get_session
+from app.metrics import register_cache
+from app.query_budget import set_budget
 
 # Phase III imports
 from .schemas import ChatRequest, ChatResponse, ToolCallResponse
-from ..agent import AgentExecutor
-from ..repositories import ConversationRepository
+from ..agent import (
+    AgentEvent,
+    AgentExecutor,
+    RateLimitExceeded,
+    intent_router,
+    rate_limiter,
+    response_cache,
+)
+from ..repositories import ConversationRepository, UnitOfWork
 
 
 logger = logging.getLogger(__name__)
 
+# Chat caches on GET /metrics next to the Phase II ones
+register_cache("chat_fast_path", intent_router.stats.stats)
+register_cache("chat_response_cache", response_cache.stats)
+
+# SQL statements per chat turn: conversation, history, two messages
+# with their timestamp bumps and the response cache version (7),
+# plus one per tool call
+CHAT_QUERY_BUDGET = 12
+set_budget("POST /api/{user_id}/chat", CHAT_QUERY_BUDGET)
+set_budget("POST /api/{user_id}/chat/stream", CHAT_QUERY_BUDGET)
+
 # Create router for chat endpoints
 chat_router = APIRouter(tags=["chat"])
 
 
+def _authorize_chat(
+    user_id: str,
+    auth_user_id: str,
+    request: ChatRequest,
+    session: Session,
+) -> None:
+    """
+    Check the caller may post to this user's (optional) conversation.
+
+    Raises:
+        HTTPException 403: If path user_id doesn't match JWT user_id
+        HTTPException 404: If conversation_id provided but not found
+    """
+    # (Spec Section 8.1 - Path Parameter Validation)
+    if user_id != auth_user_id:
+        logger.warning(
+            f"User ID mismatch: path={user_id}, auth={auth_user_id}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+
+    if request.conversation_id is not None:
+        conv_repo = ConversationRepository(session, auth_user_id)
+        conversation = conv_repo.get_by_id(request.conversation_id)
+        if conversation is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Conversation not found",
+            )
+
+
+def _overloaded(error: RateLimitExceeded) -> HTTPException:
+    """503 for a request shed by the model rate limiter"""
+    logger.warning(f"Chat request shed: {error.reason}")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Assistant is busy, please retry shortly",
+        headers={"Retry-After": str(max(1, round(error.retry_after)))},
+    )
+
+
+def _shed_if_overloaded() -> None:
+    """
+    Refuse work up front when the model call queue is already full.
+
+    Raises:
+        HTTPException 503: With Retry-After, before anything is stored
+    """
+    try:
+        rate_limiter.ensure_capacity()
+    except RateLimitExceeded as e:
+        raise _overloaded(e)
+
+
+def _end_turn(unit_of_work: UnitOfWork, keep: bool) -> bool:
+    """
+    Commit a chat turn as one transaction, or roll it back.
+
+    A failed turn keeps nothing, not even the user's message. A commit
+    that fails is rolled back too, so the session is left usable.
+    Holds the unit of work's lock, so it waits for a worker thread still
+    using the session. Blocking: call from a worker thread.
+
+    Args:
+        unit_of_work: The turn's unit of work
+        keep: Commit the turn (True) or roll it back (False)
+
+    Returns:
+        True if the turn was committed
+    """
+    with unit_of_work.locked() as session:
+        if keep:
+            try:
+                session.commit()
+                return True
+            except Exception:
+                logger.exception("Chat turn commit failed")
+        session.rollback()
+        return False
+
+
+def _discard_turn(unit_of_work: UnitOfWork) -> None:
+    """
+    Close a turn's session, rolling back whatever it left uncommitted.
+
+    Nothing is left once the turn has been committed or rolled back.
+    Holds the unit of work's lock like _end_turn. Blocking: call from a
+    worker thread.
+    """
+    with unit_of_work.locked() as session:
+        session.close()
+
+
+def _format_sse(event: AgentEvent) -> str:
+    """Encode an agent event as a Server-Sent Events frame."""
+    return f"event: {event.type}\ndata: {json.dumps(event.data, default=str)}\n\n"
+
+
+async def _stream_chat(user_id: str, request: ChatRequest) -> AsyncIterator[str]:
+    """
+    Run the agent and yield its events as SSE frames.
+
+    Uses its own session: the response body is produced after the
+    endpoint (and its request-scoped dependencies) has returned.
+    The turn is committed before done is sent and rolled back before
+    error is sent. A turn the client disconnects from before done is
+    rolled back: only a finished turn is kept.
+    """
+    executor = AgentExecutor(session=Session(engine), user_id=user_id)
+    unit_of_work = executor.unit_of_work
+    try:
+        async for event in executor.stream(
+            message=request.message,
+            conversation_id=request.conversation_id,
+        ):
+            if event.is_final:
+                done = event.type == AgentEvent.DONE
+                committed = await asyncio.to_thread(_end_turn, unit_of_work, done)
+                if done and not committed:
+                    event = AgentEvent.error(
+                        conversation_id=request.conversation_id or 0,
+                        message="Something went wrong. Please try again.",
+                    )
+            yield _format_sse(event)
+    finally:
+        # On client disconnect this runs inside a cancelled scope, where
+        # an unshielded await would be interrupted. The rollback waits on
+        # the unit of work's lock for a worker still using the session.
+        with anyio.CancelScope(shield=True):
+            await asyncio.to_thread(_discard_turn, unit_of_work)
+
+
 @chat_router.post(
     "/{user_id}/chat",
     response_model=ChatResponse,
@@ -82,28 +241,15 @@ async def chat(
         HTTPException 403: If path user_id doesn't match JWT user_id
         HTTPException 404: If conversation_id provided but not found
         HTTPException 500: If agent execution fails
-        HTTPException 503: If AI service unavailable
+        HTTPException 503: If AI service unavailable or over its rate limit
     """
-    # 1. AUTHENTICATE - Verify URL user_id matches JWT
-    # (Spec Section 8.1 - Path Parameter Validation)
-    if user_id != auth_user_id:
-        logger.warning(
-            f"User ID mismatch: path={user_id}, auth={auth_user_id}"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied",
-        )
+    _shed_if_overloaded()
 
+    # 1. AUTHENTICATE - Verify URL user_id matches JWT
     # 2. VALIDATE - Check conversation ownership if ID provided
-    if request.conversation_id is not None:
-        conv_repo = ConversationRepository(session, auth_user_id)
-        conversation = conv_repo.get_by_id(request.conversation_id)
-        if conversation is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Conversation not found",
-            )
+    await asyncio.to_thread(
+        _authorize_chat, user_id, auth_user_id, request, session
+    )
 
     # 3-6. INVOKE AGENT (handles resolve, persist, invoke, persist)
     # Agent is stateless - create fresh instance per request
@@ -113,6 +259,8 @@ async def chat(
             message=request.message,
             conversation_id=request.conversation_id,
         )
+    except RateLimitExceeded as e:
+        raise _overloaded(e)  # Session is not committed: nothing is kept
     except Exception as e:
         logger.exception("Agent execution failed")
         raise HTTPException(
@@ -120,8 +268,15 @@ async def chat(
             detail="Service temporarily unavailable",
         )
 
-    # Commit the session to persist all changes
-    session.commit()
+    # Commit the turn as one transaction; a failed turn keeps nothing
+    committed = await asyncio.to_thread(
+        _end_turn, executor.unit_of_work, not result.failed
+    )
+    if not result.failed and not committed:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable",
+        )
 
     # 7. RETURN RESPONSE
     return ChatResponse(
@@ -136,3 +291,88 @@ async def chat(
             for tc in result.tool_calls
         ],
     )
+
+
+@chat_router.post(
+    "/{user_id}/chat/stream",
+    status_code=status.HTTP_200_OK,
+    summary="Chat with AI Assistant (streaming)",
+    description="Same as POST /{user_id}/chat, but streams the reply as "
+    "Server-Sent Events: conversation, token*, tool_call*, then done or error.",
+    responses={
+        200: {
+            "description": "text/event-stream of agent events",
+            "content": {"text/event-stream": {}},
+        },
+        401: {"description": "Not authenticated - missing or invalid JWT"},
+        403: {"description": "Access denied - user_id mismatch"},
+        404: {"description": "Conversation not found"},
+        422: {"description": "Validation error - invalid request body"},
+        503: {"description": "Assistant busy - model call queue full"},
+    },
+)
+async def chat_stream(
+    user_id: str,
+    request: ChatRequest,
+    auth_user_id: str = Depends(get_current_user),
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    """
+    Send a message to the AI assistant and stream the reply.
+
+    Events (each "event: <type>" + "data: <json>"):
+    - conversation: {"conversation_id"} - sent as soon as it is resolved
+    - token: {"text"} - reply text as the model generates it
+    - tool_call: {"tool", "arguments", "result"} - after each tool runs
+    - done: final ChatResponse body, after the reply is persisted
+    - error: {"conversation_id", "message"}
+
+    Authorization and conversation checks run before the stream starts,
+    so they still fail with regular 403/404 responses; so does shedding
+    (503) when the model call queue is full. A call shed later, while
+    queued, ends the stream with an error event.
+
+    Args:
+        user_id: User ID from URL path (must match authenticated user)
+        request: ChatRequest with message and optional conversation_id
+        auth_user_id: Authenticated user ID from JWT (injected by Depends)
+        session: Database session for the pre-stream checks
+
+    Returns:
+        StreamingResponse (text/event-stream)
+    """
+    _shed_if_overloaded()
+
+    await asyncio.to_thread(
+        _authorize_chat, user_id, auth_user_id, request, session
+    )
+
+    return StreamingResponse(
+        _stream_chat(auth_user_id, request),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+        },
+    )
+
+
+@chat_router.get(
+    "/chat/health",
+    summary="Chat agent statistics",
+    description="Public, unauthenticated counters for monitoring the chat agent.",
+)
+async def chat_health() -> dict:
+    """
+    Chat agent health and efficiency counters (no authentication required).
+
+    Returns:
+        {"status", "fast_path": {...}, "rate_limiter": {queue_depth, ...},
+         "response_cache": {hits, misses, ...}}
+    """
+    return {
+        "status": "healthy",
+        "fast_path": intent_router.stats.stats(),
+        "rate_limiter": rate_limiter.stats(),
+        "response_cache": response_cache.stats(),
+    }
@@ -9,6 +9,17 @@ from .list_tasks import list_tasks
 from .complete_task import complete_task
 from .delete_task import delete_task
 from .update_task import update_task
+from .task_list_version import task_list_version
+
+from app.query_budget import set_budget
+
+# SQL statements per call (checked by offload_blocking): every tool is
+# a single round trip, except that the full list is checked against
+# the list version before the cached snapshot is used (then loaded on
+# a miss)
+for _tool in (add_task, complete_task, delete_task, update_task, task_list_version):
+    set_budget(f"mcp:{_tool.__name__}", 1)
+set_budget("mcp:list_tasks", 2)
 
 __all__ = [
     "add_task",
@@ -16,4 +27,5 @@ __all__ = [
     "complete_task",
     "delete_task",
     "update_task",
+    "task_list_version",
 ]
@@ -5,9 +5,11 @@
 # It handles session management and repository instantiation.
 
 import sys
+import asyncio
+import functools
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Coroutine, Generator, Optional
 
 # Add phase2 to path for imports
 # This allows importing Phase II modules without modifying them
@@ -18,32 +20,97 @@ if str(_phase2_path) not in sys.path:
 # Phase II imports (READ-ONLY usage)
 from sqlmodel import Session
 from app.database import engine
-from app.infrastructure.repositories import PostgreSQLTaskRepository
+from app.application.interfaces.task_repository import TaskRepository
+from app.infrastructure.cache import get_task_cache
+from app.infrastructure.repositories import (
+    CachingTaskRepository,
+    PostgreSQLTaskRepository,
+)
 from app.domain.exceptions import TaskNotFoundError, TaskValidationError
+from app.query_budget import count_queries, get_budget, report
+
+# Phase III imports
+from ...repositories.unit_of_work import UnitOfWork
+
+
+def offload_blocking(fn: Callable[..., Any]) -> Callable[..., Coroutine[Any, Any, Any]]:
+    """
+    Turn a blocking tool implementation into a coroutine function.
+
+    Phase II repositories use synchronous sessions; calling them
+    directly from async code would stall the event loop (and every
+    other request on the worker) for each query. The wrapped function
+    runs in a worker thread instead.
+
+    Its SQL statements are checked against the "mcp:<tool>" query
+    budget (see app/query_budget.py and tools/__init__.py).
+
+    Args:
+        fn: Synchronous tool function
+
+    Returns:
+        Async function with the same signature
+    """
+    budget_name = f"mcp:{fn.__name__}"
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        with count_queries() as log:
+            result = await asyncio.to_thread(fn, *args, **kwargs)
+        report(budget_name, log, get_budget(budget_name))
+        return result
+
+    return wrapper
+
+
+def _build_repository(
+    session: Session, user_id: str, autocommit: bool
+) -> TaskRepository:
+    """Phase II repository for the user, behind the task list cache if configured"""
+    repository = PostgreSQLTaskRepository(session, user_id, autocommit=autocommit)
+    cache = get_task_cache()
+    if cache is not None:
+        repository = CachingTaskRepository(repository, cache, user_id)
+    return repository
 
 
 @contextmanager
-def get_task_repository(user_id: str) -> Generator[PostgreSQLTaskRepository, None, None]:
+def get_task_repository(
+    user_id: str,
+    unit_of_work: Optional[UnitOfWork] = None,
+) -> Generator[TaskRepository, None, None]:
     """
     Context manager that provides a user-scoped task repository.
 
     This is the ADAPTER pattern - we create a Phase II repository
     with proper user isolation, then yield it for use case execution.
+    The repository shares Phase II's task list cache (when configured),
+    so writes made by tools invalidate the lists served by the REST API.
+
+    Inside a chat turn the agent passes its unit of work: the repository
+    then runs on the request's session and only flushes, and the chat
+    router commits the whole turn once. Without one (standalone use) a
+    short-lived session is opened and committed here.
 
     Args:
         user_id: Authenticated user ID for data isolation
+        unit_of_work: Request-scoped unit of work to join, if any
 
     Yields:
-        PostgreSQLTaskRepository scoped to the user
+        TaskRepository scoped to the user
 
     Example:
         with get_task_repository("user_123") as repo:
             use_case = ListTasksUseCase(repo)
             tasks = use_case.execute()
     """
+    if unit_of_work is not None:
+        with unit_of_work.locked() as session:
+            yield _build_repository(session, user_id, autocommit=False)
+        return
+
     with Session(engine) as session:
-        repository = PostgreSQLTaskRepository(session, user_id)
-        yield repository
+        yield _build_repository(session, user_id, autocommit=True)
         session.commit()
 
 
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional
 
 from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
     get_task_repository,
     format_task_result,
     format_error,
@@ -23,10 +25,12 @@ from app.application.use_cases import AddTaskUseCase
 from app.domain.exceptions import TaskValidationError
 
 
-async def add_task(
+@offload_blocking
+def add_task(
     user_id: str,
     title: str,
     description: Optional[str] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> dict:
     """
     Create a new task for the user.
@@ -41,13 +45,14 @@ async def add_task(
         user_id: Authenticated user ID for data isolation
         title: Task title (1-200 chars)
         description: Optional task description (max 1000 chars)
+        unit_of_work: Chat turn to join (set by the agent, not the model)
 
     Returns:
         {task_id, status: "created", title} on success
         {error, message} on failure
     """
     try:
-        with get_task_repository(user_id) as repository:
+        with get_task_repository(user_id, unit_of_work) as repository:
             # Delegate to Phase II use case - NO CRUD logic here
             use_case = AddTaskUseCase(repository)
             task = use_case.execute(
@@ -5,9 +5,12 @@
 # This is an ADAPTER - no CRUD logic here, only delegation.
 
 import sys
+from typing import Optional
 from pathlib import Path
 
 from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
     get_task_repository,
     format_task_result,
     format_error,
@@ -22,9 +25,11 @@ from app.application.use_cases import CompleteTaskUseCase
 from app.domain.exceptions import TaskNotFoundError
 
 
-async def complete_task(
+@offload_blocking
+def complete_task(
     user_id: str,
     task_id: int,
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> dict:
     """
     Mark a task as completed.
@@ -38,13 +43,14 @@ async def complete_task(
     Args:
         user_id: Authenticated user ID for data isolation
         task_id: ID of the task to mark as completed
+        unit_of_work: Chat turn to join (set by the agent, not the model)
 
     Returns:
         {task_id, status: "completed", title} on success
         {error, message, task_id} on failure
     """
     try:
-        with get_task_repository(user_id) as repository:
+        with get_task_repository(user_id, unit_of_work) as repository:
             # Delegate to Phase II use case - NO CRUD logic here
             use_case = CompleteTaskUseCase(repository)
             task = use_case.execute(task_id=task_id)
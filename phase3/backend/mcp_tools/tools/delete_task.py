@@ -5,9 +5,12 @@
 # This is an ADAPTER - no CRUD logic here, only delegation.
 
 import sys
+from typing import Optional
 from pathlib import Path
 
 from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
     get_task_repository,
     format_error,
 )
@@ -21,9 +24,11 @@ from app.application.use_cases import DeleteTaskUseCase
 from app.domain.exceptions import TaskNotFoundError
 
 
-async def delete_task(
+@offload_blocking
+def delete_task(
     user_id: str,
     task_id: int,
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> dict:
     """
     Delete a task.
@@ -31,39 +36,29 @@ async def delete_task(
     ADAPTER PATTERN:
     1. Receives parameters from MCP call
     2. Instantiates Phase II repository (user-scoped)
-    3. Gets task title before deletion (for response)
-    4. Delegates to Phase II DeleteTaskUseCase
-    5. Returns formatted result
+    3. Delegates to Phase II DeleteTaskUseCase, which returns the
+       deleted task (one DELETE ... RETURNING, no SELECT first)
+    4. Returns formatted result
 
     Args:
         user_id: Authenticated user ID for data isolation
         task_id: ID of the task to delete
+        unit_of_work: Chat turn to join (set by the agent, not the model)
 
     Returns:
         {task_id, status: "deleted", title} on success
         {error, message, task_id} on failure
     """
     try:
-        with get_task_repository(user_id) as repository:
-            # Get task title before deletion (for response)
-            task = repository.get_by_id(task_id)
-            if task is None:
-                return format_error(
-                    error_type="not_found",
-                    message=f"Task {task_id} not found",
-                    task_id=task_id,
-                )
-
-            task_title = task.title
-
+        with get_task_repository(user_id, unit_of_work) as repository:
             # Delegate to Phase II use case - NO CRUD logic here
             use_case = DeleteTaskUseCase(repository)
-            use_case.execute(task_id=task_id)
+            task = use_case.execute(task_id=task_id)
 
             return {
                 "task_id": task_id,
                 "status": "deleted",
-                "title": task_title,
+                "title": task.title,
             }
 
     except TaskNotFoundError:
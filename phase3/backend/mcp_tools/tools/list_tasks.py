@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional, Literal
 
 from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
     get_task_repository,
     format_task_list_item,
     format_error,
@@ -19,12 +21,20 @@ _phase2_path = Path(__file__).parent.parent.parent.parent.parent / "phase2" / "b
 if str(_phase2_path) not in sys.path:
     sys.path.insert(0, str(_phase2_path))
 
+from app.application.interfaces import TaskFilter
+from app.application.interfaces.task_page import DEFAULT_PAGE_SIZE
 from app.application.use_cases import ListTasksUseCase
+from app.domain.exceptions import InvalidCursorError
+from app.domain.value_objects.task_status import TaskStatus
 
 
-async def list_tasks(
+@offload_blocking
+def list_tasks(
     user_id: str,
     status: Optional[Literal["all", "pending", "completed"]] = "all",
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> dict:
     """
     List tasks for the user with optional status filter.
@@ -32,36 +42,57 @@ async def list_tasks(
     ADAPTER PATTERN:
     1. Receives parameters from MCP call
     2. Instantiates Phase II repository (user-scoped)
-    3. Delegates to Phase II ListTasksUseCase
-    4. Filters by status (app-layer, not in use case)
+    3. Maps status to a Phase II TaskFilter (applied in SQL)
+    4. Delegates to Phase II ListTasksUseCase (paged if limit/cursor given)
     5. Returns formatted result
 
     Args:
         user_id: Authenticated user ID for data isolation
         status: Filter - "all", "pending", or "completed"
+        limit: Optional page size; enables cursor pagination
+        cursor: Optional next_cursor from a previous call
+        unit_of_work: Chat turn to join (set by the agent, not the model)
 
     Returns:
         {tasks: [{id, title, description, completed}, ...]} on success
+        {tasks: [...], next_cursor} on success when paginating
         {error, message} on failure
     """
     try:
-        with get_task_repository(user_id) as repository:
-            # Delegate to Phase II use case - NO CRUD logic here
-            use_case = ListTasksUseCase(repository)
-            all_tasks = use_case.execute()
-
-            # Filter by status (adapter-layer logic, not CRUD)
+        with get_task_repository(user_id, unit_of_work) as repository:
+            # Map status to a filter (adapter-layer logic, not CRUD)
             if status == "pending":
-                filtered_tasks = [t for t in all_tasks if not t.status.is_completed()]
+                task_filter = TaskFilter(status=TaskStatus.PENDING)
             elif status == "completed":
-                filtered_tasks = [t for t in all_tasks if t.status.is_completed()]
+                task_filter = TaskFilter(status=TaskStatus.COMPLETED)
             else:
-                filtered_tasks = all_tasks
+                task_filter = None
 
+            # Delegate to Phase II use case - NO CRUD logic here
+            use_case = ListTasksUseCase(repository)
+
+            if limit is None and cursor is None:
+                tasks = use_case.execute(task_filter)
+                return {
+                    "tasks": [format_task_list_item(t) for t in tasks],
+                }
+
+            page = use_case.execute_page(
+                limit=int(limit) if limit is not None else DEFAULT_PAGE_SIZE,
+                cursor=cursor,
+                task_filter=task_filter,
+            )
             return {
-                "tasks": [format_task_list_item(t) for t in filtered_tasks],
+                "tasks": [format_task_list_item(t) for t in page.tasks],
+                "next_cursor": page.next_cursor,
             }
 
+    except InvalidCursorError as e:
+        return format_error(
+            error_type="validation",
+            message=str(e),
+            cursor=cursor,
+        )
     except Exception as e:
         return format_error(
             error_type="internal",
@@ -0,0 +1,36 @@
+# task_list_version helper (not exposed to the model)
+# Spec: agent.spec.md Section 4.8
+#
+# Version tag of a user's task list, for the agent's response cache.
+# Lives with the tools so the agent still reaches tasks only via this layer.
+
+from typing import Optional
+
+from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
+    get_task_repository,
+)
+
+
+@offload_blocking
+def task_list_version(
+    user_id: str,
+    unit_of_work: Optional[UnitOfWork] = None,
+) -> str:
+    """
+    Get the version tag of the user's task list.
+
+    Delegates to the Phase II repository's aggregate query (count,
+    highest ID and summed row revisions), so no tasks are loaded. The tag changes whenever
+    a task is added, changed or removed - through chat or the REST API.
+
+    Args:
+        user_id: Authenticated user ID for data isolation
+        unit_of_work: Chat turn to join
+
+    Returns:
+        Opaque version string
+    """
+    with get_task_repository(user_id, unit_of_work) as repository:
+        return repository.get_list_version()
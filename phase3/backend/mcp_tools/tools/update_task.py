@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional
 
 from ._adapter import (
+    offload_blocking,
+    UnitOfWork,
     get_task_repository,
     format_task_result,
     format_error,
@@ -23,11 +25,13 @@ from app.application.use_cases import UpdateTaskUseCase
 from app.domain.exceptions import TaskNotFoundError, TaskValidationError
 
 
-async def update_task(
+@offload_blocking
+def update_task(
     user_id: str,
     task_id: int,
     title: Optional[str] = None,
     description: Optional[str] = None,
+    unit_of_work: Optional[UnitOfWork] = None,
 ) -> dict:
     """
     Update a task's title or description.
@@ -44,6 +48,7 @@ async def update_task(
         task_id: ID of the task to update
         title: New title (optional, 1-200 chars)
         description: New description (optional, max 1000 chars)
+        unit_of_work: Chat turn to join (set by the agent, not the model)
 
     Returns:
         {task_id, status: "updated", title} on success
@@ -58,7 +63,7 @@ async def update_task(
         )
 
     try:
-        with get_task_repository(user_id) as repository:
+        with get_task_repository(user_id, unit_of_work) as repository:
             # Delegate to Phase II use case - NO CRUD logic here
             use_case = UpdateTaskUseCase(repository)
             task = use_case.execute(
@@ -6,7 +6,8 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Column
+from sqlalchemy import Text
 
 
 class ConversationDB(SQLModel, table=True):
@@ -40,3 +41,13 @@ class ConversationDB(SQLModel, table=True):
         nullable=False,
         description="Last activity timestamp",
     )
+    summary: Optional[str] = Field(
+        default=None,
+        sa_column=Column(Text, nullable=True),
+        description="Rolling summary of messages folded out of the prompt window",
+    )
+    summary_message_id: Optional[int] = Field(
+        default=None,
+        nullable=True,
+        description="ID of the last message folded into summary",
+    )
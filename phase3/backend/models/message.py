@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional, Any, Literal
 
 from sqlmodel import SQLModel, Field, Column
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 
 
 class MessageDB(SQLModel, table=True):
@@ -23,6 +23,10 @@ class MessageDB(SQLModel, table=True):
     """
 
     __tablename__ = "message"
+    __table_args__ = (
+        # Backs the windowed history query (last N messages of a conversation)
+        Index("idx_message_conversation_created", "conversation_id", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     conversation_id: int = Field(
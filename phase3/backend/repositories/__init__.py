@@ -1,9 +1,11 @@
 # T-314, T-315: Phase III Repositories
 # Spec: conversation.spec.md Sections 6.1, 6.2
 #
-# Repositories for conversation and message persistence.
+# Repositories for conversation and message persistence,
+# plus the unit of work a chat turn shares with its tool calls.
 
 from .conversation_repository import ConversationRepository
 from .message_repository import MessageRepository
+from .unit_of_work import UnitOfWork
 
-__all__ = ["ConversationRepository", "MessageRepository"]
+__all__ = ["ConversationRepository", "MessageRepository", "UnitOfWork"]
@@ -6,6 +6,7 @@
 from datetime import datetime
 from typing import Optional, List
 
+from sqlalchemy import inspect, update
 from sqlmodel import Session, select
 
 from ..models.conversation import ConversationDB
@@ -51,12 +52,23 @@ class ConversationRepository:
 
         SECURITY: Filters by user_id to prevent cross-user access.
 
+        A conversation this session already loaded and has not expired
+        (the chat router checks it exists before the agent reads it) is
+        returned without another SELECT.
+
         Args:
             conversation_id: Conversation ID to retrieve
 
         Returns:
             ConversationDB if found and owned by user, None otherwise
         """
+        loaded = self._session.identity_map.get(
+            self._session.identity_key(ConversationDB, conversation_id)
+        )
+        if loaded is not None and not inspect(loaded).expired_attributes:
+            if loaded.user_id == self._user_id:
+                return loaded
+
         statement = select(ConversationDB).where(
             ConversationDB.id == conversation_id,
             ConversationDB.user_id == self._user_id,  # CRITICAL: User isolation
@@ -87,15 +99,30 @@ class ConversationRepository:
         """
         Update conversation's updated_at to now.
 
-        Called when a new message is added.
+        Called when a new message is added. One UPDATE, without loading
+        the conversation first.
 
         Args:
             conversation_id: Conversation ID to update
         """
-        conversation = self.get_by_id(conversation_id)
-        if conversation:
-            conversation.updated_at = datetime.utcnow()
-            self._session.add(conversation)
+        self._update(conversation_id, updated_at=datetime.utcnow())
+
+    def save_summary(
+        self, conversation_id: int, summary: str, summary_message_id: int
+    ) -> None:
+        """
+        Store the conversation's rolling summary.
+
+        Args:
+            conversation_id: Conversation ID to update
+            summary: Summary covering every message up to summary_message_id
+            summary_message_id: ID of the last message folded into summary
+        """
+        self._update(
+            conversation_id,
+            summary=summary,
+            summary_message_id=summary_message_id,
+        )
 
     def delete(self, conversation_id: int) -> bool:
         """
@@ -112,3 +139,23 @@ class ConversationRepository:
             self._session.delete(conversation)
             return True
         return False
+
+    def _update(self, conversation_id: int, **values) -> None:
+        """
+        Set columns of the user's conversation with a single UPDATE.
+
+        SECURITY: Filters by user_id; another user's conversation
+        matches no row.
+
+        Args:
+            conversation_id: Conversation ID to update
+            **values: Column values to set
+        """
+        self._session.execute(
+            update(ConversationDB)
+            .where(
+                ConversationDB.id == conversation_id,
+                ConversationDB.user_id == self._user_id,  # CRITICAL: User isolation
+            )
+            .values(**values)
+        )
@@ -4,7 +4,7 @@
 # Repository for message persistence with user isolation.
 
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Tuple
 
 from sqlmodel import Session, select
 
@@ -82,6 +82,48 @@ class MessageRepository:
         )
         return list(self._session.exec(statement).all())
 
+    def get_recent(
+        self,
+        conversation_id: int,
+        limit: Optional[int],
+        after_id: Optional[int] = None,
+    ) -> List[Tuple[int, str, str]]:
+        """
+        Get the last `limit` messages of a conversation, oldest first.
+
+        Used to hydrate the agent: the window is applied in SQL
+        (ORDER BY created_at DESC LIMIT n over the (conversation_id,
+        created_at) index) and only id, role and content are read, so
+        the cost stays constant however long the conversation grows
+        and the tool_calls JSON is never loaded.
+
+        SECURITY: Filters by user_id to prevent cross-user access.
+
+        Args:
+            conversation_id: Conversation ID to get messages for
+            limit: Maximum number of messages to return, None for all
+            after_id: Only return messages with a greater ID (e.g. the
+                last message already folded into the summary)
+
+        Returns:
+            (id, role, content) rows ordered by created_at ASC
+        """
+        statement = (
+            select(MessageDB.id, MessageDB.role, MessageDB.content)
+            .where(
+                MessageDB.conversation_id == conversation_id,
+                MessageDB.user_id == self._user_id,  # CRITICAL: User isolation
+            )
+            .order_by(MessageDB.created_at.desc(), MessageDB.id.desc())
+        )
+        if limit is not None:
+            statement = statement.limit(limit)
+        if after_id is not None:
+            statement = statement.where(MessageDB.id > after_id)
+
+        rows = self._session.exec(statement).all()
+        return [(row.id, row.role, row.content) for row in reversed(rows)]
+
     def get_latest(self, conversation_id: int) -> Optional[MessageDB]:
         """
         Get most recent message in conversation.
@@ -0,0 +1,67 @@
+# Request-scoped Unit of Work
+# Spec: agent.spec.md Section 4.5
+#
+# One session (one pooled connection, one transaction) shared by a chat
+# turn and every MCP tool call it makes. The caller commits once.
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Generator, TypeVar
+
+from sqlmodel import Session
+
+T = TypeVar("T")
+
+
+class UnitOfWork:
+    """
+    Shares a chat request's session with the tools it invokes.
+
+    Nothing here commits: writes are flushed into the request's
+    transaction and the owner of the session (the chat router)
+    commits once at the end of the turn, so the turn is atomic.
+
+    A Session is not thread-safe, while blocking database work runs
+    in worker threads and tool calls may run concurrently. All work on
+    the session therefore goes through `locked()` / `run()`, which
+    serialize it.
+    """
+
+    def __init__(self, session: Session):
+        """
+        Initialize the unit of work.
+
+        Args:
+            session: Request-scoped SQLModel session (committed by the caller)
+        """
+        self.session = session
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self) -> Generator[Session, None, None]:
+        """
+        Hold exclusive use of the session (blocking; call from a worker thread).
+
+        Yields:
+            The shared session
+        """
+        with self._lock:
+            yield self.session
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run blocking session work in a worker thread, holding the lock.
+
+        Args:
+            fn: Function using the session
+            *args: Positional arguments for fn
+
+        Returns:
+            fn's return value
+        """
+        def call() -> T:
+            with self._lock:
+                return fn(*args)
+
+        return await asyncio.to_thread(call)
@@ -0,0 +1,93 @@
+"""
+Benchmark: per-turn request preparation overhead of AgentExecutor
+
+Measures what a two-round chat turn (tool round + reply round) spends
+building Gemini requests before any network I/O, and how many prompt
+tokens each call carries. Compares the executor's precomputed configs
+against rebuilding GenerateContentConfig / Tool / ToolConfig per round
+with the system prompt also sent as a message (the previous behaviour).
+
+No model or database is used.
+
+Usage:
+    python phase3/backend/scripts/bench_agent_overhead.py --turns 20000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PHASE2_BACKEND = REPO_ROOT / "phase2" / "backend"
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'bench_agent_overhead.db'}",
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "bench-agent-overhead-secret-00000")
+os.environ.setdefault("GEMINI_API_KEY", "unused")
+sys.path.insert(0, str(PHASE2_BACKEND))
+sys.path.insert(0, str(REPO_ROOT))
+
+from google.genai import types  # noqa: E402
+
+from phase3.backend.agent.config import AGENT_CONFIG, SYSTEM_PROMPT  # noqa: E402
+from phase3.backend.agent.executor import (  # noqa: E402
+    GEMINI_TOOLS,
+    _estimate_request_tokens,
+    _generation_config,
+    _to_contents,
+)
+
+HISTORY = [
+    {
+        "role": "user" if i % 2 == 0 else "assistant",
+        "content": f"Message number {i} about my tasks.",
+    }
+    for i in range(10)
+]
+
+
+def rebuilt_config(round_index: int) -> types.GenerateContentConfig:
+    """Config as previously built on every round of every request"""
+    return types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT,
+        temperature=AGENT_CONFIG.get("temperature", 0.5),
+        max_output_tokens=AGENT_CONFIG.get("max_tokens", 512),
+        tools=[types.Tool(function_declarations=GEMINI_TOOLS)],
+        tool_config=types.ToolConfig(
+            function_calling_config=types.FunctionCallingConfig(
+                mode="any" if round_index == 0 else "auto"
+            )
+        ),
+    )
+
+
+def turn_before() -> int:
+    contents = _to_contents([{"role": "system", "content": SYSTEM_PROMPT}, *HISTORY])
+    return sum(_estimate_request_tokens(contents, rebuilt_config(i)) for i in range(2))
+
+
+def turn_after() -> int:
+    contents = _to_contents(HISTORY)
+    return sum(_estimate_request_tokens(contents, _generation_config(i)) for i in range(2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--turns", type=int, default=20000, help="Turns per measurement")
+    args = parser.parse_args()
+
+    print(f"{args.turns} turns, 2 model calls each, {len(HISTORY)} history messages\n")
+    print(f"{'':8} {'us/turn':>8} {'prompt tokens/call':>19}")
+    for name, turn in (("before", turn_before), ("after", turn_after)):
+        seconds = min(timeit.repeat(turn, number=args.turns, repeat=3))
+        tokens = turn() // 2 - AGENT_CONFIG.get("max_tokens", 512)
+        print(f"{name:8} {seconds / args.turns * 1e6:8.1f} {tokens:19d}")
+
+
+if __name__ == "__main__":
+    main()
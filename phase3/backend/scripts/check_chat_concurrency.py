@@ -0,0 +1,112 @@
+"""
+Check: concurrent chats do not serialize on the event loop
+
+Runs one chat turn through AgentExecutor, then N turns at once with
+asyncio.gather, all against a fake Gemini client with a fixed latency
+(one tool round + one reply round per turn). If the executor never
+blocks the loop, N chats finish in roughly the time of one; if any
+LLM call or database access blocks, wall time grows linearly with N.
+
+Exits non-zero when N concurrent chats take more than --max-ratio
+times as long as a single chat.
+
+Defaults to a throwaway SQLite database. SQLite allows one writer at
+a time, so its engine is switched to autocommit to keep the check
+about the event loop rather than database locks; against PostgreSQL
+(DATABASE_URL=postgresql://...) the engine is used as configured.
+
+Each chat turn (tool calls included) holds one pooled connection
+until it commits, so keep --chats at or below DB_POOL_SIZE + 10 (the
+pool's overflow) or raise DB_POOL_SIZE.
+
+Usage:
+    python phase3/backend/scripts/check_chat_concurrency.py --chats 10 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PHASE2_BACKEND = REPO_ROOT / "phase2" / "backend"
+
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite:///{Path(tempfile.gettempdir()) / 'check_chat_concurrency.db'}",
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "check-chat-concurrency-secret-0000")
+os.environ.setdefault("GEMINI_API_KEY", "unused")
+# The fake client is not rate limited; keep the limiter out of the measurement
+os.environ.setdefault("GEMINI_RPM", "1000000")
+os.environ.setdefault("GEMINI_TPM", "1000000000")
+sys.path.insert(0, str(PHASE2_BACKEND))
+sys.path.insert(0, str(REPO_ROOT))
+
+from sqlmodel import Session  # noqa: E402
+
+from app.database import create_db_and_tables, engine  # noqa: E402
+from phase3.backend import models  # noqa: E402,F401  (registers chat tables)
+from phase3.backend.agent import executor as executor_module  # noqa: E402
+from phase3.backend.agent.executor import AgentExecutor  # noqa: E402
+from phase3.backend.agent.fake_client import FakeGenaiClient  # noqa: E402
+
+CHECK_USER_ID = "concurrency-check-user"
+
+
+async def chat_once(index: int) -> float:
+    """Run one chat turn in its own session; return its duration."""
+    started = time.perf_counter()
+    with Session(engine) as session:
+        executor = AgentExecutor(session=session, user_id=CHECK_USER_ID)
+        await executor.execute(message=f"Show my tasks ({index})")
+        session.commit()
+    return time.perf_counter() - started
+
+
+async def run(chats: int) -> float:
+    """Run `chats` turns concurrently; return total wall time."""
+    started = time.perf_counter()
+    await asyncio.gather(*(chat_once(i) for i in range(chats)))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--chats", type=int, default=10, help="Concurrent chats")
+    parser.add_argument("--latency", type=float, default=0.5, help="Fake LLM latency (s)")
+    parser.add_argument("--max-ratio", type=float, default=2.0,
+                        help="Allowed N-chat / 1-chat wall time ratio")
+    args = parser.parse_args()
+
+    if engine.dialect.name == "sqlite":
+        engine.update_execution_options(isolation_level="AUTOCOMMIT")
+    create_db_and_tables()
+
+    executor_module._client = FakeGenaiClient(
+        latency=args.latency,
+        reply="Here are your tasks.",
+        tool_call=("list_tasks", {"status": "all"}),
+    )
+
+    asyncio.run(run(1))  # Warm up connections and imports
+    single = asyncio.run(run(1))
+    concurrent = asyncio.run(run(args.chats))
+    ratio = concurrent / single
+
+    print(f"\nfake LLM latency={args.latency}s, 2 model calls per chat")
+    print(f"1 chat:          {single:6.2f}s")
+    print(f"{args.chats} chats at once: {concurrent:6.2f}s")
+    print(f"ratio:           {ratio:6.2f}x (limit {args.max_ratio:.1f}x)")
+
+    if ratio > args.max_ratio:
+        print("FAIL: concurrent chats are being serialized")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
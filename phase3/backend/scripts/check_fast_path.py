@@ -0,0 +1,90 @@
+"""
+Check: fast-path intent rules parse the messages they should, and only those
+
+Runs every message below through the default IntentRouter
+(agent/fast_path.py) and compares the tool arguments it would call with
+the expected ones; None means the message must fall through to the
+model. A fast-path match calls the tool with no model check, so a
+mis-parsed message writes a wrong task: add a case here with every
+rule change.
+
+Exits non-zero if any message is parsed differently.
+
+Usage:
+    python phase3/backend/scripts/check_fast_path.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PHASE2_BACKEND = REPO_ROOT / "phase2" / "backend"
+
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{Path(tempfile.gettempdir()) / 'check_fast_path.db'}"
+)
+os.environ.setdefault("BETTER_AUTH_SECRET", "check-fast-path-secret-000000000000")
+os.environ.setdefault("GEMINI_API_KEY", "unused")
+sys.path.insert(0, str(PHASE2_BACKEND))
+sys.path.insert(0, str(REPO_ROOT))
+
+from phase3.backend.agent.fast_path import IntentRouter  # noqa: E402
+
+# (message, expected (tool, arguments) or None for the model)
+CASES: List[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]] = [
+    # add
+    ("add buy milk", ("add_task", {"title": "buy milk"})),
+    ("add a task to call mom", ("add_task", {"title": "call mom"})),
+    ("please add task buy bread.", ("add_task", {"title": "buy bread"})),
+    ("add task: pay rent", ("add_task", {"title": "pay rent"})),
+    ("create todo: buy eggs", ("add_task", {"title": "buy eggs"})),
+    ("create a new task: Email Bob", ("add_task", {"title": "Email Bob"})),
+    ("add a new todo to water plants", ("add_task", {"title": "water plants"})),
+    ("Add taskforce meeting", ("add_task", {"title": "taskforce meeting"})),
+    ("add 5 apples", ("add_task", {"title": "5 apples"})),
+    ("add my dentist appointment", ("add_task", {"title": "my dentist appointment"})),
+    ("add task", None),
+    ("add todos", None),
+    ("Add tasks for tomorrow", None),
+    ("add my tasks to calendar", None),
+    ("add all todos to my calendar", None),
+    ("add 5", None),
+    ("add #12", None),
+    ("add it", None),
+    ("create that", None),
+    ("add milk and eggs", None),
+    # complete / delete
+    ("complete 12", ("complete_task", {"task_id": 12})),
+    ("mark task #5 as done", ("complete_task", {"task_id": 5})),
+    ("delete task 4", ("delete_task", {"task_id": 4})),
+    ("remove #7", ("delete_task", {"task_id": 7})),
+    ("delete everything", None),
+    # list
+    ("show pending", ("list_tasks", {"status": "pending"})),
+    ("show me my tasks", ("list_tasks", {"status": "all"})),
+    ("list", ("list_tasks", {"status": "all"})),
+    ("what are my tasks?", None),
+]
+
+
+def main() -> None:
+    router = IntentRouter()
+    failures = []
+    for message, expected in CASES:
+        match = router.match(message)
+        got = (match.tool, match.arguments) if match else None
+        if got != expected:
+            failures.append(f"{message!r}: expected {expected}, got {got}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"OK: {len(CASES)} messages")
+
+
+if __name__ == "__main__":
+    main()
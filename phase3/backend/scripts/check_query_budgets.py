@@ -0,0 +1,225 @@
+"""
+Check: SQL statements per route and MCP tool stay within budget
+
+Drives every Phase II task/user route, the async task routes
+(ASYNC_DATABASE=true, reported as "async: ..."), the Phase III chat
+routes (fake Gemini client) and every MCP tool once or a few times,
+counts the SQL
+statements each one runs (app/query_budget.py) and compares the
+highest count with the budget registered for it. Also reports any
+statement repeated --repeat-threshold times within one call, the
+shape of an N+1 loop.
+
+Exits non-zero when a route or tool is over budget, repeats a
+statement, or has no budget at all. After a change that adds round
+trips on purpose, raise the budget where it is set (app/query_budget.py,
+api/router.py or mcp_tools/tools/__init__.py).
+
+Defaults to a throwaway SQLite database; point DATABASE_URL at
+PostgreSQL to count against the production dialect.
+
+Usage:
+    python phase3/backend/scripts/check_query_budgets.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PHASE2_BACKEND = REPO_ROOT / "phase2" / "backend"
+
+_default_db = Path(tempfile.gettempdir()) / "check_query_budgets.db"
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_default_db}")
+os.environ.setdefault("BETTER_AUTH_SECRET", "check-query-budgets-secret-000000")
+os.environ.setdefault("GEMINI_API_KEY", "unused")
+os.environ.setdefault("QUERY_BUDGET_MODE", "off")  # Counted here, not by the middleware
+sys.path.insert(0, str(PHASE2_BACKEND))
+sys.path.insert(0, str(REPO_ROOT))
+
+import jwt  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import engine, get_async_engine  # noqa: E402
+from app.presentation.routers import tasks_async  # noqa: E402
+from app.query_budget import QueryLog, budgets, count_queries, watch_engine  # noqa: E402
+from phase3.backend.agent import executor as executor_module  # noqa: E402
+from phase3.backend.agent.fake_client import FakeGenaiClient  # noqa: E402
+from phase3.backend.api.main import app  # noqa: E402
+from phase3.backend.mcp_tools import tools  # noqa: E402
+
+CHECK_USER_ID = "query-budget-check-user"
+ASYNC_PREFIX = "async: "  # Same budgets as the sync routes
+
+
+class Recorder:
+    """Highest statement count and any repeats seen per route or tool"""
+
+    def __init__(self, repeat_threshold: int):
+        self.repeat_threshold = repeat_threshold
+        self.counts: Dict[str, int] = {}
+        self.repeats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, name: str, log: QueryLog) -> None:
+        self.counts[name] = max(self.counts.get(name, 0), log.count)
+        repeated = log.repeated(self.repeat_threshold)
+        if repeated:
+            self.repeats.setdefault(name, {}).update(repeated)
+
+    def request(self, client: TestClient, name: str, method: str, url: str, **kwargs):
+        """Send one request and record its statements under `name`."""
+        with count_queries() as log:
+            response = client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise RuntimeError(f"{name}: HTTP {response.status_code} {response.text[:200]}")
+        self.record(name, log)
+        return response
+
+    def call(self, name: str, tool: Callable, **arguments) -> dict:
+        """Run one MCP tool standalone and record its statements."""
+        with count_queries() as log:
+            result = asyncio.run(tool(user_id=CHECK_USER_ID, **arguments))
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"{name}: {result}")
+        self.record(name, log)
+        return result
+
+
+def exercise_routes(recorder: Recorder, client: TestClient) -> None:
+    request = _requester(recorder, client)
+    base = f"/api/{CHECK_USER_ID}"
+
+    request("GET", "/api/{user_id}/me", f"{base}/me")
+    request("GET", "/api/health/protected", "/api/health/protected")
+    exercise_task_routes(request)
+
+    # Chat: model turns with one tool round, a fast-path turn and a
+    # response cache hit, in a new and in a continued conversation
+    chat = f"{base}/chat"
+    first = request("POST", "/api/{user_id}/chat", chat, json={"message": "what are my tasks?"})
+    conversation = {"conversation_id": first.json()["conversation_id"]}
+    request("POST", "/api/{user_id}/chat", chat,
+            json={"message": "what are my tasks?", **conversation})
+    request("POST", "/api/{user_id}/chat", chat, json={"message": "add buy milk", **conversation})
+    request("POST", "/api/{user_id}/chat", chat, json={"message": "plan my week", **conversation})
+    request("POST", "/api/{user_id}/chat/stream", f"{chat}/stream",
+            json={"message": "plan my day", **conversation})
+
+
+def exercise_async_routes(recorder: Recorder) -> None:
+    """The task routes as served with ASYNC_DATABASE=true"""
+    watch_engine(get_async_engine().sync_engine)
+    app = FastAPI()
+    app.include_router(tasks_async.router)
+    with TestClient(app) as client:
+        exercise_task_routes(_requester(recorder, client, ASYNC_PREFIX))
+
+
+def exercise_task_routes(request: Callable) -> None:
+    base = f"/api/{CHECK_USER_ID}"
+    created = [
+        request("POST", "/api/{user_id}/tasks", f"{base}/tasks", json={"title": f"Task {i}"}).json()
+        for i in range(3)
+    ]
+    task_url = f"{base}/tasks/{created[0]['id']}"
+    for _ in range(2):  # Cache miss, then hit
+        request("GET", "/api/{user_id}/tasks", f"{base}/tasks")
+    request("GET", "/api/{user_id}/tasks/{task_id}", task_url)
+    request("PUT", "/api/{user_id}/tasks/{task_id}", task_url, json={"title": "Renamed"})
+    request("PATCH", "/api/{user_id}/tasks/{task_id}/complete", f"{task_url}/complete")
+    request("PATCH", "/api/{user_id}/tasks/{task_id}/uncomplete", f"{task_url}/uncomplete")
+    request("POST", "/api/{user_id}/tasks:batch", f"{base}/tasks:batch", json={"operations": [
+        {"op": "create", "title": "Batch 1"},
+        {"op": "create", "title": "Batch 2"},
+        {"op": "complete", "task_id": created[1]["id"]},
+        {"op": "delete", "task_id": created[2]["id"]},
+    ]})
+    request("DELETE", "/api/{user_id}/tasks/{task_id}", task_url)
+
+
+def _requester(recorder: Recorder, client: TestClient, prefix: str = "") -> Callable:
+    """request(method, template, url, **kwargs), authenticated and recorded"""
+    headers = {"Authorization": f"Bearer {_token()}"}
+
+    def request(method: str, template: str, url: str, **kwargs):
+        name = f"{prefix}{method} {template}"
+        return recorder.request(client, name, method, url, headers=headers, **kwargs)
+
+    return request
+
+
+def exercise_tools(recorder: Recorder) -> None:
+    added = recorder.call("mcp:add_task", tools.add_task, title="Tool task")
+    task_id = added["task_id"]
+    recorder.call("mcp:list_tasks", tools.list_tasks)
+    recorder.call("mcp:list_tasks", tools.list_tasks, status="pending")
+    recorder.call("mcp:task_list_version", tools.task_list_version)
+    recorder.call("mcp:update_task", tools.update_task, task_id=task_id, title="Tool task 2")
+    recorder.call("mcp:complete_task", tools.complete_task, task_id=task_id)
+    recorder.call("mcp:delete_task", tools.delete_task, task_id=task_id)
+
+
+def _token() -> str:
+    settings = get_settings()
+    return jwt.encode(
+        {"sub": CHECK_USER_ID, "exp": int(time.time()) + 3600},
+        settings.better_auth_secret,
+        algorithm=settings.jwt_algorithm,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat-threshold", type=int, default=3,
+                        help="Runs of one statement within a call that fail the check")
+    args = parser.parse_args()
+
+    if engine.url.get_backend_name() == "sqlite" and _default_db.exists():
+        _default_db.unlink()
+    watch_engine(engine)
+    executor_module._client = FakeGenaiClient(
+        latency=0.0,
+        reply="Here you go.",
+        tool_call=("list_tasks", {"status": "all"}),
+    )
+
+    recorder = Recorder(args.repeat_threshold)
+    with TestClient(app) as client:
+        exercise_routes(recorder, client)
+    exercise_async_routes(recorder)
+    exercise_tools(recorder)
+
+    limits = budgets()
+    failures: List[str] = []
+    print(f"\n{'route / tool':<56} {'statements':>10} {'budget':>7}")
+    for name, count in sorted(recorder.counts.items()):
+        budget = limits.get(name.removeprefix(ASYNC_PREFIX))
+        flag = ""
+        if budget is None:
+            flag = "  NO BUDGET"
+        elif count > budget:
+            flag = "  OVER"
+        if flag:
+            failures.append(name)
+        print(f"{name:<56} {count:>10} {'-' if budget is None else budget:>7}{flag}")
+
+    for name, repeated in recorder.repeats.items():
+        failures.append(name)
+        for statement, runs in repeated.items():
+            print(f"\nREPEATED {runs}x in {name}: {' '.join(statement.split())[:160]}")
+
+    if failures:
+        print(f"\nFAIL: {len(set(failures))} over budget, unbudgeted or repeating")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,360 @@
+"""
+Load test: chat and task endpoints of the combined Phase II + III app
+
+Serves phase3/backend/api/main.py with uvicorn on a local port, with
+Gemini replaced by FakeGenaiClient (fixed latency, scripted function
+calls), and drives concurrent virtual users through a weighted mix of
+requests over real HTTP:
+
+    chat      POST /api/{user_id}/chat, answered by the (fake) model
+    tools     POST /api/{user_id}/chat, scripted as two tool rounds
+    fast      POST /api/{user_id}/chat, handled by the fast path
+    list      GET  /api/{user_id}/tasks
+    create    POST /api/{user_id}/tasks
+    complete  PATCH /api/{user_id}/tasks/{task_id}/complete
+
+Reports per request type p50/p95/p99 latency and errors, overall
+requests per second, pooled DB connections in use (sampled), model
+calls, and event-loop lag of the server loop (how late a 50ms timer
+fires). Run it before and after changes to AgentExecutor, the tools or
+the routers and compare.
+
+Defaults to a throwaway SQLite database, whose engine is switched to
+autocommit so concurrent writers do not fail on its single write lock.
+Point DATABASE_URL at PostgreSQL for numbers closer to production. The
+model rate limit is lifted (GEMINI_RPM/GEMINI_TPM) unless already set.
+
+Usage:
+    python phase3/backend/scripts/load_test_chat.py --users 20 --duration 20 --latency 0.5
+    python phase3/backend/scripts/load_test_chat.py --mix chat=1,list=1 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PHASE2_BACKEND = REPO_ROOT / "phase2" / "backend"
+SQLITE_PATH = Path(tempfile.gettempdir()) / "load_test_chat.db"
+AUTH_SECRET = os.environ.setdefault("BETTER_AUTH_SECRET", "load-test-chat-secret-000000000000")
+
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{SQLITE_PATH}")
+os.environ.setdefault("GEMINI_API_KEY", "unused")
+os.environ.setdefault("GEMINI_RPM", "1000000")
+os.environ.setdefault("GEMINI_TPM", "1000000000")
+sys.path.insert(0, str(PHASE2_BACKEND))
+sys.path.insert(0, str(REPO_ROOT))
+
+if os.environ["DATABASE_URL"] == f"sqlite:///{SQLITE_PATH}" and SQLITE_PATH.exists():
+    SQLITE_PATH.unlink()
+
+import httpx  # noqa: E402
+import jwt  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from phase3.backend.agent import executor as executor_module  # noqa: E402
+from phase3.backend.agent.fake_client import FakeGenaiClient  # noqa: E402
+from phase3.backend.api.main import app  # noqa: E402
+
+DEFAULT_MIX = "chat=3,tools=1,fast=1,list=4,create=2,complete=1"
+
+# Message markers the fake model recognizes; every turn gets a unique
+# suffix so no reply comes from the response cache
+SCRIPTS = {
+    "[plan]": [[("list_tasks", {"status": "pending"})]],
+    "[tidy]": [
+        [("list_tasks", {"status": "all"})],
+        [("add_task", {"title": "Load test follow-up"}), ("list_tasks", {"status": "pending"})],
+    ],
+}
+
+
+class LagMonitor:
+    """Measures how late a periodic timer fires on the loop it runs on"""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.samples: List[float] = []
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(loop.time() - expected, 0.0))
+
+
+class PoolMonitor(threading.Thread):
+    """Samples checked-out connections of the app's engine pool"""
+
+    def __init__(self, interval: float = 0.01):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.samples: List[int] = []
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            checkedout = getattr(engine.pool, "checkedout", None)
+            if checkedout is not None:
+                self.samples.append(checkedout())
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class ServerThread(threading.Thread):
+    """Runs uvicorn on its own event loop, with a LagMonitor on that loop"""
+
+    def __init__(self, lag: LagMonitor):
+        super().__init__(daemon=True)
+        self.lag = lag
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning", lifespan="on")
+        )
+
+    def run(self) -> None:
+        async def serve() -> None:
+            monitor = asyncio.create_task(self.lag.run())
+            await self.server.serve()
+            monitor.cancel()
+
+        asyncio.run(serve())
+
+    @property
+    def base_url(self) -> str:
+        while not self.server.started:
+            time.sleep(0.05)
+        host, port = self.server.servers[0].sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.join()
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """'chat=3,list=1' -> {'chat': 3.0, 'list': 1.0}"""
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name.strip() not in ACTIONS:
+            raise SystemExit(f"Unknown request type '{name}' (choose from {', '.join(ACTIONS)})")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of samples (0 if empty)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+class VirtualUser:
+    """One authenticated user with its own conversation and tasks"""
+
+    def __init__(self, index: int, client: httpx.AsyncClient):
+        self.user_id = f"load-user-{index}"
+        self.client = client
+        self.conversation_id: Optional[int] = None
+        self.task_ids: List[int] = []
+        self.turn = 0
+        token = jwt.encode(
+            {"sub": self.user_id, "exp": int(time.time()) + 3600}, AUTH_SECRET, algorithm="HS256"
+        )
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+    async def _chat(self, message: str) -> httpx.Response:
+        self.turn += 1
+        response = await self.client.post(
+            f"/api/{self.user_id}/chat",
+            json={"message": message, "conversation_id": self.conversation_id},
+            headers=self.headers,
+        )
+        if response.status_code == 200:
+            self.conversation_id = response.json()["conversation_id"]
+        return response
+
+    async def chat(self) -> httpx.Response:
+        return await self._chat(f"[plan] What should I focus on today? (turn {self.turn})")
+
+    async def tools(self) -> httpx.Response:
+        return await self._chat(f"[tidy] Clean up my list please (turn {self.turn})")
+
+    async def fast(self) -> httpx.Response:
+        return await self._chat(f"add load test chore {self.turn}")
+
+    async def list(self) -> httpx.Response:
+        return await self.client.get(f"/api/{self.user_id}/tasks", headers=self.headers)
+
+    async def create(self) -> httpx.Response:
+        response = await self.client.post(
+            f"/api/{self.user_id}/tasks",
+            json={"title": f"Load test task {len(self.task_ids)}"},
+            headers=self.headers,
+        )
+        if response.status_code == 201:
+            self.task_ids.append(response.json()["id"])
+        return response
+
+    async def complete(self) -> httpx.Response:
+        if not self.task_ids:
+            return await self.create()
+        task_id = self.task_ids.pop(0)
+        return await self.client.patch(
+            f"/api/{self.user_id}/tasks/{task_id}/complete", headers=self.headers
+        )
+
+
+ACTIONS = ("chat", "tools", "fast", "list", "create", "complete")
+
+
+async def drive(
+    base_url: str, users: int, duration: float, weights: Dict[str, float], seed: int
+) -> Dict[str, Dict[str, list]]:
+    """Run every virtual user until `duration` elapses; collect latencies and errors"""
+    results: Dict[str, Dict[str, list]] = defaultdict(lambda: {"latencies": [], "errors": []})
+    names, cumulative = list(weights), list(weights.values())
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        timeout=60,
+        limits=httpx.Limits(max_connections=users, max_keepalive_connections=users),
+    ) as client:
+
+        async def run_user(index: int) -> None:
+            user = VirtualUser(index, client)
+            rng = random.Random(seed + index)
+            while time.perf_counter() < deadline:
+                action = rng.choices(names, cumulative)[0]
+                started = time.perf_counter()
+                try:
+                    response = await getattr(user, action)()
+                    failed = response.status_code >= 400 and str(response.status_code)
+                except httpx.HTTPError as e:
+                    failed = type(e).__name__
+                elapsed = time.perf_counter() - started
+                results[action]["latencies"].append(elapsed)
+                if failed:
+                    results[action]["errors"].append(failed)
+
+        await asyncio.gather(*(run_user(i) for i in range(users)))
+
+    return results
+
+
+def report(
+    results, wall: float, pool: PoolMonitor, lag: LagMonitor, model_calls: int, args
+) -> dict:
+    """Print the summary table and return it as a dict"""
+    summary = {"config": vars(args), "wall_seconds": round(wall, 2), "requests": {}}
+    total = 0
+
+    print(
+        f"\n{args.users} users, {wall:.1f}s, fake LLM latency {args.latency}s, "
+        f"db {engine.dialect.name}\n"
+    )
+    print(f"{'request':10} {'count':>7} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for action in ACTIONS:
+        if action not in results:
+            continue
+        latencies, errors = results[action]["latencies"], results[action]["errors"]
+        row = {
+            "count": len(latencies),
+            "errors": len(errors),
+            "error_kinds": sorted(set(errors)),
+            **{f"p{q}_ms": round(percentile(latencies, q) * 1000, 1) for q in (50, 95, 99)},
+        }
+        summary["requests"][action] = row
+        total += len(latencies)
+        print(
+            f"{action:10} {row['count']:7d} {row['errors']:7d} "
+            f"{row['p50_ms']:8.1f} {row['p95_ms']:8.1f} {row['p99_ms']:8.1f}"
+        )
+
+    pool_limit = None
+    if hasattr(engine.pool, "size"):
+        pool_limit = engine.pool.size() + getattr(engine.pool, "_max_overflow", 0)
+    summary.update(
+        rps=round(total / wall, 1),
+        model_calls=model_calls,
+        db_connections={
+            "max": max(pool.samples, default=0),
+            "mean": round(sum(pool.samples) / len(pool.samples), 1) if pool.samples else 0.0,
+            "limit": pool_limit,
+        },
+        loop_lag_ms={
+            "p50": round(percentile(lag.samples, 50) * 1000, 1),
+            "p99": round(percentile(lag.samples, 99) * 1000, 1),
+            "max": round(max(lag.samples, default=0.0) * 1000, 1),
+        },
+    )
+
+    db = summary["db_connections"]
+    lag_ms = summary["loop_lag_ms"]
+    print(f"\nthroughput:      {summary['rps']} req/s ({total} requests)")
+    print(f"model calls:     {model_calls}")
+    print(f"db connections:  max {db['max']} / limit {db['limit']}, mean {db['mean']}")
+    print(f"event-loop lag:  p50 {lag_ms['p50']}ms, p99 {lag_ms['p99']}ms, max {lag_ms['max']}ms")
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds to run")
+    parser.add_argument("--latency", type=float, default=0.5, help="Fake LLM latency (s)")
+    parser.add_argument(
+        "--mix", default=DEFAULT_MIX, help=f"Request weights (default {DEFAULT_MIX})"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the request mix")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args()
+    weights = parse_mix(args.mix)
+
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if engine.dialect.name == "sqlite":
+        engine.update_execution_options(isolation_level="AUTOCOMMIT")
+
+    fake = FakeGenaiClient(latency=args.latency, reply="Here is what I found.", scripts=SCRIPTS)
+    executor_module._client = fake
+
+    lag, pool = LagMonitor(), PoolMonitor()
+    server = ServerThread(lag)
+    server.start()
+    base_url = server.base_url
+    lag.samples.clear()  # Startup is not under load
+    pool.start()
+
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(drive(base_url, args.users, args.duration, weights, args.seed))
+    finally:
+        wall = time.perf_counter() - started
+        pool.stop()
+        server.stop()
+
+    summary = report(results, wall, pool, lag, fake.calls, args)
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2, default=str))
+        print(f"\nwrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
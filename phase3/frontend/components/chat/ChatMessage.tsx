@@ -93,7 +93,8 @@ export function ChatMessage({ message }: ChatMessageProps) {
             : "bg-neutral-100 dark:bg-neutral-800 text-neutral-900 dark:text-neutral-100 rounded-bl-md"
         }`}
       >
-        {message.isLoading ? (
+        {/* Dots until the first streamed text or tool call arrives */}
+        {message.isLoading && !message.content && !message.toolCalls?.length ? (
           <LoadingDots />
         ) : (
           <>
@@ -10,8 +10,8 @@
  */
 
 import { useState, useCallback } from "react";
-import type { ChatMessage, ChatState } from "../lib/types";
-import { sendChatMessage, ChatError } from "../lib/chat-service";
+import type { ChatMessage, ChatState, ToolCall } from "../lib/types";
+import { streamChatMessage, ChatError } from "../lib/chat-service";
 
 // Generate unique message ID
 function generateId(): string {
@@ -84,32 +84,67 @@ export function useChat(userId: string | null, getToken: () => Promise<string |
         error: null,
       }));
 
+      // Update the streaming assistant message in place
+      const updateLoading = (update: (m: ChatMessage) => ChatMessage) =>
+        setState((prev) => ({
+          ...prev,
+          messages: prev.messages.map((m) =>
+            m.id === loadingMessage.id ? update(m) : m
+          ),
+        }));
+
       try {
-        // Send to API
-        const response = await sendChatMessage(
+        // Stream from API: text and tool calls appear as they arrive
+        let streamError: string | null = null;
+
+        await streamChatMessage(
           userId,
           {
             conversation_id: state.conversationId,
             message: content.trim(),
           },
-          token
+          token,
+          (event) => {
+            switch (event.type) {
+              case "conversation":
+                setState((prev) => ({
+                  ...prev,
+                  conversationId: event.data.conversation_id,
+                }));
+                break;
+              case "token":
+                updateLoading((m) => ({
+                  ...m,
+                  content: m.content + event.data.text,
+                }));
+                break;
+              case "tool_call":
+                updateLoading((m) => ({
+                  ...m,
+                  toolCalls: [...(m.toolCalls ?? []), event.data as ToolCall],
+                }));
+                break;
+              case "done":
+                updateLoading((m) => ({
+                  ...m,
+                  content: event.data.response,
+                  toolCalls: event.data.tool_calls,
+                  isLoading: false,
+                }));
+                break;
+              case "error":
+                streamError = event.data.message;
+                break;
+            }
+          }
         );
 
-        // Replace loading message with actual response
-        const assistantMessage: ChatMessage = {
-          id: generateId(),
-          role: "assistant",
-          content: response.response,
-          toolCalls: response.tool_calls,
-          timestamp: new Date(),
-        };
+        if (streamError) {
+          throw new ChatError(503, streamError);
+        }
 
         setState((prev) => ({
           ...prev,
-          messages: prev.messages
-            .filter((m) => !m.isLoading)
-            .concat(assistantMessage),
-          conversationId: response.conversation_id,
           isLoading: false,
           error: null,
         }));
@@ -17,8 +17,9 @@ export type {
   ChatRequest,
   ChatResponse,
   ChatState,
+  ChatStreamEvent,
   ToolCall,
 } from "./lib/types";
 
 // Services
-export { sendChatMessage, ChatError } from "./lib/chat-service";
+export { sendChatMessage, streamChatMessage, ChatError } from "./lib/chat-service";
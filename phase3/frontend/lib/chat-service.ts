@@ -5,7 +5,7 @@
  * Reuses Phase II auth (getToken) and API patterns.
  */
 
-import type { ChatRequest, ChatResponse } from "./types";
+import type { ChatRequest, ChatResponse, ChatStreamEvent } from "./types";
 
 // Use same API URL as Phase II
 const API_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
@@ -23,6 +23,32 @@ export class ChatError extends Error {
   }
 }
 
+/**
+ * Convert a non-OK chat response into a ChatError.
+ */
+async function toChatError(response: Response): Promise<ChatError> {
+  if (response.status === 401) {
+    return new ChatError(401, "Please log in to use the chat.");
+  }
+  if (response.status === 403) {
+    return new ChatError(403, "Access denied.");
+  }
+  if (response.status === 503) {
+    return new ChatError(503, "AI assistant is temporarily unavailable.");
+  }
+
+  // Try to get error message from response
+  try {
+    const errorData = await response.json();
+    return new ChatError(
+      response.status,
+      errorData.detail || "Failed to send message."
+    );
+  } catch {
+    return new ChatError(response.status, "Failed to send message.");
+  }
+}
+
 /**
  * Send a chat message to the AI assistant.
  *
@@ -48,27 +74,66 @@ export async function sendChatMessage(
 
   // Handle errors
   if (!response.ok) {
-    if (response.status === 401) {
-      throw new ChatError(401, "Please log in to use the chat.");
-    }
-    if (response.status === 403) {
-      throw new ChatError(403, "Access denied.");
-    }
-    if (response.status === 503) {
-      throw new ChatError(503, "AI assistant is temporarily unavailable.");
-    }
-
-    // Try to get error message from response
-    try {
-      const errorData = await response.json();
-      throw new ChatError(
-        response.status,
-        errorData.detail || "Failed to send message."
-      );
-    } catch {
-      throw new ChatError(response.status, "Failed to send message.");
-    }
+    throw await toChatError(response);
   }
 
   return response.json();
 }
+
+/**
+ * Send a chat message and stream the reply as it is generated.
+ *
+ * @param userId - Authenticated user ID
+ * @param request - Chat request with message and optional conversation_id
+ * @param token - JWT token for authentication
+ * @param onEvent - Called for each event (conversation, token, tool_call, done, error)
+ * @throws ChatError on API errors (before the stream starts)
+ */
+export async function streamChatMessage(
+  userId: string,
+  request: ChatRequest,
+  token: string,
+  onEvent: (event: ChatStreamEvent) => void
+): Promise<void> {
+  const response = await fetch(`${API_URL}/api/${userId}/chat/stream`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      Accept: "text/event-stream",
+      Authorization: `Bearer ${token}`,
+    },
+    body: JSON.stringify(request),
+  });
+
+  if (!response.ok || !response.body) {
+    throw await toChatError(response);
+  }
+
+  // Parse Server-Sent Events frames ("event: x\ndata: {...}\n\n")
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary = buffer.indexOf("\n\n");
+    while (boundary !== -1) {
+      const frame = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      boundary = buffer.indexOf("\n\n");
+
+      let type = "message";
+      let data = "";
+      for (const line of frame.split("\n")) {
+        if (line.startsWith("event:")) type = line.slice(6).trim();
+        else if (line.startsWith("data:")) data += line.slice(5).trim();
+      }
+      if (data) {
+        onEvent({ type, data: JSON.parse(data) } as ChatStreamEvent);
+      }
+    }
+  }
+}
@@ -32,6 +32,16 @@ export interface ChatResponse {
   tool_calls: ToolCall[];
 }
 
+/**
+ * Event from the streaming chat endpoint (POST /api/{user_id}/chat/stream).
+ */
+export type ChatStreamEvent =
+  | { type: "conversation"; data: { conversation_id: number } }
+  | { type: "token"; data: { text: string } }
+  | { type: "tool_call"; data: ToolCall }
+  | { type: "done"; data: ChatResponse }
+  | { type: "error"; data: { conversation_id: number; message: string } };
+
 /**
  * Message in the chat UI.
  */